@@ -1,5 +1,21 @@
 #!/usr/bin/env python3
-"""Convert cProfile .prof files to speedscope JSON format."""
+"""
+Convert cProfile .prof files to speedscope JSON format.
+
+Дерево вызовов восстанавливается по рёбрам caller -> callee из pstats
+(``app.infrastructure.observability.speedscope``), а не из «стеков» прямых
+вызывающих: время каждой ветви считается один раз.
+
+Examples:
+    # Один профиль
+    python scripts/prof_to_speedscope.py profiles/20260101_GET_v1_search.prof
+
+    # Все профили директории, слитые в один
+    python scripts/prof_to_speedscope.py profiles/ -o search.speedscope.json
+
+    # Сравнение до/после: профили "before" и "after" в одном файле
+    python scripts/prof_to_speedscope.py --diff before/ after/
+"""
 from __future__ import annotations
 
 import argparse
@@ -7,94 +23,194 @@ import json
 import pstats
 import sys
 from pathlib import Path
-from typing import Any
-
-
-def convert_prof_to_speedscope(prof_path: str) -> dict[str, Any]:
-    """Convert a cProfile .prof file to speedscope JSON format."""
-    stats = pstats.Stats(prof_path)
-    
-    # Build frame list and index mapping
-    frames: list[dict[str, str]] = []
-    frame_index: dict[str, int] = {}
-    
-    for (filename, line, func), (cc, nc, tt, ct, callers) in stats.stats.items():
-        frame_name = f"{func} ({Path(filename).name}:{line})"
-        if frame_name not in frame_index:
-            frame_index[frame_name] = len(frames)
-            frames.append({
-                "name": func,
-                "file": filename,
-                "line": line,
-            })
-    
-    # Build samples from stats
-    samples: list[list[int]] = []
-    weights: list[float] = []
-    
-    for (filename, line, func), (cc, nc, tt, ct, callers) in stats.stats.items():
-        frame_name = f"{func} ({Path(filename).name}:{line})"
-        idx = frame_index[frame_name]
-        
-        # Build stack from callers
-        stack = [idx]
-        for caller_key in callers:
-            caller_filename, caller_line, caller_func = caller_key
-            caller_name = f"{caller_func} ({Path(caller_filename).name}:{caller_line})"
-            if caller_name in frame_index:
-                stack.append(frame_index[caller_name])
-        
-        samples.append(stack[::-1])  # Reverse for proper order
-        weights.append(ct * 1_000_000)  # Convert to microseconds
-    
-    # Build speedscope JSON structure
-    speedscope_data = {
-        "$schema": "https://www.speedscope.app/file-format-schema.json",
-        "version": "0.0.1",
-        "shared": {
-            "frames": frames
-        },
-        "profiles": [
-            {
-                "type": "sampled",
-                "name": Path(prof_path).stem,
-                "unit": "microseconds",
-                "startValue": 0,
-                "endValue": sum(weights),
-                "samples": samples,
-                "weights": weights,
-            }
-        ],
-    }
-    
-    return speedscope_data
+from typing import TYPE_CHECKING
+
+
+# The script runs without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.infrastructure.observability.speedscope import ProfileKind
+from app.infrastructure.observability.speedscope import WeightedStacks
+from app.infrastructure.observability.speedscope import call_tree_stacks
+from app.infrastructure.observability.speedscope import collapsed_diff
+from app.infrastructure.observability.speedscope import collapsed_stacks
+from app.infrastructure.observability.speedscope import frame_name
+from app.infrastructure.observability.speedscope import merge_stacks
+from app.infrastructure.observability.speedscope import self_times
+from app.infrastructure.observability.speedscope import speedscope_document
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def expand_inputs(inputs: Sequence[str]) -> list[Path]:
+    """Profile files of the inputs; directories contribute their *.prof."""
+    paths: list[Path] = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            paths.extend(sorted(path.glob("*.prof")))
+        elif path.exists():
+            paths.append(path)
+        else:
+            print(f"Error: {path} not found", file=sys.stderr)
+            sys.exit(1)
+    if not paths:
+        listed = ", ".join(inputs)
+        print(f"Error: no .prof files in {listed}", file=sys.stderr)
+        sys.exit(1)
+    return paths
+
+
+def load_stacks(path: Path) -> WeightedStacks:
+    """Weighted call stacks of one .prof file."""
+    stats = pstats.Stats(str(path))
+    return call_tree_stacks(stats.stats)  # type: ignore[attr-defined]
+
+
+def load_merged(inputs: Sequence[str]) -> WeightedStacks:
+    """Call stacks of all profiles of the inputs, summed."""
+    return merge_stacks(load_stacks(path) for path in expand_inputs(inputs))
+
+
+def default_output(inputs: Sequence[str], suffix: str) -> Path:
+    first = Path(inputs[0])
+    if first.is_dir():
+        return first.with_name(first.name + suffix)
+    return first.with_suffix(suffix)
+
+
+def print_diff_table(
+    before: WeightedStacks, after: WeightedStacks, top: int
+) -> None:
+    """Print functions whose own time changed the most."""
+    old = self_times(before)
+    new = self_times(after)
+    deltas = sorted(
+        old.keys() | new.keys(),
+        key=lambda key: abs(new.get(key, 0.0) - old.get(key, 0.0)),
+        reverse=True,
+    )
+    print(f"{'before, s':>12} {'after, s':>12} {'delta, s':>12}  function")
+    for key in deltas[:top]:
+        before_time = old.get(key, 0.0)
+        after_time = new.get(key, 0.0)
+        print(
+            f"{before_time:12.6f} {after_time:12.6f} "
+            f"{after_time - before_time:+12.6f}  {frame_name(key)}"
+        )
+
+
+def write_output(path: Path, content: str) -> None:
+    path.write_text(content, encoding="utf-8")
+    print(f"Written: {path}")
+    if path.suffix == ".json":
+        print(f"Open https://www.speedscope.app/ and load {path}")
+
+
+def convert(args: argparse.Namespace) -> None:
+    if args.format == "collapsed":
+        stacks = load_merged(args.inputs)
+        output = args.output or default_output(args.inputs, ".collapsed.txt")
+        write_output(Path(output), collapsed_stacks(stacks))
+        return
+
+    name = Path(args.inputs[0]).stem
+    if args.separate:
+        profiles = {
+            path.stem: load_stacks(path)
+            for path in expand_inputs(args.inputs)
+        }
+    else:
+        profiles = {name: load_merged(args.inputs)}
+    document = speedscope_document(
+        profiles, name=name, kind=ProfileKind(args.format)
+    )
+    output = args.output or default_output(args.inputs, ".speedscope.json")
+    write_output(Path(output), json.dumps(document))
+
+
+def diff(args: argparse.Namespace) -> None:
+    before_input, after_input = args.diff
+    before = load_merged([before_input])
+    after = load_merged([after_input])
+    if args.normalize:
+        # Compare shapes, not totals: different request counts cancel out
+        after_total = sum(after.values())
+        if after_total > 0:
+            scale = sum(before.values()) / after_total
+            after = {stack: weight * scale for stack, weight in after.items()}
+
+    print_diff_table(before, after, args.top)
+    if args.format == "collapsed":
+        output = args.output or default_output([after_input], ".diff.txt")
+        write_output(Path(output), collapsed_diff(before, after))
+        return
+    document = speedscope_document(
+        {"before": before, "after": after},
+        name="diff",
+        kind=ProfileKind(args.format),
+    )
+    output = args.output or default_output(
+        [after_input], ".diff.speedscope.json"
+    )
+    write_output(Path(output), json.dumps(document))
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Convert cProfile .prof to speedscope JSON"
     )
-    parser.add_argument("input", help="Input .prof file")
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="Input .prof files or directories; all of them are merged",
+    )
     parser.add_argument(
         "-o", "--output",
-        help="Output JSON file (default: input.speedscope.json)"
+        help="Output file (default: next to the first input)",
+    )
+    parser.add_argument(
+        "-f", "--format",
+        choices=[*ProfileKind, "collapsed"],
+        default=ProfileKind.SAMPLED.value,
+        help=(
+            "sampled (default) or evented speedscope profile, or collapsed "
+            "stacks for flamegraph.pl; with --diff collapsed is the "
+            "difffolded two-column format"
+        ),
+    )
+    parser.add_argument(
+        "--separate",
+        action="store_true",
+        help="One speedscope profile per input file instead of merging",
+    )
+    parser.add_argument(
+        "--diff",
+        nargs=2,
+        metavar=("BEFORE", "AFTER"),
+        help="Compare two profiles or directories of profiles",
+    )
+    parser.add_argument(
+        "--normalize",
+        action="store_true",
+        help="With --diff, scale AFTER to the total time of BEFORE",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="With --diff, functions to print (default: 20)",
     )
     args = parser.parse_args()
-    
-    input_path = Path(args.input)
-    if not input_path.exists():
-        print(f"Error: {input_path} not found", file=sys.stderr)
-        sys.exit(1)
-    
-    output_path = args.output or str(input_path.with_suffix(".speedscope.json"))
-    
-    speedscope_data = convert_prof_to_speedscope(str(input_path))
-    
-    with open(output_path, "w") as f:
-        json.dump(speedscope_data, f)
-    
-    print(f"Converted: {input_path} -> {output_path}")
-    print(f"Open https://www.speedscope.app/ and load {output_path}")
+
+    if args.diff:
+        diff(args)
+    elif args.inputs:
+        convert(args)
+    else:
+        parser.error("give input profiles or --diff BEFORE AFTER")
 
 
 if __name__ == "__main__":
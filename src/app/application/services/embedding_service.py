@@ -0,0 +1,162 @@
+"""
+Dynamic batching of embedding requests.
+
+Тексты от конкурентных запросов складываются в очередь; фоновая задача
+собирает из них батч (до max_batch_size текстов или max_wait секунд) и
+выполняет один векторизованный проход модели в отдельном потоке, не
+блокируя event loop. Пока батч считается, следующий уже набирается.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from app.core.events import Events
+from app.utils.configs import EmbeddingConfig
+from app.utils.monitor import monitor
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from app.domain.interfaces.embedder import IEmbedder
+
+_Request = tuple[str, "asyncio.Future[NDArray[np.float32]]"]
+
+
+class EmbeddingService:
+    def __init__(
+        self,
+        embedder: IEmbedder,
+        config: EmbeddingConfig | None = None,
+    ) -> None:
+        self._embedder = embedder
+        self._config = config or EmbeddingConfig()
+        self._queue: asyncio.Queue[_Request] | None = None
+        self._worker: asyncio.Task[None] | None = None
+        # One thread: batches run one after another, the model itself
+        # (NumPy/BLAS) is free to use all cores within a batch
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="embedder"
+        )
+
+    @property
+    def dimension(self) -> int:
+        return self._embedder.dimension
+
+    async def embed(self, text: str) -> NDArray[np.float32]:
+        """
+        Embed one text, batched together with concurrent callers.
+
+        Args:
+            text: Text to embed.
+
+        Returns:
+            Vector of shape (dimension,).
+        """
+        queue = self._ensure_worker()
+        future: asyncio.Future[NDArray[np.float32]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        await queue.put((text, future))
+        return await future
+
+    @monitor(
+        event_name=Events.EMBEDDING_SERVICE,
+        use_log_args=False,
+        use_log_result=False,
+    )
+    async def embed_many(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        """
+        Embed several texts; they may be split across dynamic batches.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            Matrix of shape (len(texts), dimension).
+        """
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        vectors = await asyncio.gather(*(self.embed(text) for text in texts))
+        return np.stack(vectors)
+
+    async def aclose(self) -> None:
+        """Stop the batching task and the worker thread."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+            self._queue = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _ensure_worker(self) -> asyncio.Queue[_Request]:
+        if self._queue is None or self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue[_Request]) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect_batch(queue)
+            live = [request for request in batch if not request[1].done()]
+            if not live:
+                continue
+            try:
+                vectors = await loop.run_in_executor(
+                    self._executor,
+                    self._embedder.embed_batch,
+                    [text for text, _ in live],
+                )
+                self._deliver(live, vectors)
+            except Exception as exc:  # noqa: BLE001
+                for _, future in live:
+                    if not future.done():
+                        future.set_exception(exc)
+
+    @staticmethod
+    def _deliver(live: list[_Request], vectors: NDArray[np.float32]) -> None:
+        if len(vectors) != len(live):
+            msg = f"Embedder returned {len(vectors)} vectors for {len(live)} texts"
+            raise ValueError(msg)
+        for (_, future), vector in zip(live, vectors, strict=True):
+            if not future.done():
+                future.set_result(vector)
+
+    async def _collect_batch(
+        self, queue: asyncio.Queue[_Request]
+    ) -> list[_Request]:
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        flush_at = loop.time() + self._config.max_wait
+        while len(batch) < self._config.max_batch_size:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            remaining = flush_at - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except TimeoutError:
+                break
+        return batch
+
+
+async def init_embedding_service(
+    embedder: IEmbedder,
+    config: EmbeddingConfig,
+) -> AsyncGenerator[EmbeddingService, None]:
+    """Resource initializer: stops the worker and its thread on shutdown."""
+    service = EmbeddingService(embedder, config)
+    try:
+        yield service
+    finally:
+        await service.aclose()
@@ -0,0 +1,121 @@
+"""
+Weighted fair queueing of concurrent work by request priority class.
+
+Каждому классу приоритета назначается вес; при конкуренции за слоты
+классы получают ёмкость пропорционально весам (Start-time Fair Queuing),
+а при простое любой класс может занять все слоты. Так batch-нагрузка
+использует только свободную ёмкость и не вытесняет интерактивные запросы.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from app.utils.configs import RequestPriority
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from collections.abc import Mapping
+
+_RANK = {priority: rank for rank, priority in enumerate(RequestPriority)}
+
+
+class WeightedFairScheduler:
+    """
+    Limits concurrency and admits waiters in weighted fair order.
+
+    Each job gets virtual start/finish tags on arrival: a class with weight
+    w advances its finish tag by 1/w per job. Free slots go to the waiter
+    with the smallest finish tag.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        weights: Mapping[RequestPriority, float],
+    ) -> None:
+        self._free = max_concurrency
+        self._cost = {
+            priority: 1.0 / weights.get(priority, 1.0)
+            for priority in RequestPriority
+        }
+        self._queues: dict[RequestPriority, deque[_Waiter]] = {
+            priority: deque() for priority in RequestPriority
+        }
+        self._finish_tags = dict.fromkeys(RequestPriority, 0.0)
+        self._virtual_time = 0.0
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: RequestPriority
+    ) -> AsyncGenerator[None, None]:
+        """
+        Hold one concurrency slot for the duration of the block.
+
+        Args:
+            priority: Priority class of the current request.
+
+        Yields:
+            None, once the slot is granted.
+        """
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: RequestPriority) -> None:
+        start = max(self._virtual_time, self._finish_tags[priority])
+        self._finish_tags[priority] = start + self._cost[priority]
+
+        if self._free > 0 and not self.waiting:
+            self._free -= 1
+            self._virtual_time = start
+            return
+
+        waiter = _Waiter(
+            start=start,
+            finish=self._finish_tags[priority],
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._queues[priority].append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Slot was granted right before cancellation
+                self._release()
+            else:
+                self._queues[priority].remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        self._free += 1
+        while self._free > 0:
+            heads = [
+                (queue[0].finish, -_RANK[priority], priority)
+                for priority, queue in self._queues.items()
+                if queue
+            ]
+            if not heads:
+                return
+            *_, priority = min(heads)
+            waiter = self._queues[priority].popleft()
+            self._free -= 1
+            self._virtual_time = waiter.start
+            waiter.future.set_result(None)
+
+
+@dataclass(slots=True)
+class _Waiter:
+    start: float
+    finish: float
+    future: asyncio.Future[None]
@@ -1,12 +1,47 @@
+import asyncio
+import hashlib
+from contextlib import AbstractAsyncContextManager
+from contextlib import nullcontext
+
+from app.application.services.fair_scheduler import WeightedFairScheduler
 from app.core.events import Events
+from app.core.priority import current_priority
+from app.domain.entities.deadline import Deadline
 from app.domain.entities.document import Document
+from app.domain.entities.document_batch import DocumentBatch
+from app.domain.entities.search_result import SearchResult
 from app.domain.interfaces.search_repository import ISearchRepository
+from app.utils.configs import SearchConfig
 from app.utils.monitor import monitor
 
 
 class SearchService:
-    def __init__(self, repository: ISearchRepository) -> None:
+    def __init__(
+        self,
+        repository: ISearchRepository,
+        config: SearchConfig | None = None,
+        scheduler: WeightedFairScheduler | None = None,
+    ) -> None:
         self._repository = repository
+        self._config = config or SearchConfig()
+        self._scheduler = scheduler
+
+    def etag(self, query: str) -> str:
+        """
+        Entity tag of the search response for a query.
+
+        Built from the index generation and a hash of the query, so a
+        conditional request is answered without searching or hashing the
+        response body.
+
+        Args:
+            query: Search query string.
+
+        Returns:
+            Quoted strong entity tag.
+        """
+        digest = hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
+        return f'"{self._repository.generation:x}-{digest}"'
 
     @monitor(
         event_name=Events.SEARCH_SERVICE,
@@ -15,3 +50,65 @@ class SearchService:
     )
     async def search(self, query: str) -> list[Document]:
         return await self._repository.search(query=query)
+
+    @monitor(
+        event_name=Events.SEARCH_SERVICE_BATCH,
+        use_log_args=True,
+        use_log_result=False,
+    )
+    async def search_batch(self, query: str) -> DocumentBatch:
+        """
+        Search returning columnar results for bulk pipelines.
+
+        Rerank, dedupe and serialization steps work on the batch columns
+        instead of per-document objects.
+
+        Args:
+            query: Search query string.
+
+        Returns:
+            Columnar batch, best first.
+        """
+        return await self._repository.search_batch(query=query)
+
+    @monitor(
+        event_name=Events.SEARCH_SERVICE_UNTIL,
+        use_log_args=True,
+        use_log_result=True,
+    )
+    async def search_until(
+        self, query: str, budget: float | None = None
+    ) -> SearchResult:
+        """
+        Anytime search bounded by the request deadline.
+
+        Concurrent searches are admitted through the weighted fair
+        scheduler by priority class of the current request; time spent in
+        its queue counts towards the deadline. The repository is expected
+        to stop on its own and return partial results. If it overruns the
+        deadline by more than the configured grace period, it is cancelled
+        and an empty partial result is returned instead of an error.
+
+        Args:
+            query: Search query string.
+            budget: Time budget in seconds, defaults to config deadline.
+
+        Returns:
+            Search result, possibly partial.
+        """
+        if budget is None:
+            budget = self._config.deadline
+        deadline = Deadline.after(budget)
+        try:
+            async with asyncio.timeout(budget + self._config.deadline_grace):
+                async with self._slot():
+                    return await self._repository.search_until(
+                        query=query, deadline=deadline
+                    )
+        except TimeoutError:
+            return SearchResult(partial=True)
+
+    def _slot(self) -> AbstractAsyncContextManager[None]:
+        if self._scheduler is None:
+            return nullcontext()
+        return self._scheduler.slot(current_priority.get())
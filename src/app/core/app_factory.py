@@ -15,8 +15,16 @@ from app.core.containers import AppContainer
 from app.core.exceptions import BusinessError
 from app.core.exceptions import InfrastructureError
 from app.infrastructure.observability.logging import setup_logging
+from app.infrastructure.observability.memory_profiling import (
+    MemoryProfilingMiddleware,
+)
+from app.infrastructure.observability.memory_store import MemoryProfileStore
 from app.infrastructure.observability.metrics import setup_metrics
+from app.infrastructure.observability.profile_store import ProfileStore
 from app.infrastructure.observability.profiling import ProfilingMiddleware
+from app.infrastructure.observability.route_profiles import (
+    RouteProfileAggregator,
+)
 from app.presentation.api.application_api import create_main_router
 from app.presentation.api.exception_handlers import (
     business_error_handler,
@@ -24,6 +32,21 @@ from app.presentation.api.exception_handlers import (
     infra_error_handler,
     request_validation_handler,
 )
+from app.presentation.api.middlewares.compression import (
+    CompressionMiddleware,
+)
+from app.presentation.api.middlewares.load_shedding import (
+    LoadSheddingMiddleware,
+)
+from app.presentation.api.middlewares.priority import PriorityMiddleware
+from app.presentation.api.middlewares.probes import ProbeMiddleware
+from app.presentation.api.middlewares.rate_limit import RateLimitMiddleware
+from app.utils.configs import CompressionConfig
+from app.utils.configs import LoadSheddingConfig
+from app.utils.configs import MemoryProfilingConfig
+from app.utils.configs import PriorityConfig
+from app.utils.configs import ProbesConfig
+from app.utils.configs import RateLimitConfig
 from app.utils.configs import SecurityConfig, ProfilingConfig
 from app.utils.configs import load_settings
 from app.utils.serializer import AdvORJSONResponse
@@ -35,14 +58,70 @@ def create_middleware_list(
     ],
     profiling_config: ProfilingConfig = Provide[
         AppContainer.infra_container.profiling_config
-    ]
+    ],
+    load_shedding_config: LoadSheddingConfig = Provide[
+        AppContainer.infra_container.load_shedding_config
+    ],
+    priority_config: PriorityConfig = Provide[
+        AppContainer.infra_container.priority_config
+    ],
+    rate_limit_config: RateLimitConfig = Provide[
+        AppContainer.infra_container.rate_limit_config
+    ],
+    compression_config: CompressionConfig = Provide[
+        AppContainer.infra_container.compression_config
+    ],
+    probes_config: ProbesConfig = Provide[
+        AppContainer.infra_container.probes_config
+    ],
+    profile_store: ProfileStore = Provide[AppContainer.profile_store],
+    route_profiles: RouteProfileAggregator = Provide[
+        AppContainer.route_profiles
+    ],
+    memory_profiling_config: MemoryProfilingConfig = Provide[
+        AppContainer.infra_container.memory_profiling_config
+    ],
+    memory_profile_store: MemoryProfileStore = Provide[
+        AppContainer.memory_profile_store
+    ],
 ) -> list[Middleware]:
-    middleware_list = [
-        Middleware(
-            CorrelationIdMiddleware,
-            header_name=TRACE_ID,
-            validator=VALIDATION_UUID_OFF,
-        ),
+    middleware_list: list[Middleware] = []
+    # Probes are answered before any other middleware sees the request
+    if probes_config.enabled:
+        middleware_list.append(Middleware(
+            ProbeMiddleware,
+            config=probes_config,
+        ))
+    middleware_list.append(Middleware(
+        CorrelationIdMiddleware,
+        header_name=TRACE_ID,
+        validator=VALIDATION_UUID_OFF,
+    ))
+    # Outermost after correlation id, so problem responses are compressed
+    # too; compression still runs inside the load-shedding slot because it
+    # happens in the wrapped send
+    if compression_config.enabled:
+        middleware_list.append(Middleware(
+            CompressionMiddleware,
+            config=compression_config,
+        ))
+    middleware_list.append(Middleware(
+        PriorityMiddleware,
+        config=priority_config,
+    ))
+    # Reject runaway tenants before they occupy a slot in the queue
+    if rate_limit_config.enabled:
+        middleware_list.append(Middleware(
+            RateLimitMiddleware,
+            config=rate_limit_config,
+        ))
+    # Shed load as early as possible, before any other per-request work
+    if load_shedding_config.enabled:
+        middleware_list.append(Middleware(
+            LoadSheddingMiddleware,
+            config=load_shedding_config,
+        ))
+    middleware_list += [
         Middleware(
             TrustedHostMiddleware,
             allowed_hosts=security_config.trusted_hosts,
@@ -55,10 +134,21 @@ def create_middleware_list(
             allow_headers=security_config.cors_allow_headers,
         ),
     ]
+    # Outside CPU profiling, so CPU profiles don't include snapshots
+    if memory_profiling_config.enabled:
+        middleware_list.append(Middleware(
+            MemoryProfilingMiddleware,
+            config=memory_profiling_config,
+            store=memory_profile_store,
+        ))
     if profiling_config.enabled:
         middleware_list.append(Middleware(
             ProfilingMiddleware,
-            config=profiling_config
+            config=profiling_config,
+            store=profile_store,
+            aggregator=(
+                route_profiles if profiling_config.aggregate else None
+            ),
         ))
 
     return middleware_list
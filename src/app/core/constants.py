@@ -7,6 +7,7 @@ HELLO_WORLD = "Hello World"
 DEFAULT_PROBLEM_DETAIL_TYPE = "about:blank"
 TRACE_ID = "X-Request-ID"
 USER_ID = "X-User-ID"
+PRIORITY = "X-Priority"
 VALIDATION_UUID_OFF = None
 NO_PARAMS = None
 
@@ -20,5 +21,25 @@ METRICS_REQUEST_DURATION_NAME = "app_request_duration_seconds"
 METRICS_REQUEST_DURATION_DESC = "Request duration in seconds"
 METRICS_REQUEST_DURATION_UNIT = "s"
 
+METRICS_SHED_REQUESTS_NAME = "app_shed_requests_total"
+METRICS_SHED_REQUESTS_DESC = "Requests rejected by load shedding"
+METRICS_SHED_REQUESTS_UNIT = "1"
+
+METRICS_QUEUE_DELAY_NAME = "app_queue_delay_seconds"
+METRICS_QUEUE_DELAY_DESC = "Time a request waited for a worker slot"
+METRICS_QUEUE_DELAY_UNIT = "s"
+
+METRICS_RATE_LIMITED_NAME = "app_rate_limited_requests_total"
+METRICS_RATE_LIMITED_DESC = "Requests rejected by rate limiting"
+METRICS_RATE_LIMITED_UNIT = "1"
+
+METRICS_LOOP_LAG_NAME = "app_event_loop_lag_seconds"
+METRICS_LOOP_LAG_DESC = "Delay between scheduled and actual event loop wakeup"
+METRICS_LOOP_LAG_UNIT = "s"
+
+METRICS_LOG_DROPPED_NAME = "app_log_records_dropped_total"
+METRICS_LOG_DROPPED_DESC = "Log records dropped by the full log queue"
+METRICS_LOG_DROPPED_UNIT = "1"
+
 # Tracing
 OTLP_LOCAL_ENDPOINT = "console"
\ No newline at end of file
@@ -3,17 +3,39 @@ from dependency_injector import providers
 from granian import Granian
 from granian.constants import Interfaces
 
+from app.application.services.embedding_service import init_embedding_service
+from app.application.services.fair_scheduler import WeightedFairScheduler
 from app.application.services.search_service import SearchService
+from app.infrastructure.observability.loop_monitor import init_loop_monitor
+from app.infrastructure.observability.memory_store import MemoryProfileStore
+from app.infrastructure.observability.profile_store import ProfileStore
+from app.infrastructure.observability.route_profiles import (
+    RouteProfileAggregator,
+)
 from app.infrastructure.observability.strategies.logging import StandardLoggingStrategy
 from app.infrastructure.observability.strategies.metrics import OpentelemetryMetricsStrategy
 from app.infrastructure.observability.strategies.tracing import OpentelemetryTracingStrategy
 from app.infrastructure.persistence.repositories.search_repository import (
     SearchRepository,
 )
+from app.infrastructure.services.embedding_cache import CachedEmbedder
+from app.infrastructure.services.embedding_cache import init_embedding_cache
+from app.infrastructure.services.hashing_embedder import HashingEmbedder
+from app.utils.configs import AdminConfig
+from app.utils.configs import CompressionConfig
+from app.utils.configs import EmbeddingConfig
+from app.utils.configs import LoadSheddingConfig
 from app.utils.configs import LoggerConfig
+from app.utils.configs import LoopMonitorConfig
+from app.utils.configs import MemoryProfilingConfig
 from app.utils.configs import MetricsConfig
 from app.utils.configs import OTLPConfig
+from app.utils.configs import PayloadLoggingConfig
+from app.utils.configs import PriorityConfig
+from app.utils.configs import ProbesConfig
 from app.utils.configs import ProfilingConfig
+from app.utils.configs import RateLimitConfig
+from app.utils.configs import SearchConfig
 from app.utils.configs import SecurityConfig
 from app.utils.configs import SerializationConfig
 from app.utils.configs import ServerConfig
@@ -43,12 +65,29 @@ class InfrastructureContainer(containers.DeclarativeContainer):
         rotation=config.LOGGING.ROTATION,
         retention=config.LOGGING.RETENTION,
         loggers_to_root=config.LOGGING.LOGGERS_TO_ROOT,
+        serialize=config.LOGGING.SERIALIZE,
+        batching=config.LOGGING.PIPELINE.ENABLED,
+        queue_size=config.LOGGING.PIPELINE.QUEUE_SIZE.as_int(),
+        batch_size=config.LOGGING.PIPELINE.BATCH_SIZE.as_int(),
+        flush_interval=config.LOGGING.PIPELINE.FLUSH_INTERVAL.as_float(),
+        overflow=config.LOGGING.PIPELINE.OVERFLOW,
+        overflow_sample_every=(
+            config.LOGGING.PIPELINE.OVERFLOW_SAMPLE_EVERY.as_int()
+        ),
+    )
+
+    payload_logging_config = providers.Singleton(
+        PayloadLoggingConfig,
+        sample_every=config.LOGGING.PAYLOAD.SAMPLE_EVERY.as_int(),
+        slow_threshold=config.LOGGING.PAYLOAD.SLOW_THRESHOLD.as_float(),
+        max_bytes=config.LOGGING.PAYLOAD.MAX_BYTES.as_int(),
     )
 
     metrics_config = providers.Singleton(
         MetricsConfig,
         duration_buckets=config.METRICS.DURATION.BUCKETS,
-        service_name=config.METRICS.SERVICE_NAME
+        service_name=config.METRICS.SERVICE_NAME,
+        loop_lag_buckets=config.METRICS.LOOP_LAG.BUCKETS,
     )
 
     security_config = providers.Singleton(
@@ -76,6 +115,8 @@ class InfrastructureContainer(containers.DeclarativeContainer):
         detect_cycles=config.SERIALIZATION.DETECT_CYCLES,
         fallback_on_error=config.SERIALIZATION.FALLBACK_ON_ERROR,
         use_orjson=config.SERIALIZATION.USE_ORJSON,
+        max_string=config.SERIALIZATION.MAX_STRING.as_int(),
+        max_items=config.SERIALIZATION.MAX_ITEMS.as_int(),
     )
 
     serializer = providers.Singleton(
@@ -83,17 +124,122 @@ class InfrastructureContainer(containers.DeclarativeContainer):
         config=serialization_config,
     )
 
+    admin_config = providers.Singleton(
+        AdminConfig,
+        enabled=config.ADMIN.ENABLED,
+        token=config.ADMIN.TOKEN,
+        token_header=config.ADMIN.TOKEN_HEADER,
+    )
+
     profiling_config = providers.Singleton(
         ProfilingConfig,
         enabled=config.PROFILING.ENABLED,
+        mode=config.PROFILING.MODE,
+        sampling_hz=config.PROFILING.SAMPLING_HZ.as_int(),
         output_dir=config.PROFILING.OUTPUT_DIR,
         sort_by=config.PROFILING.SORT_BY,
         top_n=config.PROFILING.TOP_N.as_int(),
+        max_pending_writes=config.PROFILING.MAX_PENDING_WRITES.as_int(),
+        write_files=config.PROFILING.WRITE_FILES,
+        sample_every=config.PROFILING.SAMPLE_EVERY.as_int(),
+        routes=config.PROFILING.ROUTES,
+        trigger_header=config.PROFILING.TRIGGER_HEADER,
+        latency_threshold=config.PROFILING.LATENCY_THRESHOLD.as_float(),
+        ring_size=config.PROFILING.RING_SIZE.as_int(),
+        aggregate=config.PROFILING.AGGREGATE.ENABLED,
+        aggregate_window=config.PROFILING.AGGREGATE.WINDOW.as_float(),
+        aggregate_buckets=config.PROFILING.AGGREGATE.BUCKETS.as_int(),
+    )
+
+    memory_profiling_config = providers.Singleton(
+        MemoryProfilingConfig,
+        enabled=config.MEMORY_PROFILING.ENABLED,
+        sample_every=config.MEMORY_PROFILING.SAMPLE_EVERY.as_int(),
+        routes=config.MEMORY_PROFILING.ROUTES,
+        frames=config.MEMORY_PROFILING.FRAMES.as_int(),
+        top_n=config.MEMORY_PROFILING.TOP_N.as_int(),
+        ring_size=config.MEMORY_PROFILING.RING_SIZE.as_int(),
+        output_dir=config.MEMORY_PROFILING.OUTPUT_DIR,
+        write_files=config.MEMORY_PROFILING.WRITE_FILES,
+        max_pending_writes=(
+            config.MEMORY_PROFILING.MAX_PENDING_WRITES.as_int()
+        ),
+    )
+
+    loop_monitor_config = providers.Singleton(
+        LoopMonitorConfig,
+        enabled=config.LOOP_MONITOR.ENABLED,
+        interval=config.LOOP_MONITOR.INTERVAL.as_float(),
+        threshold=config.LOOP_MONITOR.THRESHOLD.as_float(),
+        stack_depth=config.LOOP_MONITOR.STACK_DEPTH.as_int(),
+    )
+
+    search_config = providers.Singleton(
+        SearchConfig,
+        deadline=config.SEARCH.DEADLINE.as_float(),
+        deadline_grace=config.SEARCH.DEADLINE_GRACE.as_float(),
+        max_concurrency=config.SEARCH.MAX_CONCURRENCY.as_int(),
+    )
+
+    priority_config = providers.Singleton(
+        PriorityConfig,
+        header_enabled=config.PRIORITY.HEADER_ENABLED,
+        default=config.PRIORITY.DEFAULT,
+        routes=config.PRIORITY.ROUTES,
+        weights=config.PRIORITY.WEIGHTS,
+    )
+
+    load_shedding_config = providers.Singleton(
+        LoadSheddingConfig,
+        enabled=config.LOAD_SHEDDING.ENABLED,
+        max_concurrency=config.LOAD_SHEDDING.MAX_CONCURRENCY.as_int(),
+        target=config.LOAD_SHEDDING.TARGET.as_float(),
+        interval=config.LOAD_SHEDDING.INTERVAL.as_float(),
+        retry_after=config.LOAD_SHEDDING.RETRY_AFTER.as_int(),
+        exempt_paths=config.LOAD_SHEDDING.EXEMPT_PATHS,
+    )
+
+    rate_limit_config = providers.Singleton(
+        RateLimitConfig,
+        enabled=config.RATE_LIMIT.ENABLED,
+        default=config.RATE_LIMIT.DEFAULT,
+        routes=config.RATE_LIMIT.ROUTES,
+        exempt_paths=config.RATE_LIMIT.EXEMPT_PATHS,
+        max_buckets=config.RATE_LIMIT.MAX_BUCKETS.as_int(),
+    )
+
+    probes_config = providers.Singleton(
+        ProbesConfig,
+        enabled=config.PROBES.ENABLED,
+        health_path=config.PROBES.HEALTH_PATH,
+        readiness_path=config.PROBES.READINESS_PATH,
+        metrics_path=config.PROBES.METRICS_PATH,
+    )
+
+    compression_config = providers.Singleton(
+        CompressionConfig,
+        enabled=config.COMPRESSION.ENABLED,
+        minimum_size=config.COMPRESSION.MINIMUM_SIZE.as_int(),
+        encodings=config.COMPRESSION.ENCODINGS,
+        levels=config.COMPRESSION.LEVELS,
+        threadpool_threshold=config.COMPRESSION.THREADPOOL_THRESHOLD.as_int(),
+    )
+
+    embedding_config = providers.Singleton(
+        EmbeddingConfig,
+        dimension=config.EMBEDDING.DIMENSION.as_int(),
+        max_batch_size=config.EMBEDDING.MAX_BATCH_SIZE.as_int(),
+        max_wait=config.EMBEDDING.MAX_WAIT.as_float(),
+        cache_backend=config.EMBEDDING.CACHE.BACKEND,
+        cache_dir=config.EMBEDDING.CACHE.DIR,
+        cache_initial_capacity=config.EMBEDDING.CACHE.INITIAL_CAPACITY.as_int(),
     )
 
     logging_strategy = providers.Singleton(
         StandardLoggingStrategy,
         serializer=serializer,
+        level=logger_config.provided.level,
+        payload=payload_logging_config,
     )
     tracing_strategy = providers.Singleton(OpentelemetryTracingStrategy)
     metrics_strategy = providers.Singleton(OpentelemetryMetricsStrategy)
@@ -126,7 +272,63 @@ class AppContainer(containers.DeclarativeContainer):
 
     search_repository = providers.Singleton(SearchRepository)
 
+    loop_monitor = providers.Resource(
+        init_loop_monitor,
+        config=infra_container.loop_monitor_config,
+    )
+
+    profile_store = providers.Singleton(
+        ProfileStore,
+        size=infra_container.profiling_config.provided.ring_size,
+    )
+
+    memory_profile_store = providers.Singleton(
+        MemoryProfileStore,
+        size=infra_container.memory_profiling_config.provided.ring_size,
+    )
+
+    route_profiles = providers.Singleton(
+        RouteProfileAggregator,
+        window=infra_container.profiling_config.provided.aggregate_window,
+        buckets=infra_container.profiling_config.provided.aggregate_buckets,
+    )
+
+    search_scheduler = providers.Singleton(
+        WeightedFairScheduler,
+        max_concurrency=infra_container.search_config.provided.max_concurrency,
+        weights=infra_container.priority_config.provided.weights,
+    )
+
     search_service = providers.Singleton(
         SearchService,
         repository=search_repository,
+        config=infra_container.search_config,
+        scheduler=search_scheduler,
+    )
+
+    base_embedder = providers.Singleton(
+        HashingEmbedder,
+        dimension=infra_container.embedding_config.provided.dimension,
+    )
+
+    embedding_cache = providers.Resource(
+        init_embedding_cache,
+        config=infra_container.embedding_config,
+        namespace=HashingEmbedder.__name__,
+    )
+
+    embedder = providers.Selector(
+        infra_container.embedding_config.provided.cache_backend,
+        none=base_embedder,
+        disk=providers.Singleton(
+            CachedEmbedder,
+            inner=base_embedder,
+            cache=embedding_cache,
+        ),
+    )
+
+    embedding_service = providers.Resource(
+        init_embedding_service,
+        embedder=embedder,
+        config=infra_container.embedding_config,
     )
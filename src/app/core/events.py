@@ -9,4 +9,13 @@ class Event(NamedTuple):
 
 class Events(Enum):
     SEARCH_SERVICE = Event("SEARCH_SERVICE", "Search service execution")
+    SEARCH_SERVICE_UNTIL = Event(
+        "SEARCH_SERVICE_UNTIL", "Deadline-bounded search execution"
+    )
+    SEARCH_SERVICE_BATCH = Event(
+        "SEARCH_SERVICE_BATCH", "Columnar search execution"
+    )
+    EMBEDDING_SERVICE = Event(
+        "EMBEDDING_SERVICE", "Embedding service execution"
+    )
     HEALTHCHECK = Event("HEALTHCHECK", "Healthcheck execution")
@@ -4,6 +4,7 @@ from pydantic import Field
 
 from app.core.constants import DEFAULT_PROBLEM_DETAIL_TYPE
 from app.core.constants import NO_PARAMS
+from app.utils.encoders import response_encoders
 
 
 class Reason(BaseModel):
@@ -32,12 +33,42 @@ class Reasons:
         ),
         title="Service Unavailable",
     )
+    overloaded = Reason(
+        urn_type_error="urn:error:overloaded",
+        code="OVERLOADED",
+        message=(
+            "The service is overloaded and shed the request. "
+            "Please retry after the interval in Retry-After header."
+        ),
+        title="Service Overloaded",
+    )
+    too_many_requests = Reason(
+        urn_type_error="urn:error:too-many-requests",
+        code="RATE_LIMITED",
+        message=(
+            "Request rate limit exceeded. "
+            "Please retry after the interval in Retry-After header."
+        ),
+        title="Too Many Requests",
+    )
     business_rule_violation = Reason(
         urn_type_error="urn:problem:business-rule-violation",
         code="BUSINESS_RULE_VIOLATION",
         message="The business rule violation.",
         title="Business Rule Violation",
     )
+    not_found = Reason(
+        urn_type_error="urn:problem:not-found",
+        code="NOT_FOUND",
+        message="The requested resource was not found.",
+        title="Not Found",
+    )
+    unauthorized = Reason(
+        urn_type_error="urn:problem:unauthorized",
+        code="UNAUTHORIZED",
+        message="Missing or invalid credentials.",
+        title="Unauthorized",
+    )
     validation_error = Reason(
         urn_type_error="urn:problem:validation-error",
         code="VALIDATION_ERROR",
@@ -109,6 +140,10 @@ class ProblemDetail(BaseModel):
     )
 
 
+# ProblemDetail отдаётся по алиасам и без пустых полей (invalid_params)
+response_encoders.register_model(ProblemDetail, exclude_none=True)
+
+
 class AppError(Exception):
     """Базовый класс для всех ошибок приложения."""
 
@@ -122,6 +157,32 @@ class BusinessError(AppError):
     detail: str | None = Reasons.business_rule_violation.message
 
 
+class NotFoundError(BusinessError):
+    """Запрошенный ресурс не существует (или уже вытеснен)."""
+
+    status_code = 404
+    urn_type_error = Reasons.not_found.urn_type_error
+    code = Reasons.not_found.code
+    title = Reasons.not_found.title
+
+    def __init__(self, detail: str) -> None:
+        super().__init__(detail)
+        self.detail = detail
+
+
+class UnauthorizedError(BusinessError):
+    """Запрос без нужных учётных данных (например, admin-токена)."""
+
+    status_code = 401
+    urn_type_error = Reasons.unauthorized.urn_type_error
+    code = Reasons.unauthorized.code
+    title = Reasons.unauthorized.title
+
+    def __init__(self, detail: str = Reasons.unauthorized.message) -> None:
+        super().__init__(detail)
+        self.detail = detail
+
+
 # --- Инфраструктурные ошибки (система виновата) ---
 class InfrastructureError(AppError):
     """
@@ -0,0 +1,58 @@
+from contextvars import ContextVar
+
+from app.utils.configs import PriorityConfig
+from app.utils.configs import RequestPriority
+
+
+# Приоритет текущего запроса; выставляется PriorityMiddleware и читается
+# load shedding'ом и планировщиком поиска
+current_priority: ContextVar[RequestPriority] = ContextVar(
+    "current_priority", default=RequestPriority.NORMAL
+)
+
+_RANK = {priority: rank for rank, priority in enumerate(RequestPriority)}
+
+
+class PriorityResolver:
+    """Resolves priority class of a request by header or route prefix."""
+
+    __slots__ = ("_config", "_routes")
+
+    def __init__(self, config: PriorityConfig) -> None:
+        self._config = config
+        # Longest prefix first, so specific routes win over broad ones
+        self._routes = sorted(
+            config.routes.items(),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+
+    def resolve(self, path: str, header: str | None = None) -> RequestPriority:
+        """
+        Resolve priority class of a request.
+
+        The route mapping sets the ceiling; the client-supplied header can
+        only lower it (e.g. a bulk job marking itself as batch), never
+        raise it, so it cannot bypass shedding or fair queueing.
+
+        Args:
+            path: Request path.
+            header: Value of the priority header, if any.
+
+        Returns:
+            Priority class.
+        """
+        priority = self._config.default
+        for prefix, route_priority in self._routes:
+            if path.startswith(prefix):
+                priority = route_priority
+                break
+
+        if header and self._config.header_enabled:
+            try:
+                requested = RequestPriority(header.strip().lower())
+            except ValueError:
+                return priority
+            if _RANK[requested] < _RANK[priority]:
+                return requested
+        return priority
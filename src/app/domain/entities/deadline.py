@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import monotonic
+
+
+@dataclass(frozen=True, slots=True)
+class Deadline:
+    """
+    Абсолютный дедлайн запроса на монотонных часах.
+
+    Передаётся вниз по слоям, чтобы каждый участник (сервис, репозиторий,
+    отдельный шард) сам решал, сколько работы он ещё успевает сделать.
+    """
+
+    expires_at: float
+
+    @classmethod
+    def after(cls, timeout: float) -> Deadline:
+        """
+        Create a deadline that expires ``timeout`` seconds from now.
+
+        Args:
+            timeout: Time budget in seconds.
+
+        Returns:
+            New deadline.
+        """
+        return cls(expires_at=monotonic() + timeout)
+
+    def remaining(self) -> float:
+        """Seconds left before expiration, never negative."""
+        return max(0.0, self.expires_at - monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return monotonic() >= self.expires_at
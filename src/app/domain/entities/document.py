@@ -1,9 +1,70 @@
-from dataclasses import dataclass
-from dataclasses import field
-from typing import Any
-
-
-@dataclass
-class Document:
-    text: str
-    metadata: dict[str, Any] = field(default_factory=dict)
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+from dataclasses import field
+from types import MappingProxyType
+from typing import Any
+
+
+# Пул разделяемых metadata: одинаковые наборы пар (например,
+# {"source": "mock"}) хранятся в одном экземпляре на процесс. Тип значения
+# входит в ключ: иначе True, 1 и 1.0 — один ключ и делят один mapping
+_METADATA_POOL: dict[frozenset[tuple[str, type, Any]], Mapping[str, Any]] = {}
+_METADATA_POOL_LIMIT = 65_536
+
+
+def intern_metadata(metadata: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Return a shared read-only mapping equal to ``metadata``.
+
+    Keys and string values are interned. Mappings with unhashable values
+    are not pooled and get a private read-only copy.
+
+    Args:
+        metadata: Document metadata.
+
+    Returns:
+        Read-only mapping, shared between equal metadata.
+    """
+    try:
+        key = frozenset(
+            (name, type(value), value) for name, value in metadata.items()
+        )
+    except TypeError:
+        return MappingProxyType(dict(metadata))
+
+    shared = _METADATA_POOL.get(key)
+    if shared is None:
+        shared = MappingProxyType(
+            {
+                sys.intern(name): sys.intern(value)
+                if type(value) is str
+                else value
+                for name, value in metadata.items()
+            }
+        )
+        # Unbounded unique metadata must not turn the pool into a leak
+        if len(_METADATA_POOL) < _METADATA_POOL_LIMIT:
+            _METADATA_POOL[key] = shared
+    return shared
+
+
+@dataclass(frozen=True, slots=True)
+class Document:
+    """
+    Документ выдачи.
+
+    Компактное неизменяемое представление: без ``__dict__`` на экземпляр,
+    metadata — разделяемый read-only mapping из пула, поэтому миллионы
+    документов с одинаковыми metadata не держат по словарю на каждый.
+    """
+
+    text: str
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "metadata", intern_metadata(self.metadata))
+
+    def __reduce__(self) -> tuple[type["Document"], tuple[str, dict[str, Any]]]:
+        # mappingproxy is not picklable: rebuild (and re-intern) on load
+        return type(self), (self.text, dict(self.metadata))
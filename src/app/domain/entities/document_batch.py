@@ -0,0 +1,292 @@
+"""
+Columnar representation of a ranked list of documents.
+
+Вместо списка объектов ``Document`` батч хранит колонки в NumPy-буферах:
+идентификаторы, скоры, смещения текстов в общем UTF-8 буфере и
+словарно-кодированные колонки metadata. Rerank, дедупликация, слияние
+и top-k выполняются векторно над колонками, без цикла по документам.
+"""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import replace
+from itertools import pairwise
+from typing import TYPE_CHECKING
+from typing import Any
+
+import numpy as np
+
+from app.domain.entities.document import Document
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+    from numpy.typing import ArrayLike
+    from numpy.typing import NDArray
+
+_MISSING = -1
+_ABSENT = object()
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class MetadataColumn:
+    """Dictionary-encoded metadata column: ``values[codes[i]]``."""
+
+    codes: NDArray[np.int32]  # _MISSING — у документа нет ключа
+    values: tuple[Any, ...]
+
+    def take(self, indices: NDArray[np.intp]) -> MetadataColumn:
+        return MetadataColumn(codes=self.codes[indices], values=self.values)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DocumentBatch:
+    """
+    Колоночный батч документов.
+
+    Текст i-го документа — ``text_data[text_offsets[i]:text_offsets[i + 1]]``.
+    """
+
+    ids: NDArray[np.int64]
+    scores: NDArray[np.float32]
+    text_offsets: NDArray[np.int64]
+    text_data: NDArray[np.uint8]
+    metadata: Mapping[str, MetadataColumn] = field(default_factory=dict)
+
+    @classmethod
+    def empty(cls) -> DocumentBatch:
+        return cls(
+            ids=np.empty(0, dtype=np.int64),
+            scores=np.empty(0, dtype=np.float32),
+            text_offsets=np.zeros(1, dtype=np.int64),
+            text_data=np.empty(0, dtype=np.uint8),
+        )
+
+    @classmethod
+    def from_documents(
+        cls,
+        documents: Sequence[Document],
+        scores: ArrayLike | None = None,
+        ids: ArrayLike | None = None,
+    ) -> DocumentBatch:
+        """
+        Build a batch from row-oriented documents.
+
+        Args:
+            documents: Documents, best first.
+            scores: Relevance scores, zeros by default.
+            ids: Document ids, content hash of the text by default.
+
+        Returns:
+            Columnar batch.
+        """
+        encoded = [document.text.encode() for document in documents]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(text) for text in encoded], out=offsets[1:])
+
+        columns: dict[str, _ColumnBuilder] = {}
+        for row, document in enumerate(documents):
+            for name, value in document.metadata.items():
+                if name not in columns:
+                    columns[name] = _ColumnBuilder(len(documents))
+                columns[name].set(row, value)
+
+        return cls(
+            ids=(
+                np.fromiter(
+                    (text_id(text) for text in encoded),
+                    dtype=np.int64,
+                    count=len(encoded),
+                )
+                if ids is None
+                else np.asarray(ids, dtype=np.int64)
+            ),
+            scores=(
+                np.zeros(len(encoded), dtype=np.float32)
+                if scores is None
+                else np.asarray(scores, dtype=np.float32)
+            ),
+            text_offsets=offsets,
+            text_data=np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            metadata={name: col.build() for name, col in columns.items()},
+        )
+
+    @classmethod
+    def concat(cls, batches: Iterable[DocumentBatch]) -> DocumentBatch:
+        """
+        Concatenate batches; metadata dictionaries are merged.
+
+        Args:
+            batches: Batches to concatenate, in order.
+
+        Returns:
+            Single batch with rows of all batches.
+        """
+        non_empty = [batch for batch in batches if len(batch)]
+        if not non_empty:
+            return cls.empty()
+        if len(non_empty) == 1:
+            return non_empty[0]
+
+        shifts = np.cumsum([0] + [len(b.text_data) for b in non_empty[:-1]])
+        offsets = np.concatenate(
+            [np.zeros(1, dtype=np.int64)]
+            + [
+                batch.text_offsets[1:] + shift
+                for batch, shift in zip(non_empty, shifts, strict=True)
+            ]
+        )
+        names = dict.fromkeys(name for b in non_empty for name in b.metadata)
+        return cls(
+            ids=np.concatenate([b.ids for b in non_empty]),
+            scores=np.concatenate([b.scores for b in non_empty]),
+            text_offsets=offsets,
+            text_data=np.concatenate([b.text_data for b in non_empty]),
+            metadata={
+                name: _concat_columns(name, non_empty) for name in names
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def text(self, row: int) -> str:
+        start, end = self.text_offsets[row], self.text_offsets[row + 1]
+        return self.text_data[start:end].tobytes().decode()
+
+    def texts(self) -> list[str]:
+        data = self.text_data.tobytes()
+        bounds = self.text_offsets.tolist()
+        return [
+            data[start:end].decode()
+            for start, end in pairwise(bounds)
+        ]
+
+    def to_documents(self) -> list[Document]:
+        decoded = {
+            name: [
+                column.values[code] if code != _MISSING else _ABSENT
+                for code in column.codes.tolist()
+            ]
+            for name, column in self.metadata.items()
+        }
+        return [
+            Document(
+                text=text,
+                metadata={
+                    name: values[row]
+                    for name, values in decoded.items()
+                    if values[row] is not _ABSENT
+                },
+            )
+            for row, text in enumerate(self.texts())
+        ]
+
+    def take(self, indices: ArrayLike) -> DocumentBatch:
+        """
+        Gather rows by position (reorder, filter, top-k).
+
+        Args:
+            indices: Row positions.
+
+        Returns:
+            New batch with the selected rows.
+        """
+        rows = np.asarray(indices, dtype=np.intp)
+        starts = self.text_offsets[rows]
+        lengths = self.text_offsets[rows + 1] - starts
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        # Byte positions of selected texts, without a per-row loop
+        positions = np.arange(offsets[-1], dtype=np.int64) + np.repeat(
+            starts - offsets[:-1], lengths
+        )
+        return DocumentBatch(
+            ids=self.ids[rows],
+            scores=self.scores[rows],
+            text_offsets=offsets,
+            text_data=self.text_data[positions],
+            metadata={
+                name: column.take(rows)
+                for name, column in self.metadata.items()
+            },
+        )
+
+    def with_scores(self, scores: ArrayLike) -> DocumentBatch:
+        return replace(self, scores=np.asarray(scores, dtype=np.float32))
+
+    def top_k(self, k: int | None = None) -> DocumentBatch:
+        """Rows sorted by score descending (stable), truncated to k."""
+        order = np.argsort(-self.scores, kind="stable")
+        return self.take(order[:k])
+
+    def dedupe(self) -> DocumentBatch:
+        """Keep the first occurrence of every id, preserving order."""
+        _, first = np.unique(self.ids, return_index=True)
+        if len(first) == len(self):
+            return self
+        return self.take(np.sort(first))
+
+
+def text_id(text: bytes) -> int:
+    """Stable 64-bit content id of an UTF-8 encoded text."""
+    return int.from_bytes(
+        hashlib.blake2b(text, digest_size=8).digest(), "little", signed=True
+    )
+
+
+class _ColumnBuilder:
+    __slots__ = ("codes", "index", "values")
+
+    def __init__(self, size: int) -> None:
+        self.codes = np.full(size, _MISSING, dtype=np.int32)
+        self.index: dict[tuple[type, Any], int] = {}
+        self.values: list[Any] = []
+
+    def set(self, row: int, value: Any) -> None:  # noqa: ANN401
+        self.codes[row] = _encode(value, self.index, self.values)
+
+    def build(self) -> MetadataColumn:
+        return MetadataColumn(codes=self.codes, values=tuple(self.values))
+
+
+def _encode(
+    value: Any,  # noqa: ANN401
+    index: dict[tuple[type, Any], int],
+    values: list[Any],
+) -> int:
+    """Code of the value in a column dictionary, adding it if needed."""
+    # Keyed by type too: True == 1 == 1.0 must stay distinct values
+    key = (type(value), value)
+    with contextlib.suppress(TypeError):  # unhashable: not deduplicated
+        code = index.get(key)
+        if code is not None:
+            return code
+        index[key] = len(values)
+    values.append(value)
+    return len(values) - 1
+
+
+def _concat_columns(
+    name: str, batches: Sequence[DocumentBatch]
+) -> MetadataColumn:
+    index: dict[tuple[type, Any], int] = {}
+    values: list[Any] = []
+    parts: list[NDArray[np.int32]] = []
+    for batch in batches:
+        column = batch.metadata.get(name)
+        if column is None:
+            parts.append(np.full(len(batch), _MISSING, dtype=np.int32))
+            continue
+        remap = np.empty(len(column.values) + 1, dtype=np.int32)
+        remap[-1] = _MISSING  # codes == -1 index the last slot
+        for code, value in enumerate(column.values):
+            remap[code] = _encode(value, index, values)
+        parts.append(remap[column.codes])
+    return MetadataColumn(codes=np.concatenate(parts), values=tuple(values))
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from dataclasses import field
+
+from app.domain.entities.document import Document
+
+
+@dataclass
+class SearchResult:
+    """
+    Результат поиска с учётом дедлайна.
+
+    partial=True означает, что дедлайн истёк раньше, чем были опрошены все
+    сегменты/шарды/ветки поиска, и documents содержит лучшее из найденного.
+    """
+
+    documents: list[Document] = field(default_factory=list)
+    partial: bool = False
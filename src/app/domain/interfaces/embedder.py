@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Protocol
+from typing import runtime_checkable
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+    from numpy.typing import NDArray
+
+
+@runtime_checkable
+class IEmbedder(Protocol):
+    """Interface for text embedding models."""
+
+    @property
+    def dimension(self) -> int:
+        """Size of produced vectors."""
+        ...
+
+    def embed_batch(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        """
+        Embed a batch of texts in one vectorized forward pass.
+
+        Blocking call, executed in a worker thread by EmbeddingService.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            Matrix of shape (len(texts), dimension), one row per text.
+        """
+        ...
@@ -2,9 +2,57 @@ from __future__ import annotations
 
 from typing import Any
 from typing import Protocol
+from typing import TYPE_CHECKING
 from typing import runtime_checkable
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@runtime_checkable
+class IEventLogger(Protocol):
+    """Logger of one monitored event, prepared once per decorated function."""
+
+    def log_start(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        """Log start of execution, returns the context for the other calls."""
+        ...
+
+    def log_success(
+        self,
+        result: Any,
+        context: Any,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        duration: float,
+    ) -> None:
+        """Log successful execution."""
+        ...
+
+    def log_error(
+        self,
+        exc: Exception,
+        context: Any,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Log error execution."""
+        ...
+
+
+@runtime_checkable
+class IEventMetrics(Protocol):
+    """Metrics of one monitored event with precomputed attributes."""
+
+    def record_success(self, duration: float) -> None:
+        """Record successful execution."""
+        ...
+
+    def record_error(self, duration: float, error_type: str) -> None:
+        """Record failed execution."""
+        ...
+
+
 @runtime_checkable
 class ILoggingStrategy(Protocol):
     """Interface for logging strategy."""
@@ -35,6 +83,23 @@ class ILoggingStrategy(Protocol):
         """Log error execution."""
         ...
 
+    def event_logger(
+        self,
+        event_name: str,
+        *,
+        use_log_args: bool,
+        use_log_result: bool,
+        sample_every: int | None = None,
+        slow_threshold: float | None = None,
+        max_bytes: int | None = None,
+    ) -> IEventLogger:
+        """
+        Logger of one event with its bound context precomputed.
+
+        Payload sampling arguments override the configured defaults.
+        """
+        ...
+
 
 @runtime_checkable
 class ITracingStrategy(Protocol):
@@ -48,6 +113,10 @@ class ITracingStrategy(Protocol):
         """End the span."""
         ...
 
+    def span_factory(self, name: str) -> Callable[[], Any]:
+        """Callable starting a span named ``name``, bound once."""
+        ...
+
 
 @runtime_checkable
 class IMetricsStrategy(Protocol):
@@ -62,3 +131,7 @@ class IMetricsStrategy(Protocol):
     ) -> None:
         """Record request metrics."""
         ...
+
+    def event_metrics(self, event_name: str) -> IEventMetrics:
+        """Metrics of one event with its attribute sets precomputed."""
+        ...
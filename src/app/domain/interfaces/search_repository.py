@@ -1,13 +1,25 @@
 from typing import Protocol
 from typing import runtime_checkable
 
+from app.domain.entities.deadline import Deadline
 from app.domain.entities.document import Document
+from app.domain.entities.document_batch import DocumentBatch
+from app.domain.entities.search_result import SearchResult
 
 
 @runtime_checkable
 class ISearchRepository(Protocol):
     """Interface for search repository implementations."""
 
+    @property
+    def generation(self) -> int:
+        """
+        Index generation number.
+
+        Must grow whenever the indexed content changes, so that the
+        generation and the query together identify a search response.
+        """
+
     async def search(self, query: str) -> list[Document]:
         """
         Search for data in the repository.
@@ -15,3 +27,25 @@ class ISearchRepository(Protocol):
         Args:
             query: Search query string.
         """
+
+    async def search_batch(self, query: str) -> DocumentBatch:
+        """
+        Search and return the ranking as a columnar batch.
+
+        Args:
+            query: Search query string.
+        """
+
+    async def search_until(
+        self, query: str, deadline: Deadline
+    ) -> SearchResult:
+        """
+        Anytime search: return the best results found before the deadline.
+
+        Implementations must not raise on deadline expiration; they stop
+        early and mark the result as partial instead.
+
+        Args:
+            query: Search query string.
+            deadline: Absolute deadline of the request.
+        """
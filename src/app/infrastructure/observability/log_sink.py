@@ -0,0 +1,165 @@
+"""
+Non-blocking batched log sink.
+
+Обычный stdout sink loguru пишет каждую строку синхронно в вызывающем
+потоке, то есть в event loop: медленный stdout (pipe в сборщик логов,
+переполненный буфер контейнера) добавляет задержку к запросам. Этот sink
+только кладёт готовую строку в ограниченную очередь (``deque`` —
+``append``/``popleft`` атомарны, блокировки на горячем пути нет), а
+фоновый поток ``log-writer`` склеивает накопившиеся строки и пишет их
+одним ``os.write``. Проверка заполненности не атомарна с ``append``,
+поэтому при нескольких пишущих потоках очередь может превысить
+``capacity`` на число этих потоков.
+
+Форматирование строки по ``LOGGING.FORMAT`` остаётся в вызывающем потоке:
+loguru передаёт sink уже готовую строку.
+
+Если очередь заполнена, решает ``OverflowPolicy``:
+
+* ``block`` — вызывающий поток ждёт, пока writer освободит место (логи
+  не теряются, но I/O снова влияет на латентность);
+* ``drop`` — новая запись отбрасывается;
+* ``sample`` — записи WARNING и выше и каждая N-я остальная вытесняют
+  самую старую запись очереди, прочие отбрасываются.
+
+Отброшенные записи считаются: writer пишет строку с их числом в поток и
+добавляет его в счётчик ``app_log_records_dropped_total``.
+"""
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+from opentelemetry import metrics
+
+from app.core import constants
+from app.utils.configs import OverflowPolicy
+
+
+if TYPE_CHECKING:
+    from typing import TextIO
+
+WARNING_LEVEL_NO = 30
+
+
+class BatchingSink:
+    """Loguru sink writing formatted records from a background thread."""
+
+    def __init__(
+        self,
+        stream: TextIO,
+        *,
+        capacity: int,
+        batch_size: int,
+        flush_interval: float,
+        policy: OverflowPolicy,
+        sample_every: int = 10,
+    ) -> None:
+        self.dropped = 0
+        self._stream = stream
+        try:
+            self._fd: int | None = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            self._fd = None  # captured or in-memory stream
+        self._capacity = capacity
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._policy = policy
+        self._sample_every = sample_every
+        self._overflowed = 0
+        self._reported = 0  # drops already written to the stream
+        self._queue: deque[str] = deque()
+        self._ready = threading.Event()  # a batch is waiting or stopping
+        self._space = threading.Event()  # writer drained the queue
+        self._stopping = False
+        self._dropped_total = metrics.get_meter(__name__).create_counter(
+            name=constants.METRICS_LOG_DROPPED_NAME,
+            description=constants.METRICS_LOG_DROPPED_DESC,
+            unit=constants.METRICS_LOG_DROPPED_UNIT,
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        """Queue a formatted record; called by loguru in the logging thread."""
+        queue = self._queue
+        if len(queue) >= self._capacity and not self._overflow(message):
+            return
+        queue.append(message)
+        if len(queue) >= self._batch_size:
+            self._ready.set()
+
+    def _overflow(self, message: str) -> bool:
+        """Apply the policy to a record arriving at a full queue."""
+        if self._policy is OverflowPolicy.BLOCK:
+            while len(self._queue) >= self._capacity and not self._stopping:
+                self._space.clear()
+                self._ready.set()
+                self._space.wait(self._flush_interval)
+            return True
+        if self._policy is OverflowPolicy.SAMPLE:
+            self._overflowed += 1
+            record = getattr(message, "record", None)
+            important = (
+                record is not None and record["level"].no >= WARNING_LEVEL_NO
+            )
+            if important or self._overflowed % self._sample_every == 0:
+                with contextlib.suppress(IndexError):
+                    self._queue.popleft()  # make room, the oldest is lost
+                self.dropped += 1
+                return True
+        self.dropped += 1
+        return False
+
+    def stop(self) -> None:
+        """Write queued records and stop the thread; called by loguru."""
+        if self._stopping:
+            return
+        self._stopping = True
+        self._ready.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            self._ready.wait(self._flush_interval)
+            self._ready.clear()
+            stopping = self._stopping
+            self._flush()
+            self._space.set()
+            if stopping:
+                self._flush()
+                return
+
+    def _flush(self) -> None:
+        queue = self._queue
+        lines: list[str] = []
+        while queue:
+            lines.append(queue.popleft())
+        dropped = self.dropped - self._reported
+        if dropped:
+            self._reported += dropped
+            self._dropped_total.add(dropped)
+            lines.append(
+                f"{time.strftime('%Y-%m-%d %H:%M:%S')} | WARNING  | "
+                f"{dropped} log records dropped: log queue is full\n"
+            )
+        if lines:
+            self._write("".join(lines))
+
+    def _write(self, text: str) -> None:
+        # A broken stdout has nowhere to be reported; the batch is lost
+        with contextlib.suppress(OSError):
+            if self._fd is None:
+                self._stream.write(text)
+                self._stream.flush()
+                return
+            data = memoryview(text.encode("utf-8", errors="replace"))
+            while data:
+                written = os.write(self._fd, data)
+                data = data[written:]
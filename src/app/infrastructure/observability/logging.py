@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import logging
 import sys
+import traceback
 from typing import TYPE_CHECKING
+from typing import Any
 
+import orjson
 from loguru import logger
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import \
@@ -14,10 +17,14 @@ from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.sdk.trace.export import ConsoleSpanExporter
 
 from app.core.constants import OTLP_LOCAL_ENDPOINT
+from app.infrastructure.observability.log_sink import BatchingSink
+from app.utils.serializer import RawJSON
 
 if TYPE_CHECKING:
     from types import FrameType
 
+    from loguru import Record
+
     from app.utils.configs import LoggerConfig
     from app.utils.configs import OTLPConfig
 
@@ -69,6 +76,57 @@ def record_patcher(record: logging.LogRecord) -> None:
         record["extra"]["span_id"] = format(span_context.span_id, "016x")
 
 
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, RawJSON):
+        return orjson.Fragment(obj.data)
+    return str(obj)
+
+
+def serialize_record(record: Record) -> str:
+    """
+    Одна строка JSON для записи лога.
+
+    Payload ``@monitor`` уже закодирован в ``RawJSON`` и вставляется как
+    есть (``orjson.Fragment``): контекст записи сериализуется один раз,
+    без ``loads`` и повторного ``json.dumps`` из ``serialize=True``.
+    """
+    exception = record["exception"]
+    data: dict[str, Any] = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "name": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+        "extra": record["extra"],
+        "exception": (
+            None
+            if exception is None
+            else "".join(traceback.format_exception(*exception))
+        ),
+    }
+    try:
+        return orjson.dumps(
+            data, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    except TypeError:  # e.g. an int over 64 bits somewhere in extra
+        data["extra"] = {key: str(value) for key, value in data["extra"].items()}
+        return orjson.dumps(data, default=_json_default).decode()
+
+
+def json_format(record: Record) -> str:
+    """
+    Формат loguru, пишущий запись строкой JSON.
+
+    Готовая строка кладётся в отдельный ключ записи, а не в ``extra``:
+    текстовые sink'и её не видят, а второй JSON sink (stdout и файл)
+    берёт уже собранную.
+    """
+    if "json" not in record:
+        record["json"] = serialize_record(record)  # type: ignore[typeddict-unknown-key]
+    return "{json}\n"
+
+
 def setup_logging(
     logger_config: LoggerConfig,
     otlp_config: OTLPConfig,
@@ -102,12 +160,34 @@ def setup_logging(
     # 2. Добавляем патчер для trace_id
     logger.configure(patcher=record_patcher)
 
-    # 3. Добавляем вывод в консоль (stdout)
-    logger.add(
-        sys.stdout,
-        format=logger_config.format,
-        level=logger_config.level,
+    # 3. Добавляем вывод в консоль (stdout): через очередь и фоновый поток,
+    # чтобы запись не блокировала event loop
+    # JSON-формат собирает строку сам, текстовый — по LOGGING.FORMAT
+    stdout_format = (
+        json_format if logger_config.serialize else logger_config.format
     )
+    colorize = sys.stdout.isatty() and not logger_config.serialize
+    if logger_config.batching:
+        logger.add(
+            BatchingSink(
+                sys.stdout,
+                capacity=logger_config.queue_size,
+                batch_size=logger_config.batch_size,
+                flush_interval=logger_config.flush_interval,
+                policy=logger_config.overflow,
+                sample_every=logger_config.overflow_sample_every,
+            ),
+            format=stdout_format,
+            level=logger_config.level,
+            colorize=colorize,
+        )
+    else:
+        logger.add(
+            sys.stdout,
+            format=stdout_format,
+            level=logger_config.level,
+            colorize=colorize,
+        )
 
     if logger_config.path:
         logger.add(
@@ -116,7 +196,7 @@ def setup_logging(
             retention=logger_config.retention,
             compression="zip",
             level=logger_config.level,
-            serialize=True,
+            format=json_format,
             enqueue=True,
             backtrace=True,
             diagnose=True,
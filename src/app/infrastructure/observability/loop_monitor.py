@@ -0,0 +1,137 @@
+"""
+Event loop lag monitor.
+
+Синхронная работа в async-пути (fallback сериализатора, форматирование
+логов, дампы профилей) блокирует event loop: все конкурентные запросы
+ждут, а в профиле медленного запроса виновника не видно. Монитор
+измеряет задержку планирования и находит блокирующий код:
+
+* фоновая задача засыпает на ``interval`` и записывает, на сколько
+  позже ожидаемого она проснулась, в гистограмму
+  ``app_event_loop_lag_seconds``;
+* поток-watchdog проверяет, проснулась ли задача вовремя; если loop не
+  отвечает дольше ``threshold``, он снимает стек потока event loop через
+  ``sys._current_frames()`` — это стек корутины или callback, который
+  держит loop прямо сейчас;
+* проснувшись после блокировки, задача пишет warning с длительностью и
+  этим стеком.
+
+Стек снимается один раз за блокировку и только во время неё, поэтому в
+обычном режиме монитор стоит одного пробуждения за ``interval``.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import sys
+import threading
+import traceback
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from opentelemetry import metrics
+
+from app.core import constants
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from app.utils.configs import LoopMonitorConfig
+
+
+class LoopLagMonitor:
+    """Measures event loop lag and logs the code blocking the loop."""
+
+    def __init__(self, config: LoopMonitorConfig) -> None:
+        self.config = config
+        self.stalls = 0
+        self._expected = 0.0  # monotonic time the tick task should wake at
+        self._stack: str | None = None  # set by the watchdog during a stall
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._lag = metrics.get_meter(__name__).create_histogram(
+            name=constants.METRICS_LOOP_LAG_NAME,
+            description=constants.METRICS_LOOP_LAG_DESC,
+            unit=constants.METRICS_LOOP_LAG_UNIT,
+        )
+
+    def start(self) -> None:
+        """Start monitoring the running event loop."""
+        if self._task is not None:
+            return
+        self._expected = monotonic() + self.config.interval
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(
+            self._tick(), name="loop-lag-monitor"
+        )
+        self._watchdog = threading.Thread(
+            target=self._watch,
+            args=(threading.get_ident(),),
+            name="loop-watchdog",
+            daemon=True,
+        )
+        self._watchdog.start()
+
+    async def aclose(self) -> None:
+        """Stop the tick task and the watchdog thread."""
+        task, self._task = self._task, None
+        watchdog, self._watchdog = self._watchdog, None
+        self._stop.set()
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if watchdog is not None:
+            watchdog.join()
+
+    async def _tick(self) -> None:
+        interval = self.config.interval
+        while True:
+            self._expected = monotonic() + interval
+            await asyncio.sleep(interval)
+            lag = max(0.0, monotonic() - self._expected)
+            # A stack captured for a stall that ended before the threshold
+            # belongs to no one, so it is cleared on every tick
+            stack, self._stack = self._stack, None
+            self._lag.record(lag)
+            if lag >= self.config.threshold:
+                self.stalls += 1
+                logger.warning(
+                    "Event loop blocked for {lag_ms:.1f} ms; "
+                    "stack of the blocking code:\n{stack}",
+                    lag_ms=lag * 1000,
+                    stack=stack or "not captured",
+                )
+
+    def _watch(self, loop_thread: int) -> None:
+        threshold = self.config.threshold
+        while not self._stop.wait(threshold / 2):
+            if (
+                self._stack is not None
+                or monotonic() - self._expected < threshold
+            ):
+                continue
+            frame = sys._current_frames().get(loop_thread)  # noqa: SLF001
+            if frame is not None:
+                self._stack = "".join(
+                    traceback.format_stack(frame, limit=self.config.stack_depth)
+                )
+            del frame
+
+
+async def init_loop_monitor(
+    config: LoopMonitorConfig,
+) -> AsyncGenerator[LoopLagMonitor | None, None]:
+    """Resource initializer: monitors the loop running the lifespan."""
+    if not config.enabled:
+        yield None
+        return
+    monitor = LoopLagMonitor(config)
+    monitor.start()
+    try:
+        yield monitor
+    finally:
+        await monitor.aclose()
@@ -0,0 +1,254 @@
+"""
+Memory profiling middleware based on tracemalloc.
+
+CPU-профиль не объясняет рост RSS воркера, поэтому отдельный режим
+снимает снимки ``tracemalloc`` вокруг выбранных запросов (каждый
+``sample_every``-й на маршрутах ``routes``) и считает:
+
+* net — сколько памяти запрос выделил и не освободил к своему концу;
+* peak — пик отслеживаемой памяти над уровнем начала запроса;
+* места аллокаций по строкам исходников (top ``top_n``).
+
+Трассировка включается только на время профилируемого запроса, поэтому
+остальные запросы не платят за ``tracemalloc``, а снимок в конце запроса
+содержит лишь его аллокации и дешёв. Одновременно профилируется один
+запрос; аллокации параллельных корутин event loop за это время тоже
+попадут в профиль — как и у ``cprofile``, это цена простоты. Если
+``tracemalloc`` уже включён извне (``PYTHONTRACEMALLOC``), профиль
+считается как разница двух снимков.
+
+Снимки пишутся в ``profiles/`` рядом с ``.prof`` файлами с тем же
+именованием и расширением ``.tracemalloc`` (``tracemalloc.Snapshot.load``).
+"""
+from __future__ import annotations
+
+import tracemalloc
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from app.infrastructure.observability.memory_store import AllocationSite
+from app.infrastructure.observability.memory_store import StoredMemoryProfile
+from app.infrastructure.observability.profiling import BackgroundWriter
+from app.infrastructure.observability.profiling import Capture
+from app.infrastructure.observability.profiling import RequestSelector
+from app.infrastructure.observability.route_profiles import route_name
+
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp
+    from starlette.types import Message
+    from starlette.types import Receive
+    from starlette.types import Scope
+    from starlette.types import Send
+
+    from app.infrastructure.observability.memory_store import (
+        MemoryProfileStore,
+    )
+    from app.utils.configs import MemoryProfilingConfig
+
+# Аллокации самого tracemalloc и импорт-машинерии — шум
+_FILTERS = (
+    tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__),
+    tracemalloc.Filter(
+        inclusive=False, filename_pattern="<frozen importlib._bootstrap>"
+    ),
+    tracemalloc.Filter(inclusive=False, filename_pattern="<unknown>"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class MemorySample:
+    """Snapshots of one request, processed by the writer thread."""
+
+    snapshot: tracemalloc.Snapshot
+    baseline: tracemalloc.Snapshot | None  # set when traced externally
+    net_bytes: int
+    peak_bytes: int
+
+
+def allocation_sites(
+    snapshot: tracemalloc.Snapshot,
+    baseline: tracemalloc.Snapshot | None,
+    limit: int,
+) -> tuple[AllocationSite, ...]:
+    """
+    Source lines holding the most memory allocated during a request.
+
+    Args:
+        snapshot: Snapshot taken when the request ended.
+        baseline: Snapshot taken when it started, None if tracing started
+            with the request.
+        limit: Number of sites to return.
+
+    Returns:
+        Sites sorted by size, largest first.
+    """
+    snapshot = snapshot.filter_traces(_FILTERS)
+    if baseline is None:
+        sites = [
+            AllocationSite(
+                file=stat.traceback[0].filename,
+                line=stat.traceback[0].lineno,
+                size=stat.size,
+                count=stat.count,
+            )
+            for stat in snapshot.statistics("lineno")
+        ]
+    else:
+        diffs = snapshot.compare_to(baseline.filter_traces(_FILTERS), "lineno")
+        sites = [
+            AllocationSite(
+                file=diff.traceback[0].filename,
+                line=diff.traceback[0].lineno,
+                size=diff.size_diff,
+                count=diff.count_diff,
+            )
+            for diff in diffs
+            if diff.size_diff
+        ]
+    sites.sort(key=lambda site: site.size, reverse=True)
+    return tuple(sites[:limit])
+
+
+class MemoryProfileWriter(BackgroundWriter[MemorySample]):
+    """Stores, writes and logs memory profiles."""
+
+    def __init__(
+        self, config: MemoryProfilingConfig, store: MemoryProfileStore
+    ) -> None:
+        super().__init__("memory-profile-writer", config.max_pending_writes)
+        self.config = config
+        self._store = store
+
+    def _write(self, job: MemorySample, capture: Capture) -> None:
+        profile = StoredMemoryProfile(
+            id=self._store.next_id(),
+            method=capture.method,
+            path=capture.path,
+            route=capture.route,
+            captured_at=capture.captured_at,
+            duration=capture.duration,
+            net_bytes=job.net_bytes,
+            peak_bytes=job.peak_bytes,
+            sites=allocation_sites(
+                job.snapshot, job.baseline, self.config.top_n
+            ),
+        )
+        self._store.add(profile)
+
+        filepath = None
+        if self.config.write_files:
+            filepath = (
+                Path(self.config.output_dir) / f"{profile.name}.tracemalloc"
+            )
+            job.snapshot.dump(str(filepath))
+        sites = "\n".join(
+            f"{site.size:>12} B {site.count:>8} blocks  "
+            f"{site.file}:{site.line}"
+            for site in profile.sites
+        )
+        logger.info(
+            "Memory profile #{id} for {method} {path}: net {net} B, "
+            "peak {peak} B, saved to {filepath}:\n{sites}",
+            id=profile.id,
+            method=capture.method,
+            path=capture.path,
+            net=profile.net_bytes,
+            peak=profile.peak_bytes,
+            filepath=filepath or "memory",
+            sites=sites,
+        )
+
+
+class MemoryProfilingMiddleware:
+    """Pure ASGI middleware taking tracemalloc snapshots around requests."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        config: MemoryProfilingConfig,
+        store: MemoryProfileStore,
+    ) -> None:
+        self.app = app
+        self.config = config
+        if config.write_files:
+            Path(config.output_dir).mkdir(parents=True, exist_ok=True)
+        self._writer = MemoryProfileWriter(config, store)
+        self._selected = RequestSelector(config.routes, config.sample_every)
+        self._busy = False
+        logger.info(
+            "Memory profiling enabled: 1 in {every} requests",
+            every=config.sample_every,
+        )
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] == "lifespan":
+            await self.app(scope, receive, self._close_on_shutdown(send))
+            return
+        if (
+            scope["type"] != "http"
+            or self._busy
+            or not self._selected(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+        await self._profile(scope, receive, send)
+
+    async def _profile(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        self._busy = True
+        external = tracemalloc.is_tracing()
+        baseline = None
+        if external:
+            baseline = tracemalloc.take_snapshot()
+        else:
+            tracemalloc.start(self.config.frames)
+        tracemalloc.reset_peak()
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        captured_at = datetime.now(UTC)
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            if not external:
+                tracemalloc.stop()
+            self._busy = False
+            self._writer.submit(
+                MemorySample(
+                    snapshot=snapshot,
+                    baseline=baseline,
+                    net_bytes=current_bytes - start_bytes,
+                    peak_bytes=peak_bytes - start_bytes,
+                ),
+                Capture(
+                    method=scope["method"],
+                    path=scope["path"],
+                    route=route_name(scope),
+                    captured_at=captured_at,
+                    duration=perf_counter() - started,
+                    keep=True,
+                ),
+            )
+
+    def _close_on_shutdown(self, send: Send) -> Send:
+        async def wrapped(message: Message) -> None:
+            if message["type"] == "lifespan.shutdown.complete":
+                self.close()
+            await send(message)
+
+        return wrapped
+
+    def close(self) -> None:
+        """Flush pending memory profiles."""
+        self._writer.close()
@@ -0,0 +1,145 @@
+"""
+Bounded in-memory store of request memory profiles.
+
+Хранит последние ``MEMORY_PROFILING.RING_SIZE`` профилей и сводку по
+маршрутам: сколько запросов профилировано, сколько памяти они оставили
+живой (net) и какой был пик. Места аллокаций суммируются по строкам
+исходников — их число ограничено объёмом кода, а не числом запросов.
+Запись идёт из потока ``memory-profile-writer``, чтение — из admin
+endpoint, поэтому доступ к сводке под блокировкой.
+"""
+from __future__ import annotations
+
+import itertools
+import threading
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+@dataclass(frozen=True, slots=True)
+class AllocationSite:
+    """Memory still allocated by a source line when the request ended."""
+
+    file: str
+    line: int
+    size: int  # bytes, negative when the line freed more than allocated
+    count: int  # blocks
+
+
+@dataclass(frozen=True, slots=True)
+class StoredMemoryProfile:
+    id: int
+    method: str
+    path: str
+    route: str
+    captured_at: datetime
+    duration: float  # seconds
+    net_bytes: int  # allocated and not freed during the request
+    peak_bytes: int  # traced memory peak above the start of the request
+    sites: tuple[AllocationSite, ...]  # top allocation sites by size
+
+    @property
+    def name(self) -> str:
+        stamp = self.captured_at.strftime("%Y%m%d_%H%M%S_%f")
+        path_safe = self.path.replace("/", "_").strip("_") or "root"
+        return f"{stamp}_{self.method}_{path_safe}"
+
+
+@dataclass(frozen=True, slots=True)
+class RouteMemorySummary:
+    route: str
+    requests: int
+    net_bytes: int
+    peak_bytes: int
+    sites: tuple[AllocationSite, ...]  # top allocation sites by size
+
+
+@dataclass(slots=True)
+class RouteMemory:
+    """Memory profiles of one route, summed."""
+
+    route: str
+    requests: int = 0
+    net_bytes: int = 0
+    peak_bytes: int = 0  # max over the requests
+    sites: dict[tuple[str, int], list[int]] = field(default_factory=dict)
+
+    def add(self, profile: StoredMemoryProfile) -> None:
+        self.requests += 1
+        self.net_bytes += profile.net_bytes
+        self.peak_bytes = max(self.peak_bytes, profile.peak_bytes)
+        for site in profile.sites:
+            totals = self.sites.setdefault((site.file, site.line), [0, 0])
+            totals[0] += site.size
+            totals[1] += site.count
+
+    def summary(self, limit: int) -> RouteMemorySummary:
+        ranked = sorted(
+            self.sites.items(), key=lambda item: item[1][0], reverse=True
+        )
+        return RouteMemorySummary(
+            route=self.route,
+            requests=self.requests,
+            net_bytes=self.net_bytes,
+            peak_bytes=self.peak_bytes,
+            sites=tuple(
+                AllocationSite(file=file, line=line, size=size, count=count)
+                for (file, line), (size, count) in ranked[:limit]
+            ),
+        )
+
+
+class MemoryProfileStore:
+    """Ring buffer of recent memory profiles and per-route totals."""
+
+    def __init__(self, size: int) -> None:
+        self._profiles: deque[StoredMemoryProfile] = deque(maxlen=size)
+        self._routes: dict[str, RouteMemory] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def add(self, profile: StoredMemoryProfile) -> None:
+        with self._lock:
+            self._profiles.append(profile)
+            route = self._routes.get(profile.route)
+            if route is None:
+                route = self._routes[profile.route] = RouteMemory(
+                    profile.route
+                )
+            route.add(profile)
+
+    def routes(self, limit: int) -> list[RouteMemorySummary]:
+        """
+        Per-route totals with their top allocation sites.
+
+        Args:
+            limit: Allocation sites per route.
+
+        Returns:
+            Routes with the most memory left allocated first.
+        """
+        with self._lock:
+            summary = [
+                route.summary(limit) for route in self._routes.values()
+            ]
+        summary.sort(key=lambda route: route.net_bytes, reverse=True)
+        return summary
+
+    def list(self) -> list[StoredMemoryProfile]:
+        """Profiles, newest first."""
+        return list(reversed(self._profiles))
+
+    def get(self, profile_id: int) -> StoredMemoryProfile | None:
+        for profile in list(self._profiles):
+            if profile.id == profile_id:
+                return profile
+        return None
@@ -6,6 +6,7 @@ from opentelemetry.sdk.metrics.view import ExplicitBucketHistogramAggregation
 from opentelemetry.sdk.metrics.view import View
 from opentelemetry.sdk.resources import Resource
 
+from app.core.constants import METRICS_LOOP_LAG_NAME
 from app.core.constants import METRICS_REQUEST_DURATION_NAME
 from app.core.containers import AppContainer
 from app.utils.configs import MetricsConfig
@@ -31,6 +32,13 @@ def setup_metrics(
             boundaries=duration_buckets
         ),
     )
+    # Loop lag is mostly sub-millisecond: request buckets would hide it
+    loop_lag_view = View(
+        instrument_name=METRICS_LOOP_LAG_NAME,
+        aggregation=ExplicitBucketHistogramAggregation(
+            boundaries=metrics_config.loop_lag_buckets
+        ),
+    )
 
     # Create a MeterProvider with the reader and view
     provider = MeterProvider(
@@ -40,7 +48,7 @@ def setup_metrics(
             }
         ),
         metric_readers=[reader],
-        views=[view],
+        views=[view, loop_lag_view],
     )
 
     # Set the global MeterProvider
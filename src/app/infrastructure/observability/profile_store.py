@@ -0,0 +1,80 @@
+"""
+Bounded in-memory store of recent request profiles.
+
+Кольцевой буфер на ``PROFILING.RING_SIZE`` профилей: новые вытесняют
+самые старые. Запись идёт из потока ``profile-writer``, чтение — из
+admin endpoint в event loop; ``deque.append`` и копирование в список
+атомарны под GIL, поэтому отдельная блокировка не нужна.
+"""
+from __future__ import annotations
+
+import itertools
+import marshal
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from app.infrastructure.observability.speedscope import call_tree_stacks
+from app.infrastructure.observability.speedscope import sampled_stacks
+
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from app.infrastructure.observability.sampler import FunctionKey
+    from app.infrastructure.observability.sampler import StatsEntry
+    from app.infrastructure.observability.speedscope import WeightedStacks
+
+
+@dataclass(frozen=True, slots=True)
+class StoredProfile:
+    id: int
+    method: str
+    path: str
+    captured_at: datetime
+    duration: float  # seconds, request wall time
+    mode: str
+    stats: dict[FunctionKey, StatsEntry]
+    # Raw samples of the sampling mode, None for cProfile
+    samples: dict[tuple[FunctionKey, ...], int] | None = None
+    interval: float | None = None
+
+    @property
+    def name(self) -> str:
+        stamp = self.captured_at.strftime("%Y%m%d_%H%M%S_%f")
+        path_safe = self.path.replace("/", "_").strip("_") or "root"
+        return f"{stamp}_{self.method}_{path_safe}"
+
+    def to_pstats(self) -> bytes:
+        """Serialize stats in the ``.prof`` format of ``pstats``."""
+        return marshal.dumps(self.stats)
+
+    def stacks(self) -> WeightedStacks:
+        """Weighted call stacks: exact samples or a reconstructed tree."""
+        if self.samples is not None and self.interval is not None:
+            return sampled_stacks(self.samples, self.interval)
+        return call_tree_stacks(self.stats)
+
+
+class ProfileStore:
+    """Ring buffer of the most recent profiles."""
+
+    def __init__(self, size: int) -> None:
+        self._profiles: deque[StoredProfile] = deque(maxlen=size)
+        self._ids = itertools.count(1)
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def add(self, profile: StoredProfile) -> None:
+        self._profiles.append(profile)
+
+    def list(self) -> list[StoredProfile]:
+        """Profiles, newest first."""
+        return list(reversed(self._profiles))
+
+    def get(self, profile_id: int) -> StoredProfile | None:
+        for profile in list(self._profiles):
+            if profile.id == profile_id:
+                return profile
+        return None
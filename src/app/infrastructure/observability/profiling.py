@@ -1,89 +1,363 @@
-"""cProfile middleware for FastAPI."""
+"""
+Request profiling middleware.
+
+Режимы:
+
+* ``cprofile`` — детерминированный cProfile. В процессе может быть
+  активен только один профайлер, поэтому одновременно профилируется
+  один запрос; параллельные запросы проходят без профиля (их вызовы и
+  так попадают в активный профиль).
+* ``sampling`` — статистический сэмплер стеков (``StackSampler``) с
+  частотой ``sampling_hz``; накладные расходы не зависят от числа
+  вызовов, поэтому режим можно держать включённым в production.
+
+Какие запросы профилировать, решают триггеры: каждый N-й запрос
+(``sample_every``) на маршрутах из ``routes`` или любой запрос с
+заголовком ``trigger_header``. Профиль сохраняется, только если запрос
+длился не меньше ``latency_threshold`` (запрошенные заголовком —
+всегда): так в кольцевой буфер ``ProfileStore`` и в ``profiles/``
+попадают медленные выбросы, а не тысячи быстрых запросов. При этом все
+профилированные запросы, включая быстрые, суммируются по маршрутам в
+``RouteProfileAggregator`` — это общая картина под нагрузкой.
+
+Оба режима пишут обычные ``.prof`` файлы. Форматирование pstats и запись
+на диск выполняются в фоновом потоке, а не в event loop.
+"""
 from __future__ import annotations
 
 import cProfile
 import io
 import pstats
+import queue
+import sys
+import threading
+from abc import ABC
+from abc import abstractmethod
+from dataclasses import dataclass
+from datetime import UTC
 from datetime import datetime
 from pathlib import Path
+from time import monotonic
+from time import perf_counter
 from typing import TYPE_CHECKING
+from typing import cast
 
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.middleware.base import RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+
+from app.infrastructure.observability.profile_store import StoredProfile
+from app.infrastructure.observability.route_profiles import route_name
+from app.infrastructure.observability.sampler import SampledProfile
+from app.infrastructure.observability.sampler import StackSampler
+from app.infrastructure.observability.sampler import function_key
+from app.infrastructure.observability.speedscope import call_tree_stacks
+from app.infrastructure.observability.speedscope import sampled_stacks
+from app.utils.configs import ProfilingMode
+
 
 if TYPE_CHECKING:
-    from fastapi import FastAPI
+    from starlette.types import ASGIApp
+    from starlette.types import Message
+    from starlette.types import Receive
+    from starlette.types import Scope
+    from starlette.types import Send
 
+    from app.infrastructure.observability.profile_store import ProfileStore
+    from app.infrastructure.observability.route_profiles import (
+        RouteProfileAggregator,
+    )
+    from app.infrastructure.observability.sampler import FunctionKey
+    from app.infrastructure.observability.sampler import StatsEntry
     from app.utils.configs import ProfilingConfig
 
+    ProfileSource = cProfile.Profile | SampledProfile
+
+
+@dataclass(frozen=True, slots=True)
+class Capture:
+    """Request a profile was captured for."""
+
+    method: str
+    path: str
+    route: str
+    captured_at: datetime
+    duration: float  # seconds
+    keep: bool  # store the profile, not only aggregate it
+
+
+class RequestSelector:
+    """Route allowlist and 1-in-N sampling of requests."""
+
+    def __init__(self, routes: list[str], every: int) -> None:
+        self._routes = tuple(routes)
+        self._every = every
+        self._seen = 0
+
+    def __call__(self, path: str) -> bool:
+        if self._routes and not path.startswith(self._routes):
+            return False
+        self._seen += 1
+        return self._seen % self._every == 0
+
 
-class ProfilingMiddleware(BaseHTTPMiddleware):
+class BackgroundWriter[Job](ABC):
     """
-    Middleware that profiles each request using cProfile.
-    
-    Saves profile stats to files and logs top functions.
+    Processes captured profiles on a background thread.
+
+    The queue is bounded: when the disk can't keep up, new profiles are
+    dropped instead of piling up in memory. Subclasses implement
+    ``_write`` for their kind of job.
     """
 
-    def __init__(self, app: FastAPI, config: ProfilingConfig) -> None:
-        super().__init__(app)
-        self.config = config
-        self._ensure_output_dir()
-        logger.info(
-            "Profiling enabled. Profiles will be saved to: {output}".format(
-                output=config.output_dir
-            )
+    def __init__(self, name: str, max_pending: int) -> None:
+        self.dropped = 0
+        self._queue: queue.Queue[tuple[Job, Capture] | None] = queue.Queue(
+            maxsize=max_pending
         )
+        self._thread = threading.Thread(
+            target=self._run, name=name, daemon=True
+        )
+        self._thread.start()
 
-    def _ensure_output_dir(self) -> None:
-        """Create output directory if it doesn't exist."""
-        Path(self.config.output_dir).mkdir(parents=True, exist_ok=True)
+    def submit(self, job: Job, capture: Capture) -> None:
+        try:
+            self._queue.put_nowait((job, capture))
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(
+                "Profile of {method} {path} dropped: writer queue is full",
+                method=capture.method,
+                path=capture.path,
+            )
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        """Profile the request and save stats."""
-        if not self.config.enabled:
-            return await call_next(request)
+    def close(self) -> None:
+        """Write pending profiles and stop the thread."""
+        self._queue.put(None)
+        self._thread.join()
 
-        profiler = cProfile.Profile()
-        profiler.enable()
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            try:
+                self._write(*item)
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to write profile")
+
+    @abstractmethod
+    def _write(self, job: Job, capture: Capture) -> None:
+        """Process one job; runs on the writer thread."""
 
-        try:
-            response = await call_next(request)
-        finally:
-            profiler.disable()
 
-        # Generate stats
-        self._log_stats(profiler, request)
-        self._save_stats(profiler, request)
+class ProfileWriter(BackgroundWriter["ProfileSource"]):
+    """Stores, aggregates, writes and logs CPU profiles."""
 
-        return response
+    def __init__(
+        self,
+        config: ProfilingConfig,
+        store: ProfileStore,
+        aggregator: RouteProfileAggregator | None = None,
+    ) -> None:
+        super().__init__("profile-writer", config.max_pending_writes)
+        self.config = config
+        self._store = store
+        self._aggregator = aggregator
+
+    def _write(self, source: ProfileSource, capture: Capture) -> None:
+        source.create_stats()
+        # typeshed declares cProfile timings as int
+        raw_stats = cast("dict[FunctionKey, StatsEntry]", source.stats)
+        if not raw_stats:
+            if capture.keep:
+                # pstats can't load an empty profile: the request only awaited
+                logger.info(
+                    "Profile of {method} {path} ({duration:.3f}s) is empty: "
+                    "no on-CPU samples",
+                    method=capture.method,
+                    path=capture.path,
+                    duration=capture.duration,
+                )
+            return
+
+        samples: dict[tuple[FunctionKey, ...], int] | None = None
+        interval = None
+        if isinstance(source, SampledProfile):
+            interval = source.interval
+            samples = {}
+            for stack, count in source.samples.items():
+                key = tuple(function_key(code) for code in stack)
+                samples[key] = samples.get(key, 0) + count
+
+        if self._aggregator is not None:
+            stacks = (
+                sampled_stacks(samples, interval)
+                if samples is not None and interval is not None
+                else call_tree_stacks(raw_stats)
+            )
+            self._aggregator.add(capture.route, stacks, monotonic())
+        if not capture.keep:
+            return
 
-    def _log_stats(self, profiler: cProfile.Profile, request: Request) -> None:
-        """Log top functions to console."""
         stream = io.StringIO()
-        stats = pstats.Stats(profiler, stream=stream)
+        # SampledProfile quacks like cProfile.Profile (create_stats/stats)
+        stats = pstats.Stats(source, stream=stream)  # type: ignore[arg-type]
+        profile = StoredProfile(
+            id=self._store.next_id(),
+            method=capture.method,
+            path=capture.path,
+            captured_at=capture.captured_at,
+            duration=capture.duration,
+            mode=self.config.mode.value,
+            stats=stats.stats,  # type: ignore[attr-defined]
+            samples=samples,
+            interval=interval,
+        )
+        self._store.add(profile)
+
+        filepath = None
+        if self.config.write_files:
+            filepath = Path(self.config.output_dir) / f"{profile.name}.prof"
+            stats.dump_stats(filepath)
         stats.sort_stats(self.config.sort_by)
         stats.print_stats(self.config.top_n)
+        logger.info(
+            "Profile #{id} for {method} {path} ({duration:.3f}s) "
+            "saved to {filepath}:\n{stats}",
+            id=profile.id,
+            method=capture.method,
+            path=capture.path,
+            duration=capture.duration,
+            filepath=filepath or "memory",
+            stats=stream.getvalue(),
+        )
+
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware that profiles HTTP requests."""
 
+    def __init__(
+        self,
+        app: ASGIApp,
+        config: ProfilingConfig,
+        store: ProfileStore,
+        aggregator: RouteProfileAggregator | None = None,
+    ) -> None:
+        self.app = app
+        self.config = config
+        if config.write_files:
+            Path(config.output_dir).mkdir(parents=True, exist_ok=True)
+        self._writer = ProfileWriter(config, store, aggregator)
+        self._aggregate = aggregator is not None
+        self._sampler: StackSampler | None = None
+        if config.mode is ProfilingMode.SAMPLING:
+            self._sampler = StackSampler(config.sampling_hz)
+            self._sampler.start()
+        self._cprofile_busy = False
+        self._selected = RequestSelector(config.routes, config.sample_every)
+        self._trigger_header = config.trigger_header.lower().encode("latin-1")
         logger.info(
-            "Profile for %s %s:\n%s",
-            request.method,
-            request.url.path,
-            stream.getvalue(),
+            "Profiling enabled ({mode}). Profiles will be saved to: {output}",
+            mode=config.mode.value,
+            output=config.output_dir,
+        )
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] == "lifespan":
+            await self.app(scope, receive, self._close_on_shutdown(send))
+            return
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        forced = self._forced(scope)
+        if not forced and not self._selected(scope["path"]):
+            await self.app(scope, receive, send)
+        elif self._sampler is not None:
+            await self._profile_sampled(scope, receive, send, forced=forced)
+        elif self._cprofile_busy:
+            await self.app(scope, receive, send)
+        else:
+            await self._profile_deterministic(
+                scope, receive, send, forced=forced
+            )
+
+    def _forced(self, scope: Scope) -> bool:
+        """Whether the request asks for a profile with the trigger header."""
+        if not self._trigger_header:
+            return False
+        return any(
+            name == self._trigger_header for name, _ in scope["headers"]
         )
 
-    def _save_stats(self, profiler: cProfile.Profile, request: Request) -> None:
-        """Save profile stats to file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        path_safe = request.url.path.replace("/", "_").strip("_") or "root"
-        filename = f"{timestamp}_{request.method}_{path_safe}.prof"
-        filepath = Path(self.config.output_dir) / filename
+    async def _profile_sampled(
+        self, scope: Scope, receive: Receive, send: Send, *, forced: bool
+    ) -> None:
+        assert self._sampler is not None  # noqa: S101
+        captured_at = datetime.now(UTC)
+        started = perf_counter()
+        frame = sys._getframe()  # noqa: SLF001
+        try:
+            with self._sampler.record(frame) as profile:
+                del frame  # a frame referencing itself would outlive the call
+                await self.app(scope, receive, send)
+        finally:
+            # Submitted after the frame is unregistered, so the sampler
+            # thread no longer adds samples while the writer reads them
+            self._submit(profile, scope, captured_at, started, forced=forced)
+
+    async def _profile_deterministic(
+        self, scope: Scope, receive: Receive, send: Send, *, forced: bool
+    ) -> None:
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:  # another tool (debugger, coverage) owns the hook
+            await self.app(scope, receive, send)
+            return
+        self._cprofile_busy = True
+        captured_at = datetime.now(UTC)
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.disable()
+            self._cprofile_busy = False
+            self._submit(profiler, scope, captured_at, started, forced=forced)
+
+    def _submit(
+        self,
+        source: ProfileSource,
+        scope: Scope,
+        captured_at: datetime,
+        started: float,
+        *,
+        forced: bool,
+    ) -> None:
+        duration = perf_counter() - started
+        keep = forced or duration >= self.config.latency_threshold
+        if not keep and not self._aggregate:
+            return
+        self._writer.submit(
+            source,
+            Capture(
+                method=scope["method"],
+                path=scope["path"],
+                route=route_name(scope),
+                captured_at=captured_at,
+                duration=duration,
+                keep=keep,
+            ),
+        )
 
-        profiler.dump_stats(str(filepath))
-        logger.debug("Profile saved to %s", filepath)
+    def _close_on_shutdown(self, send: Send) -> Send:
+        async def wrapped(message: Message) -> None:
+            if message["type"] == "lifespan.shutdown.complete":
+                self.close()
+            await send(message)
 
+        return wrapped
 
+    def close(self) -> None:
+        """Stop sampling and flush pending profiles."""
+        if self._sampler is not None:
+            self._sampler.stop()
+        self._writer.close()
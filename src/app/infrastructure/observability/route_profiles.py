@@ -0,0 +1,146 @@
+"""
+Per-route aggregation of request profiles over a rolling time window.
+
+Отдельный ``.prof`` показывает один запрос; чтобы увидеть, где маршрут
+тратит время под реальной нагрузкой, взвешенные стеки всех
+профилированных запросов суммируются по маршруту (``POST
+/v1/answer/generate`` — шаблон пути, а не конкретный URL). Окно разбито
+на ``buckets`` корзин: по мере движения времени вытесняется целая
+старейшая корзина, поэтому память ограничена числом различных стеков, а
+не числом запросов.
+"""
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+
+from app.infrastructure.observability.speedscope import merge_stacks
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from starlette.types import Scope
+
+    from app.infrastructure.observability.sampler import FunctionKey
+    from app.infrastructure.observability.speedscope import WeightedStacks
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_name(scope: Scope) -> str:
+    """
+    Aggregation key of a request: method and route template.
+
+    Must be called after the router handled the request, which stores the
+    matched route in the scope. Unmatched paths share one key, so probing
+    random URLs can't grow the number of routes.
+    """
+    route = scope.get("route")
+    path = getattr(route, "path", None) or UNMATCHED_ROUTE
+    return f"{scope['method']} {path}"
+
+
+@dataclass(slots=True)
+class RouteProfile:
+    """Aggregated profile of one route."""
+
+    route: str
+    requests: int = 0
+    stacks: WeightedStacks = field(default_factory=dict)
+
+    @property
+    def seconds(self) -> float:
+        """Total profiled time of the route."""
+        return sum(self.stacks.values())
+
+
+@dataclass(slots=True)
+class _Bucket:
+    index: int
+    requests: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    stacks: dict[str, dict[tuple[FunctionKey, ...], float]] = field(
+        default_factory=lambda: defaultdict(lambda: defaultdict(float))
+    )
+
+
+class RouteProfileAggregator:
+    """
+    Sums weighted stacks per route over the last ``window`` seconds.
+
+    Written by the ``profile-writer`` thread and read by the admin
+    endpoint, so every access goes under a lock.
+    """
+
+    def __init__(self, window: float, buckets: int) -> None:
+        self.window = window
+        self._span = window / buckets
+        self._size = buckets
+        self._buckets: deque[_Bucket] = deque()
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        route: str,
+        stacks: Mapping[tuple[FunctionKey, ...], float],
+        now: float,
+    ) -> None:
+        """
+        Account one profiled request.
+
+        Args:
+            route: Route name from ``route_name``.
+            stacks: Weighted stacks of the request, seconds.
+            now: Current monotonic time.
+        """
+        index = int(now // self._span)
+        with self._lock:
+            self._evict(index)
+            if not self._buckets or self._buckets[-1].index != index:
+                self._buckets.append(_Bucket(index))
+            bucket = self._buckets[-1]
+            bucket.requests[route] += 1
+            merged = bucket.stacks[route]
+            for stack, weight in stacks.items():
+                merged[stack] += weight
+
+    def snapshot(self, now: float) -> dict[str, RouteProfile]:
+        """
+        Aggregated profiles of routes seen within the window.
+
+        Args:
+            now: Current monotonic time.
+
+        Returns:
+            Route name -> profile, heaviest routes first.
+        """
+        with self._lock:
+            self._evict(int(now // self._span))
+            buckets = list(self._buckets)
+            requests: dict[str, int] = defaultdict(int)
+            for bucket in buckets:
+                for route, count in bucket.requests.items():
+                    requests[route] += count
+            profiles = [
+                RouteProfile(
+                    route=route,
+                    requests=count,
+                    stacks=merge_stacks(
+                        bucket.stacks[route]
+                        for bucket in buckets
+                        if route in bucket.stacks
+                    ),
+                )
+                for route, count in requests.items()
+            ]
+        profiles.sort(key=lambda profile: profile.seconds, reverse=True)
+        return {profile.route: profile for profile in profiles}
+
+    def _evict(self, index: int) -> None:
+        oldest = index - self._size + 1
+        while self._buckets and self._buckets[0].index < oldest:
+            self._buckets.popleft()
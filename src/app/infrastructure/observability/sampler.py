@@ -0,0 +1,199 @@
+"""
+Statistical stack sampler for low-overhead request profiling.
+
+Фоновый поток с частотой ``hz`` снимает стеки всех потоков через
+``sys._current_frames()``. Сэмпл засчитывается запросу, если в стеке есть
+кадр, зарегистрированный через ``StackSampler.record`` (кадр корутины
+ProfilingMiddleware): корутина запроса видна в стеке event loop только
+пока она выполняется, поэтому профиль показывает on-CPU время запроса, а
+не ожидание I/O. Поток выбран вместо SIGPROF: обработчики сигналов в
+Python выполняются только в главном потоке, а воркер Granian может
+крутить event loop в другом.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from types import CodeType
+    from types import FrameType
+
+# Стек от корня к листу
+Stack = tuple["CodeType", ...]
+# Ключ функции в формате pstats: (filename, firstlineno, name)
+FunctionKey = tuple[str, int, str]
+# (cc, nc, tt, ct) — примитивные вызовы, все вызовы, собственное и
+# кумулятивное время
+Timings = tuple[int, int, float, float]
+StatsEntry = tuple[int, int, float, float, dict[FunctionKey, Timings]]
+
+
+def function_key(code: CodeType) -> FunctionKey:
+    """Identify a function the way ``pstats`` does."""
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+def sampled_stats(
+    samples: Counter[Stack], interval: float
+) -> dict[FunctionKey, StatsEntry]:
+    """
+    Convert stack samples into a ``pstats`` stats dictionary.
+
+    Each sample stands for ``interval`` seconds. Call counts are sample
+    counts; cumulative time of a recursive function is counted once per
+    sample.
+
+    Args:
+        samples: Number of samples per root-first stack.
+        interval: Sampling interval, seconds.
+
+    Returns:
+        Mapping ``function -> (cc, nc, tt, ct, callers)`` as produced by
+        ``cProfile.Profile.create_stats``.
+    """
+    entries: dict[FunctionKey, list[float]] = {}
+    edges: dict[FunctionKey, dict[FunctionKey, list[float]]] = {}
+    for stack, count in samples.items():
+        elapsed = count * interval
+        keys = [function_key(code) for code in stack]
+        seen: set[FunctionKey] = set()
+        seen_edges: set[tuple[FunctionKey, FunctionKey]] = set()
+        for depth, key in enumerate(keys):
+            entry = entries.setdefault(key, [0, 0, 0.0, 0.0])
+            entry[1] += count
+            leaf = depth == len(keys) - 1
+            if leaf:
+                entry[2] += elapsed
+            if key not in seen:
+                seen.add(key)
+                entry[0] += count
+                entry[3] += elapsed
+            if depth == 0:
+                continue
+            caller = keys[depth - 1]
+            edge = edges.setdefault(key, {}).setdefault(
+                caller, [0, 0, 0.0, 0.0]
+            )
+            edge[1] += count
+            if leaf:
+                edge[2] += elapsed
+            if (caller, key) not in seen_edges:
+                seen_edges.add((caller, key))
+                edge[0] += count
+                edge[3] += elapsed
+
+    return {
+        key: (
+            *_timings(entry),
+            {
+                caller: _timings(edge)
+                for caller, edge in edges.get(key, {}).items()
+            },
+        )
+        for key, entry in entries.items()
+    }
+
+
+def _timings(values: list[float]) -> Timings:
+    cc, nc, tt, ct = values
+    return int(cc), int(nc), tt, ct
+
+
+class SampledProfile:
+    """
+    Stack samples of one request.
+
+    Implements ``create_stats``/``stats`` like ``cProfile.Profile``, so
+    ``pstats.Stats(profile)`` loads it and ``dump_stats`` writes a regular
+    ``.prof`` file.
+    """
+
+    __slots__ = ("interval", "samples", "stats")
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.samples: Counter[Stack] = Counter()
+        self.stats: dict[FunctionKey, StatsEntry] = {}
+
+    def create_stats(self) -> None:
+        self.stats = sampled_stats(self.samples, self.interval)
+
+
+class StackSampler:
+    """Background thread sampling stacks of registered request frames."""
+
+    def __init__(self, hz: int) -> None:
+        self.interval = 1.0 / hz
+        self._active: dict[int, tuple[FrameType, SampledProfile]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    @contextmanager
+    def record(
+        self, frame: FrameType
+    ) -> Generator[SampledProfile, None, None]:
+        """
+        Attribute samples taken under ``frame`` to a new profile.
+
+        Args:
+            frame: Frame of the coroutine handling the request.
+
+        Yields:
+            Profile filled by the sampler thread until the block exits.
+        """
+        profile = SampledProfile(self.interval)
+        key = id(frame)
+        with self._lock:
+            self._active[key] = (frame, profile)
+        try:
+            yield profile
+        finally:
+            with self._lock:
+                del self._active[key]
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            if not self._active:
+                continue
+            frames = sys._current_frames()  # noqa: SLF001
+            with self._lock:
+                for ident, frame in frames.items():
+                    if ident != own_ident:
+                        self._sample(frame)
+
+    def _sample(self, frame: FrameType | None) -> None:
+        active = self._active
+        stack: list[CodeType] = []
+        while frame is not None:
+            registered = active.get(id(frame))
+            if registered is not None and registered[0] is frame:
+                if not stack:
+                    return
+                stack.reverse()
+                registered[1].samples[tuple(stack)] += 1
+                return
+            stack.append(frame.f_code)
+            frame = frame.f_back
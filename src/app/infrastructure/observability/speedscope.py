@@ -0,0 +1,283 @@
+"""
+Call stacks from profiles and their speedscope / collapsed-stack export.
+
+Любой профиль сводится к «взвешенным стекам»: ``стек от корня -> время
+в секундах, проведённое в листе этого стека``. Для сэмплированных
+профилей это просто сэмплы. Для cProfile стеки восстанавливаются по рёбрам
+caller -> callee из ``pstats``: время узла делится между вызываемыми
+пропорционально кумулятивному времени рёбер. Так суммарное время каждой
+ветви сохраняется, а не удваивается, как при построении «стеков» из
+прямых вызывающих. pstats не хранит полный контекст вызова, поэтому для
+функций с несколькими вызывающими разбиение по путям приблизительное.
+
+Взвешенные стеки экспортируются в speedscope (sampled или evented),
+collapsed-формат flamegraph.pl и двухколоночный diff difffolded.pl.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from dataclasses import field
+from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+
+    from app.infrastructure.observability.sampler import FunctionKey
+    from app.infrastructure.observability.sampler import StatsEntry
+
+# Стек от корня к листу и время, проведённое в листе (секунды)
+WeightedStacks = dict[tuple["FunctionKey", ...], float]
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+# Вызываемые функции и кумулятивное время ребра caller -> callee
+CallGraph = dict["FunctionKey", list[tuple["FunctionKey", float]]]
+# Ветви короче этой доли общего времени не раскрываются
+MIN_FRACTION = 1e-4
+MAX_DEPTH = 256
+
+
+class ProfileKind(StrEnum):
+    """Speedscope profile types."""
+
+    SAMPLED = "sampled"  # stacks with weights, merged in the sandwich view
+    EVENTED = "evented"  # open/close events, a time-ordered flame chart
+
+
+def call_tree_stacks(
+    stats: Mapping[FunctionKey, StatsEntry],
+    min_fraction: float = MIN_FRACTION,
+    max_depth: int = MAX_DEPTH,
+) -> WeightedStacks:
+    """
+    Reconstruct weighted call stacks from ``pstats`` data.
+
+    Args:
+        stats: Mapping ``function -> (cc, nc, tt, ct, callers)``.
+        min_fraction: Branches below this share of total time are folded
+            into their caller's own time.
+        max_depth: Deeper branches are folded the same way.
+
+    Returns:
+        Weighted stacks whose total equals the total profiled time.
+    """
+    roots, callees = _call_graph(stats)
+    total = sum(stats[root][3] for root in roots)
+    threshold = total * min_fraction
+    stacks: WeightedStacks = defaultdict(float)
+    pending: list[tuple[tuple[FunctionKey, ...], float]] = [
+        ((root,), stats[root][3]) for root in roots
+    ]
+    while pending:
+        path, budget = pending.pop()
+        node = path[-1]
+        _, _, tt, ct, _ = stats[node]
+        scale = min(budget / ct, 1.0) if ct > 0 else 0.0
+        own = tt * scale
+        for callee, edge_ct in callees.get(node, ()):
+            share = edge_ct * scale
+            if callee in path or share <= 0:
+                continue  # recursion is already accounted in ct
+            if share < threshold or len(path) >= max_depth:
+                own += share
+            else:
+                pending.append(((*path, callee), share))
+        if own > 0:
+            stacks[path] += own
+    return dict(stacks)
+
+
+def _call_graph(
+    stats: Mapping[FunctionKey, StatsEntry],
+) -> tuple[list[FunctionKey], CallGraph]:
+    """Roots (no known callers) and callee edges with cumulative time."""
+    callees: CallGraph = defaultdict(list)
+    roots: list[FunctionKey] = []
+    for key, (_, _, _, _, callers) in stats.items():
+        known = [caller for caller in callers if caller in stats]
+        if not known:
+            roots.append(key)
+        for caller in known:
+            timing = callers[caller]
+            # profile.Profile stores call counts instead of timings
+            edge_ct = timing[3] if isinstance(timing, tuple) else 0.0
+            callees[caller].append((key, edge_ct))
+    return roots, callees
+
+
+def sampled_stacks(
+    samples: Mapping[tuple[FunctionKey, ...], int], interval: float
+) -> WeightedStacks:
+    """Weighted stacks of a sampled profile."""
+    return {stack: count * interval for stack, count in samples.items()}
+
+
+def merge_stacks(profiles: Iterable[Mapping[Any, float]]) -> WeightedStacks:
+    """Sum weighted stacks of several profiles."""
+    merged: WeightedStacks = defaultdict(float)
+    for stacks in profiles:
+        for stack, weight in stacks.items():
+            merged[stack] += weight
+    return dict(merged)
+
+
+def self_times(
+    stacks: Mapping[tuple[FunctionKey, ...], float],
+) -> dict[FunctionKey, float]:
+    """Own time of every function: weights of stacks it is the leaf of."""
+    times: dict[FunctionKey, float] = defaultdict(float)
+    for stack, weight in stacks.items():
+        times[stack[-1]] += weight
+    return dict(times)
+
+
+def frame_name(key: FunctionKey) -> str:
+    filename, line, name = key
+    if not filename or filename == "~":
+        return name  # built-in function
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+def collapsed_stacks(stacks: Mapping[tuple[FunctionKey, ...], float]) -> str:
+    """
+    Render stacks in the collapsed format of flamegraph.pl.
+
+    Values are integer microseconds; stacks shorter than a microsecond
+    are dropped.
+    """
+    lines = []
+    for stack, weight in sorted(stacks.items()):
+        micros = round(weight * 1_000_000)
+        if micros > 0:
+            frames = ";".join(frame_name(key) for key in stack)
+            lines.append(f"{frames} {micros}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def collapsed_diff(
+    before: Mapping[tuple[FunctionKey, ...], float],
+    after: Mapping[tuple[FunctionKey, ...], float],
+) -> str:
+    """
+    Render two stack sets in the two-column format of difffolded.pl.
+
+    ``flamegraph.pl`` draws such input as a differential flamegraph:
+    widths follow ``after``, colours show the change from ``before``.
+    """
+    lines = []
+    for stack in sorted(before.keys() | after.keys()):
+        old = round(before.get(stack, 0.0) * 1_000_000)
+        new = round(after.get(stack, 0.0) * 1_000_000)
+        if old > 0 or new > 0:
+            frames = ";".join(frame_name(key) for key in stack)
+            lines.append(f"{frames} {old} {new}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+@dataclass(slots=True)
+class _Node:
+    total: float = 0.0
+    own: float = 0.0
+    children: dict[FunctionKey, _Node] = field(default_factory=dict)
+
+
+def _call_tree(stacks: Mapping[tuple[FunctionKey, ...], float]) -> _Node:
+    root = _Node()
+    for stack, weight in stacks.items():
+        node = root
+        node.total += weight
+        for key in stack:
+            node = node.children.setdefault(key, _Node())
+            node.total += weight
+        node.own += weight
+    return root
+
+
+def _events(
+    node: _Node,
+    frame: Callable[[FunctionKey], int],
+    at: float,
+    events: list[dict[str, Any]],
+) -> float:
+    # Heaviest callees first, own time after them
+    children = sorted(
+        node.children.items(), key=lambda item: item[1].total, reverse=True
+    )
+    for key, child in children:
+        index = frame(key)
+        events.append({"type": "O", "frame": index, "at": at})
+        at = _events(child, frame, at, events) + child.own
+        events.append({"type": "C", "frame": index, "at": at})
+    return at
+
+
+def speedscope_document(
+    profiles: Mapping[str, Mapping[tuple[FunctionKey, ...], float]],
+    name: str,
+    kind: ProfileKind = ProfileKind.SAMPLED,
+) -> dict[str, Any]:
+    """
+    Build a speedscope file with one profile per entry.
+
+    Args:
+        profiles: Profile name -> weighted stacks in seconds.
+        name: Name of the whole file.
+        kind: Sampled profiles keep stacks as they are; evented ones lay
+            the call tree out in time, heaviest callees first.
+
+    Returns:
+        Document following the speedscope file format schema.
+    """
+    frames: list[dict[str, Any]] = []
+    index: dict[FunctionKey, int] = {}
+
+    def frame(key: FunctionKey) -> int:
+        position = index.get(key)
+        if position is None:
+            position = index[key] = len(frames)
+            filename, line, function = key
+            frames.append({"name": function, "file": filename, "line": line})
+        return position
+
+    rendered = []
+    for profile_name, stacks in profiles.items():
+        if kind is ProfileKind.EVENTED:
+            events: list[dict[str, Any]] = []
+            end = _events(_call_tree(stacks), frame, 0.0, events)
+            rendered.append({
+                "type": "evented",
+                "name": profile_name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": end,
+                "events": events,
+            })
+            continue
+        samples = []
+        weights = []
+        for stack, weight in stacks.items():
+            samples.append([frame(key) for key in stack])
+            weights.append(weight)
+        rendered.append({
+            "type": "sampled",
+            "name": profile_name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights,
+        })
+
+    return {
+        "$schema": SPEEDSCOPE_SCHEMA,
+        "name": name,
+        "activeProfileIndex": 0,
+        "shared": {"frames": frames},
+        "profiles": rendered,
+    }
@@ -6,11 +6,147 @@ from typing import TYPE_CHECKING
 from loguru import logger as loguru_logger
 
 from app.domain.interfaces.observability import ILoggingStrategy
+from app.utils.configs import PayloadLoggingConfig
 
 if TYPE_CHECKING:
+    from loguru import Logger
+
     from app.utils.serializer import ItemSerializer
 
 
+def _level_no(level: str) -> int:
+    """Severity of a loguru level; unknown names enable everything."""
+    try:
+        return loguru_logger.level(level).no
+    except ValueError:
+        return 0
+
+
+class _EventLogger:
+    """
+    Logger of one monitored event.
+
+    The event is bound once; when INFO is below the configured level,
+    start and success records are skipped together with serialization
+    of arguments and result.
+
+    Serializing payloads of every call can cost more than the call
+    itself, so arguments and result are logged only for 1 in
+    ``sample_every`` successful calls (chosen at start, so ``_SEND``
+    carries the arguments too), for calls slower than ``slow_threshold``
+    and for errors. The JSON of a record's payload is bounded by
+    ``max_bytes``: arguments are serialized first, the result gets the
+    rest of the budget. Payloads are bound as ``RawJSON``: encoded once
+    and written by the log format without another serialization.
+    """
+
+    __slots__ = (
+        "_bound",
+        "_calls",
+        "_error_enabled",
+        "_event_name",
+        "_info_enabled",
+        "_max_bytes",
+        "_sample_every",
+        "_serializer",
+        "_slow_threshold",
+        "_use_log_args",
+        "_use_log_result",
+    )
+
+    def __init__(
+        self,
+        serializer: ItemSerializer,
+        event_name: str,
+        *,
+        use_log_args: bool,
+        use_log_result: bool,
+        min_level: int,
+        sample_every: int,
+        slow_threshold: float,
+        max_bytes: int,
+    ) -> None:
+        self._serializer = serializer
+        self._event_name = event_name
+        self._use_log_args = use_log_args
+        self._use_log_result = use_log_result
+        self._info_enabled = _level_no("INFO") >= min_level
+        self._error_enabled = _level_no("ERROR") >= min_level
+        self._sample_every = sample_every
+        self._slow_threshold = slow_threshold
+        self._max_bytes = max_bytes
+        self._calls = 0
+        self._bound: Logger = loguru_logger.bind(event=event_name)
+
+    def _bind_args(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[Logger, int]:
+        """Logger with the arguments bound and the budget left for result."""
+        if not self._use_log_args:
+            return self._bound, self._max_bytes
+        budget = self._max_bytes
+        args_json = self._serializer.encode_bounded(args, budget)
+        budget = max(budget - len(args_json.data), 0)
+        kwargs_json = self._serializer.encode_bounded(kwargs, budget)
+        bound_logger = self._bound.bind(args=args_json, kwargs=kwargs_json)
+        return bound_logger, max(budget - len(kwargs_json.data), 0)
+
+    def log_start(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        """
+        Log ``_SEND``.
+
+        Returns:
+            None when INFO is disabled, otherwise the logger and the budget
+            left for the result, None if the call isn't sampled.
+        """
+        if not self._info_enabled:
+            return None
+        self._calls += 1
+        if self._calls % self._sample_every:
+            self._bound.info("{}_SEND", self._event_name)
+            return self._bound, None
+        bound_logger, budget = self._bind_args(args, kwargs)
+        bound_logger.info("{}_SEND", self._event_name)
+        return bound_logger, budget
+
+    def log_success(
+        self,
+        result: Any,
+        context: Any,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        duration: float,
+    ) -> None:
+        if context is None:
+            return
+        bound_logger, budget = context
+        if budget is None:
+            if duration < self._slow_threshold:
+                bound_logger.info("{}_SUCCESS", self._event_name)
+                return
+            bound_logger, budget = self._bind_args(args, kwargs)
+        if self._use_log_result:
+            result_json = self._serializer.encode_bounded(result, budget)
+            bound_logger = bound_logger.bind(result=result_json)
+        bound_logger.info("{}_SUCCESS", self._event_name)
+
+    def log_error(
+        self,
+        exc: Exception,
+        context: Any,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        if not self._error_enabled:
+            return
+        if context is None or context[1] is None:
+            # Arguments of unsampled calls are bound only on error
+            bound_logger, _ = self._bind_args(args, kwargs)
+        else:
+            bound_logger = context[0]
+        bound_logger.exception("{}_ERROR", self._event_name)
+
+
 class StandardLoggingStrategy(ILoggingStrategy):
     """
     Logging strategy using Loguru.
@@ -18,8 +154,15 @@ class StandardLoggingStrategy(ILoggingStrategy):
     Uses ItemSerializer for fast, non-recursive serialization.
     """
 
-    def __init__(self, serializer: ItemSerializer) -> None:
+    def __init__(
+        self,
+        serializer: ItemSerializer,
+        level: str = "DEBUG",
+        payload: PayloadLoggingConfig | None = None,
+    ) -> None:
         self._serializer = serializer
+        self._min_level = _level_no(level)
+        self._payload = payload or PayloadLoggingConfig()
 
     def log_start(
         self,
@@ -34,8 +177,9 @@ class StandardLoggingStrategy(ILoggingStrategy):
             context["args"] = self._serializer.serialize(args)
             context["kwargs"] = self._serializer.serialize(kwargs)
 
-        loguru_logger.bind(**context).info("{}_SEND", event_name)
-        return loguru_logger.bind(**context)
+        bound_logger = loguru_logger.bind(**context)
+        bound_logger.info("{}_SEND", event_name)
+        return bound_logger
 
     def log_success(
         self,
@@ -53,3 +197,31 @@ class StandardLoggingStrategy(ILoggingStrategy):
     def log_error(self, event_name: str, exc: Exception, context: Any) -> None:
         bound_logger = context
         bound_logger.exception("{}_ERROR", event_name)
+
+    def event_logger(
+        self,
+        event_name: str,
+        *,
+        use_log_args: bool,
+        use_log_result: bool,
+        sample_every: int | None = None,
+        slow_threshold: float | None = None,
+        max_bytes: int | None = None,
+    ) -> _EventLogger:
+        payload = self._payload
+        return _EventLogger(
+            self._serializer,
+            event_name,
+            use_log_args=use_log_args,
+            use_log_result=use_log_result,
+            min_level=self._min_level,
+            sample_every=(
+                payload.sample_every if sample_every is None else sample_every
+            ),
+            slow_threshold=(
+                payload.slow_threshold
+                if slow_threshold is None
+                else slow_threshold
+            ),
+            max_bytes=payload.max_bytes if max_bytes is None else max_bytes,
+        )
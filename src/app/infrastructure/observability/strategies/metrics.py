@@ -1,9 +1,49 @@
+from typing import Any
+
 from opentelemetry import metrics
 
 from app.core import constants
 from app.domain.interfaces.observability import IMetricsStrategy
 
 
+class _EventMetrics:
+    """Metrics of one monitored event; attribute sets are built once."""
+
+    __slots__ = (
+        "_error_attributes",
+        "_event_attributes",
+        "_event_name",
+        "_request_duration",
+        "_requests_total",
+        "_success_attributes",
+    )
+
+    def __init__(
+        self, requests_total: Any, request_duration: Any, event_name: str
+    ) -> None:
+        self._requests_total = requests_total
+        self._request_duration = request_duration
+        self._event_name = event_name
+        self._event_attributes = {"event": event_name}
+        self._success_attributes = {"event": event_name, "status": "success"}
+        self._error_attributes: dict[str, dict[str, str]] = {}
+
+    def record_success(self, duration: float) -> None:
+        self._requests_total.add(1, self._success_attributes)
+        self._request_duration.record(duration, self._event_attributes)
+
+    def record_error(self, duration: float, error_type: str) -> None:
+        attributes = self._error_attributes.get(error_type)
+        if attributes is None:
+            attributes = self._error_attributes[error_type] = {
+                "event": self._event_name,
+                "status": "error",
+                "error_type": error_type,
+            }
+        self._requests_total.add(1, attributes)
+        self._request_duration.record(duration, self._event_attributes)
+
+
 class OpentelemetryMetricsStrategy(IMetricsStrategy):
     """Metrics strategy using OpenTelemetry."""
 
@@ -33,3 +73,8 @@ class OpentelemetryMetricsStrategy(IMetricsStrategy):
 
         self.requests_total.add(1, attributes)
         self.request_duration.record(duration, {"event": event_name})
+
+    def event_metrics(self, event_name: str) -> _EventMetrics:
+        return _EventMetrics(
+            self.requests_total, self.request_duration, event_name
+        )
@@ -1,3 +1,5 @@
+import functools
+from collections.abc import Callable
 from typing import Any
 
 from opentelemetry import trace
@@ -18,3 +20,10 @@ class OpentelemetryTracingStrategy(ITracingStrategy):
         # Context manager handles ending, but if we needed manual control:
         # span.end()
         pass
+
+    def span_factory(self, name: str) -> Callable[[], Any]:
+        return functools.partial(
+            self.tracer.start_as_current_span,
+            name,
+            kind=trace.SpanKind.INTERNAL,
+        )
@@ -0,0 +1,91 @@
+"""
+Anytime search primitives.
+
+Позволяют репозиториям укладываться в дедлайн запроса: вместо ошибки по
+таймауту возвращается лучшее из найденного с флагом partial.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from app.domain.entities.search_result import SearchResult
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+
+    from app.domain.entities.deadline import Deadline
+    from app.domain.entities.document import Document
+
+
+async def scan_segments_until(
+    deadline: Deadline,
+    segments: Iterable[Callable[[], Iterable[Document]]],
+) -> SearchResult:
+    """
+    Sequentially scan local segments with early termination.
+
+    Between segments control is yielded to the event loop, so a long scan
+    does not starve concurrent requests.
+
+    Args:
+        deadline: Absolute deadline of the request.
+        segments: Callables, each searching one segment (or shard).
+
+    Returns:
+        Documents from all scanned segments; partial if some were skipped.
+    """
+    documents: list[Document] = []
+    for segment in segments:
+        if deadline.expired:
+            return SearchResult(documents=documents, partial=True)
+        documents.extend(segment())
+        await asyncio.sleep(0)
+    return SearchResult(documents=documents)
+
+
+async def gather_until(
+    deadline: Deadline,
+    legs: Mapping[str, Awaitable[SearchResult]],
+) -> tuple[dict[str, SearchResult], list[str], dict[str, BaseException]]:
+    """
+    Run search legs concurrently and drop the ones that miss the deadline.
+
+    A leg that raised is dropped as well: one broken retrieval leg must not
+    fail the answer that the other legs produced in time.
+
+    Args:
+        deadline: Absolute deadline of the request.
+        legs: Named awaitables (shards, retrieval legs).
+
+    Returns:
+        Results of finished legs, names of dropped (cancelled) legs and
+        exceptions of failed legs.
+    """
+    tasks = {name: asyncio.ensure_future(leg) for name, leg in legs.items()}
+    if not tasks:
+        return {}, [], {}
+
+    _, pending = await asyncio.wait(
+        tasks.values(), timeout=deadline.remaining()
+    )
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    finished: dict[str, SearchResult] = {}
+    dropped: list[str] = []
+    failed: dict[str, BaseException] = {}
+    for name, task in tasks.items():
+        if task in pending:
+            dropped.append(name)
+        elif (exc := task.exception()) is not None:
+            failed[name] = exc
+        else:
+            finished[name] = task.result()
+    return finished, dropped, failed
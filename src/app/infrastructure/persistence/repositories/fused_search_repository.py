@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import numpy as np
+from loguru import logger
+
+from app.domain.entities.document_batch import DocumentBatch
+from app.domain.entities.search_result import SearchResult
+from app.domain.interfaces.search_repository import ISearchRepository
+from app.infrastructure.persistence.repositories.anytime import gather_until
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+
+    from app.domain.entities.deadline import Deadline
+    from app.domain.entities.document import Document
+
+DEFAULT_RRF_K = 60
+
+
+class FusedSearchRepository(ISearchRepository):
+    """
+    Hybrid retrieval: опрашивает несколько ветвей поиска (BM25, dense, ...)
+    и объединяет выдачу через Reciprocal Rank Fusion.
+
+    При нехватке времени медленная ветвь отбрасывается, как и упавшая с
+    ошибкой, а результат помечается как partial.
+    """
+
+    def __init__(
+        self,
+        legs: Mapping[str, ISearchRepository],
+        rrf_k: int = DEFAULT_RRF_K,
+    ) -> None:
+        self._legs = dict(legs)
+        self._rrf_k = rrf_k
+
+    @property
+    def generation(self) -> int:
+        # Generations only grow, so the sum changes whenever any leg's does
+        return sum(leg.generation for leg in self._legs.values())
+
+    async def search(self, query: str) -> list[Document]:
+        rankings = await asyncio.gather(
+            *(leg.search(query=query) for leg in self._legs.values())
+        )
+        return fuse_rrf(rankings, rrf_k=self._rrf_k)
+
+    async def search_batch(self, query: str) -> DocumentBatch:
+        batches = await asyncio.gather(
+            *(leg.search_batch(query=query) for leg in self._legs.values())
+        )
+        return fuse_rrf_batch(batches, rrf_k=self._rrf_k)
+
+    async def search_until(
+        self, query: str, deadline: Deadline
+    ) -> SearchResult:
+        finished, dropped, failed = await gather_until(
+            deadline,
+            {
+                name: leg.search_until(query=query, deadline=deadline)
+                for name, leg in self._legs.items()
+            },
+        )
+        if dropped:
+            logger.warning(
+                "Search legs dropped by deadline: {legs}", legs=dropped
+            )
+        for name, exc in failed.items():
+            logger.opt(exception=exc).error(
+                "Search leg {leg} failed, answering without it", leg=name
+            )
+
+        return SearchResult(
+            documents=fuse_rrf(
+                (result.documents for result in finished.values()),
+                rrf_k=self._rrf_k,
+            ),
+            partial=bool(dropped or failed)
+            or any(result.partial for result in finished.values()),
+        )
+
+
+def fuse_rrf(
+    rankings: Iterable[list[Document]], rrf_k: int = DEFAULT_RRF_K
+) -> list[Document]:
+    """
+    Reciprocal Rank Fusion of several ranked lists.
+
+    Documents are identified by text; the first seen instance is kept.
+
+    Args:
+        rankings: Ranked document lists, best first.
+        rrf_k: Smoothing constant of RRF.
+
+    Returns:
+        Fused ranking, best first.
+    """
+    scores: dict[str, float] = {}
+    documents: dict[str, Document] = {}
+    for ranking in rankings:
+        for rank, document in enumerate(ranking, start=1):
+            scores[document.text] = (
+                scores.get(document.text, 0.0) + 1.0 / (rrf_k + rank)
+            )
+            documents.setdefault(document.text, document)
+
+    ordered = sorted(scores, key=scores.__getitem__, reverse=True)
+    return [documents[key] for key in ordered]
+
+
+def fuse_rrf_batch(
+    batches: Iterable[DocumentBatch], rrf_k: int = DEFAULT_RRF_K
+) -> DocumentBatch:
+    """
+    Vectorized Reciprocal Rank Fusion over columnar rankings.
+
+    Documents are identified by id; the first seen row is kept and ties
+    are broken by first appearance, as in ``fuse_rrf``.
+
+    Args:
+        batches: Ranked batches, best first.
+        rrf_k: Smoothing constant of RRF.
+
+    Returns:
+        Fused batch, best first, with RRF scores.
+    """
+    batches = list(batches)
+    combined = DocumentBatch.concat(batches)
+    if not len(combined):
+        return combined
+
+    ranks = np.concatenate(
+        [np.arange(1, len(batch) + 1) for batch in batches]
+    )
+    _, first, inverse = np.unique(
+        combined.ids, return_index=True, return_inverse=True
+    )
+    scores = np.bincount(inverse, weights=1.0 / (rrf_k + ranks))
+    order = np.lexsort((first, -scores))
+    return combined.take(first[order]).with_scores(scores[order])
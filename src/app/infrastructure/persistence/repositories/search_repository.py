@@ -1,11 +1,41 @@
-from app.domain.entities.document import Document
-
+import functools
 
+from app.domain.entities.deadline import Deadline
+from app.domain.entities.document import Document
+from app.domain.entities.document_batch import DocumentBatch
+from app.domain.entities.search_result import SearchResult
 from app.domain.interfaces.search_repository import ISearchRepository
+from app.infrastructure.persistence.repositories.anytime import (
+    scan_segments_until,
+)
 
 
 class SearchRepository(ISearchRepository):
+    def __init__(self, generation: int = 0) -> None:
+        self._generation = generation
+
+    @property
+    def generation(self) -> int:
+        # Mock index never changes; a real index bumps it on every refresh
+        return self._generation
+
     async def search(self, query: str) -> list[Document]:  # noqa: PLR6301
+        return self._search_segment(query)
+
+    async def search_batch(self, query: str) -> DocumentBatch:  # noqa: PLR6301
+        return DocumentBatch.from_documents(self._search_segment(query))
+
+    async def search_until(
+        self, query: str, deadline: Deadline
+    ) -> SearchResult:
+        # Mock index consists of a single segment; a real local index
+        # would pass one callable per segment/shard here.
+        return await scan_segments_until(
+            deadline, [functools.partial(self._search_segment, query)]
+        )
+
+    @staticmethod
+    def _search_segment(query: str) -> list[Document]:
         # Mock implementation
         # In a real scenario, this would call OpenSearch/Elasticsearch
         return [
@@ -0,0 +1,343 @@
+"""
+Persistent on-disk embedding cache shared between worker processes.
+
+Файлы в каталоге кэша:
+
+* ``vectors.f32`` — append-only матрица float32, по строке на вектор;
+* ``index.bin`` — заголовок и хэш-таблица с открытой адресацией
+  (линейное пробирование): ключ BLAKE2 (128 бит) -> номер строки + 1;
+* ``lock`` — файл для межпроцессной блокировки записи (flock).
+
+Чтение идёт из memory-mapped файлов без блокировок: слот публикуется
+записью номера строки после ключа, а строка вектора дописывается до
+публикации слота. При росте таблица перестраивается в новый файл и
+атомарно подменяется (os.replace); остальные процессы замечают смену
+inode и переоткрывают индекс.
+"""
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from app.domain.interfaces.embedder import IEmbedder
+
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from app.utils.configs import EmbeddingConfig
+
+_MAGIC = b"EVAEMBIX"
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("dimension", "<u8"),
+        ("capacity", "<u8"),
+        ("count", "<u8"),
+    ]
+)
+_SLOT_DTYPE = np.dtype([("k0", "<u8"), ("k1", "<u8"), ("row", "<u8")])
+_MAX_LOAD = 0.7
+_KEY_SIZE = 16
+
+
+class EmbeddingCache:
+    """Content-addressed vector store backed by memory-mapped files."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        dimension: int,
+        namespace: str = "",
+        initial_capacity: int = 1024,
+    ) -> None:
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._dimension = dimension
+        # Keyed BLAKE2: vectors of different models never collide
+        self._namespace = namespace.encode()[: hashlib.blake2b.MAX_KEY_SIZE]
+        self._index_path = self._dir / "index.bin"
+        self._vectors_path = self._dir / "vectors.f32"
+        self._row_bytes = dimension * np.dtype(np.float32).itemsize
+        self._lock = threading.Lock()
+        self._lock_fd = os.open(self._dir / "lock", os.O_RDWR | os.O_CREAT)
+
+        with self._exclusive():
+            if not self._index_path.exists():
+                self._write_index(self._index_path, initial_capacity, [])
+            self._vectors_path.touch()
+        self._open_index()
+        self._vectors: np.memmap | None = None
+
+    def __len__(self) -> int:
+        return int(self._header["count"])
+
+    def key(self, text: str) -> bytes:
+        """Content hash of the text within the cache namespace."""
+        return hashlib.blake2b(
+            text.encode(), digest_size=_KEY_SIZE, key=self._namespace
+        ).digest()
+
+    def get_many(
+        self, keys: Sequence[bytes]
+    ) -> list[NDArray[np.float32] | None]:
+        """
+        Look up vectors without taking the inter-process lock.
+
+        Args:
+            keys: Keys produced by ``key()``.
+
+        Returns:
+            Vector (read-only view) per key, None for misses.
+        """
+        with self._lock:
+            rows = [self._find(key) for key in keys]
+            # The index might have been rebuilt by another worker
+            if any(row is None for row in rows) and self._sync_index():
+                rows = [self._find(key) for key in keys]
+            vectors = self._vectors_for(max((r for r in rows if r), default=0))
+            return [None if row is None else vectors[row - 1] for row in rows]
+
+    def put_many(
+        self, keys: Sequence[bytes], vectors: NDArray[np.float32]
+    ) -> None:
+        """
+        Append vectors for keys that are not cached yet.
+
+        Args:
+            keys: Keys produced by ``key()``.
+            vectors: Matrix of shape (len(keys), dimension).
+        """
+        matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+        with self._lock, self._exclusive():
+            self._sync_index()
+            fresh = [
+                position
+                for position, key in enumerate(keys)
+                if self._find(key) is None
+            ]
+            if not fresh:
+                return
+
+            required = int(self._header["count"]) + len(fresh)
+            capacity = int(self._header["capacity"])
+            if required > capacity * _MAX_LOAD:
+                while required > capacity * _MAX_LOAD:
+                    capacity *= 2
+                self._grow(capacity)
+
+            with self._vectors_path.open("r+b") as file:
+                # Drop the tail of an append torn by a crash so new rows
+                # start at a row boundary
+                size = file.seek(0, os.SEEK_END)
+                first_row = size // self._row_bytes
+                if size % self._row_bytes:
+                    file.truncate(first_row * self._row_bytes)
+                    file.seek(first_row * self._row_bytes)
+                file.write(matrix[fresh].tobytes())
+                file.flush()
+                os.fsync(file.fileno())
+
+            for offset, position in enumerate(fresh):
+                self._insert(keys[position], first_row + offset + 1)
+            self._header["count"] += len(fresh)
+
+    def close(self) -> None:
+        self._index_mmap.flush()
+        self._vectors = None
+        os.close(self._lock_fd)
+
+    # --- Index ---
+    def _find(self, key: bytes) -> int | None:
+        k0, k1 = _split(key)
+        slots = self._slots
+        capacity = len(slots)
+        position = k0 % capacity
+        for _ in range(capacity):
+            slot = slots[position]
+            row = int(slot["row"])
+            if not row:
+                return None
+            if slot["k0"] == k0 and slot["k1"] == k1:
+                return row
+            position = (position + 1) % capacity
+        return None
+
+    def _insert(self, key: bytes, row: int) -> None:
+        _place(self._slots, key, row)
+
+    def _grow(self, capacity: int) -> None:
+        occupied = self._slots[self._slots["row"] != 0]
+        tmp_path = self._index_path.with_suffix(".tmp")
+        self._write_index(tmp_path, capacity, occupied)
+        self._index_mmap.flush()
+        tmp_path.replace(self._index_path)
+        self._open_index()
+
+    def _write_index(
+        self,
+        path: Path,
+        capacity: int,
+        occupied: Sequence[np.void] | np.ndarray,
+    ) -> None:
+        size = _HEADER_DTYPE.itemsize + capacity * _SLOT_DTYPE.itemsize
+        with path.open("wb") as file:
+            file.truncate(size)
+        mmap = np.memmap(path, dtype=np.uint8, mode="r+", shape=(size,))
+        header = mmap[: _HEADER_DTYPE.itemsize].view(_HEADER_DTYPE)[0]
+        header["magic"] = _MAGIC
+        header["dimension"] = self._dimension
+        header["capacity"] = capacity
+        header["count"] = len(occupied)
+        slots = mmap[_HEADER_DTYPE.itemsize :].view(_SLOT_DTYPE)
+        for slot in occupied:
+            _place(
+                slots,
+                int(slot["k0"]).to_bytes(8, "little")
+                + int(slot["k1"]).to_bytes(8, "little"),
+                int(slot["row"]),
+            )
+        mmap.flush()
+
+    def _open_index(self) -> None:
+        self._index_ino = self._index_path.stat().st_ino
+        self._index_mmap = np.memmap(self._index_path, dtype=np.uint8, mode="r+")
+        header = self._index_mmap[: _HEADER_DTYPE.itemsize].view(_HEADER_DTYPE)
+        self._header = header[0]
+        if bytes(self._header["magic"]) != _MAGIC:
+            msg = f"{self._index_path} is not an embedding cache index"
+            raise ValueError(msg)
+        if int(self._header["dimension"]) != self._dimension:
+            msg = (
+                f"Embedding cache dimension {int(self._header['dimension'])} "
+                f"does not match embedder dimension {self._dimension}"
+            )
+            raise ValueError(msg)
+        self._slots = self._index_mmap[_HEADER_DTYPE.itemsize :].view(
+            _SLOT_DTYPE
+        )
+
+    def _sync_index(self) -> bool:
+        """Reopen the index if another process replaced it."""
+        if self._index_path.stat().st_ino == self._index_ino:
+            return False
+        self._open_index()
+        return True
+
+    # --- Vectors ---
+    def _vectors_for(self, max_row: int) -> np.memmap:
+        if self._vectors is None or len(self._vectors) < max_row:
+            rows = self._vectors_path.stat().st_size // self._row_bytes
+            self._vectors = (
+                np.memmap(
+                    self._vectors_path,
+                    dtype=np.float32,
+                    mode="r",
+                    shape=(rows, self._dimension),
+                )
+                if rows
+                else None
+            )
+        return self._vectors  # type: ignore[return-value]
+
+    @contextmanager
+    def _exclusive(self) -> Generator[None, None, None]:
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+
+class CachedEmbedder(IEmbedder):
+    """Embedder decorator that computes only texts missing in the cache."""
+
+    def __init__(self, inner: IEmbedder, cache: EmbeddingCache) -> None:
+        self._inner = inner
+        self._cache = cache
+
+    @property
+    def dimension(self) -> int:
+        return self._inner.dimension
+
+    def embed_batch(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        keys = [self._cache.key(text) for text in texts]
+        cached = self._cache.get_many(keys)
+        result = np.empty((len(texts), self.dimension), dtype=np.float32)
+
+        misses: dict[bytes, list[int]] = {}
+        miss_texts: list[str] = []
+        for position, (key, vector) in enumerate(zip(keys, cached, strict=True)):
+            if vector is not None:
+                result[position] = vector
+                continue
+            if key not in misses:
+                misses[key] = []
+                miss_texts.append(texts[position])
+            misses[key].append(position)
+
+        if miss_texts:
+            computed = self._inner.embed_batch(miss_texts)
+            for vector, positions in zip(computed, misses.values(), strict=True):
+                result[positions] = vector
+            self._cache.put_many(list(misses), computed)
+        return result
+
+
+def init_embedding_cache(
+    config: EmbeddingConfig, namespace: str
+) -> Generator[EmbeddingCache | None, None, None]:
+    """
+    Resource initializer: opens the cache and closes it on shutdown.
+
+    Yields None when the disk backend is disabled, so the cache
+    directory is not created.
+    """
+    if config.cache_backend != "disk":
+        yield None
+        return
+    cache = EmbeddingCache(
+        config.cache_dir,
+        dimension=config.dimension,
+        namespace=namespace,
+        initial_capacity=config.cache_initial_capacity,
+    )
+    try:
+        yield cache
+    finally:
+        cache.close()
+
+
+def _split(key: bytes) -> tuple[int, int]:
+    return (
+        int.from_bytes(key[:8], "little"),
+        int.from_bytes(key[8:_KEY_SIZE], "little"),
+    )
+
+
+def _place(slots: np.ndarray, key: bytes, row: int) -> None:
+    k0, k1 = _split(key)
+    capacity = len(slots)
+    position = k0 % capacity
+    for _ in range(capacity):
+        if not slots[position]["row"]:
+            break
+        position = (position + 1) % capacity
+    else:
+        msg = f"Embedding cache index is full ({capacity} slots)"
+        raise RuntimeError(msg)
+    slot = slots[position]
+    slot["k0"] = k0
+    slot["k1"] = k1
+    # Row is published last: readers treat row == 0 as an empty slot
+    slot["row"] = row
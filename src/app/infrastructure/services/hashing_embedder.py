@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from app.domain.interfaces.embedder import IEmbedder
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+_TOKEN_RE = re.compile(r"\w+")
+_SIGN_BIT = 1 << 63
+
+
+class HashingEmbedder(IEmbedder):
+    """
+    Детерминированный embedder на feature hashing.
+
+    Каждый токен хэшируется (BLAKE2) в индекс и знак; вектор текста — сумма
+    знаков по индексам, нормированная по L2. Не требует модели и даёт
+    одинаковые векторы между процессами, поэтому подходит для тестов.
+    """
+
+    def __init__(self, dimension: int = 256) -> None:
+        self._dimension = dimension
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def embed_batch(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        rows: list[int] = []
+        columns: list[int] = []
+        signs: list[float] = []
+        for row, text in enumerate(texts):
+            for token in _TOKEN_RE.findall(text.lower()):
+                digest = int.from_bytes(
+                    hashlib.blake2b(token.encode(), digest_size=8).digest()
+                )
+                rows.append(row)
+                columns.append(digest % self._dimension)
+                signs.append(-1.0 if digest & _SIGN_BIT else 1.0)
+
+        # Single vectorized scatter-add and normalization for the batch
+        vectors = np.zeros((len(texts), self._dimension), dtype=np.float32)
+        np.add.at(vectors, (rows, columns), signs)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+from fastapi import Depends
+
+from app.presentation.api.admin.auth import require_admin_token
+from app.presentation.api.admin.endpoints import flamegraphs
+from app.presentation.api.admin.endpoints import memory
+from app.presentation.api.admin.endpoints import profiles
+
+
+def admin_endpoints() -> APIRouter:
+    # Every admin route requires the operator token
+    router = APIRouter(dependencies=[Depends(require_admin_token)])
+    router.include_router(flamegraphs.router)
+    router.include_router(memory.router)
+    router.include_router(profiles.router)
+    return router
@@ -0,0 +1,31 @@
+import hmac
+
+from dependency_injector.wiring import Provide
+from dependency_injector.wiring import inject
+from fastapi import Depends
+from fastapi import Request
+
+from app.core.containers import AppContainer
+from app.core.exceptions import UnauthorizedError
+from app.utils.configs import AdminConfig
+
+
+@inject
+def require_admin_token(
+    request: Request,
+    config: AdminConfig = Depends(
+        Provide[AppContainer.infra_container.admin_config]
+    ),
+) -> None:
+    """
+    Reject admin requests without the configured operator token.
+
+    Raises:
+        UnauthorizedError: If the token header is missing or wrong, or no
+            token is configured at all.
+    """
+    expected = config.token.get_secret_value().encode()
+    actual = request.headers.get(config.token_header, "").encode()
+    # compare_digest: the time of the check must not leak the token
+    if not expected or not hmac.compare_digest(actual, expected):
+        raise UnauthorizedError
@@ -0,0 +1,108 @@
+from enum import StrEnum
+from time import monotonic
+
+import orjson
+from dependency_injector.wiring import Provide
+from dependency_injector.wiring import inject
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import Response
+
+from app.core.containers import AppContainer
+from app.core.exceptions import NotFoundError
+from app.infrastructure.observability.route_profiles import (
+    RouteProfileAggregator,
+)
+from app.infrastructure.observability.speedscope import collapsed_stacks
+from app.infrastructure.observability.speedscope import speedscope_document
+from app.presentation.api.schemas.profiles import RouteProfileInfo
+from app.utils.serializer import AdvORJSONResponse
+
+
+router = APIRouter()
+
+
+class FlamegraphFormat(StrEnum):
+    COLLAPSED = "collapsed"
+    SPEEDSCOPE = "speedscope"
+
+
+@router.get(
+    "/flamegraphs",
+    tags=["admin"],
+    response_model=list[RouteProfileInfo],
+)
+@inject
+def list_flamegraphs(
+    aggregator: RouteProfileAggregator = Depends(
+        Provide[AppContainer.route_profiles]
+    ),
+) -> AdvORJSONResponse:
+    """Routes profiled within the rolling window, heaviest first."""
+    profiles = aggregator.snapshot(monotonic()).values()
+    return AdvORJSONResponse([
+        RouteProfileInfo(
+            route=profile.route,
+            requests=profile.requests,
+            seconds=profile.seconds,
+        )
+        for profile in profiles
+    ])
+
+
+@router.get(
+    "/flamegraphs/stacks",
+    tags=["admin"],
+    response_class=Response,
+    responses={200: {"content": {
+        "text/plain": {},
+        "application/json": {},
+    }}},
+)
+@inject
+def download_flamegraph(
+    route: str | None = None,
+    format: FlamegraphFormat = FlamegraphFormat.SPEEDSCOPE,  # noqa: A002
+    aggregator: RouteProfileAggregator = Depends(
+        Provide[AppContainer.route_profiles]
+    ),
+) -> Response:
+    """
+    Aggregated stacks of one route (``POST /v1/answer/generate``) or all.
+
+    Collapsed output of several routes starts every stack with the route
+    name, speedscope output has one profile per route.
+
+    Raises:
+        NotFoundError: The route wasn't profiled within the window.
+    """
+    profiles = aggregator.snapshot(monotonic())
+    if route is not None:
+        if route not in profiles:
+            msg = f"Route {route} has no profiles within the window"
+            raise NotFoundError(msg)
+        profiles = {route: profiles[route]}
+
+    if format is FlamegraphFormat.COLLAPSED:
+        if route is not None:
+            text = collapsed_stacks(profiles[route].stacks)
+        else:
+            text = "".join(
+                collapsed_stacks({
+                    (("", 0, name), *stack): weight
+                    for stack, weight in profile.stacks.items()
+                })
+                for name, profile in profiles.items()
+            )
+        return Response(content=text, media_type="text/plain")
+
+    document = speedscope_document(
+        {name: profile.stacks for name, profile in profiles.items()},
+        name=route or "routes",
+    )
+    filename = "routes.speedscope.json"
+    return Response(
+        content=orjson.dumps(document),
+        media_type="application/json",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
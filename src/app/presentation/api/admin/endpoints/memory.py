@@ -0,0 +1,80 @@
+from dependency_injector.wiring import Provide
+from dependency_injector.wiring import inject
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import Query
+
+from app.core.containers import AppContainer
+from app.core.exceptions import NotFoundError
+from app.infrastructure.observability.memory_store import AllocationSite
+from app.infrastructure.observability.memory_store import MemoryProfileStore
+from app.infrastructure.observability.memory_store import RouteMemorySummary
+from app.infrastructure.observability.memory_store import StoredMemoryProfile
+from app.presentation.api.schemas.memory import AllocationSiteInfo
+from app.presentation.api.schemas.memory import MemoryProfileInfo
+from app.presentation.api.schemas.memory import RouteMemoryInfo
+from app.utils.encoders import response_encoders
+from app.utils.serializer import AdvORJSONResponse
+
+
+router = APIRouter()
+
+response_encoders.register_entity(AllocationSite, AllocationSiteInfo)
+response_encoders.register_entity(StoredMemoryProfile, MemoryProfileInfo)
+response_encoders.register_entity(RouteMemorySummary, RouteMemoryInfo)
+
+
+@router.get(
+    "/memory/routes",
+    tags=["admin"],
+    response_model=list[RouteMemoryInfo],
+)
+@inject
+def list_route_memory(
+    limit: int = Query(default=20, gt=0, le=1000),
+    store: MemoryProfileStore = Depends(
+        Provide[AppContainer.memory_profile_store]
+    ),
+) -> AdvORJSONResponse:
+    """Memory left allocated per route, with top allocation sites."""
+    return AdvORJSONResponse(store.routes(limit))
+
+
+@router.get(
+    "/memory/profiles",
+    tags=["admin"],
+    response_model=list[MemoryProfileInfo],
+)
+@inject
+def list_memory_profiles(
+    store: MemoryProfileStore = Depends(
+        Provide[AppContainer.memory_profile_store]
+    ),
+) -> AdvORJSONResponse:
+    """Recent memory profiles kept in memory, newest first."""
+    return AdvORJSONResponse(store.list())
+
+
+@router.get(
+    "/memory/profiles/{profile_id}",
+    tags=["admin"],
+    response_model=MemoryProfileInfo,
+)
+@inject
+def get_memory_profile(
+    profile_id: int,
+    store: MemoryProfileStore = Depends(
+        Provide[AppContainer.memory_profile_store]
+    ),
+) -> AdvORJSONResponse:
+    """
+    One memory profile with its top allocation sites.
+
+    Raises:
+        NotFoundError: The profile is unknown or already evicted.
+    """
+    profile = store.get(profile_id)
+    if profile is None:
+        msg = f"Memory profile {profile_id} not found"
+        raise NotFoundError(msg)
+    return AdvORJSONResponse(profile)
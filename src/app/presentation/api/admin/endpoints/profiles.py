@@ -0,0 +1,83 @@
+from enum import StrEnum
+
+import orjson
+from dependency_injector.wiring import Provide
+from dependency_injector.wiring import inject
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import Response
+
+from app.core.containers import AppContainer
+from app.core.exceptions import NotFoundError
+from app.infrastructure.observability.profile_store import ProfileStore
+from app.infrastructure.observability.profile_store import StoredProfile
+from app.infrastructure.observability.speedscope import speedscope_document
+from app.presentation.api.schemas.profiles import ProfileInfo
+from app.utils.encoders import response_encoders
+from app.utils.serializer import AdvORJSONResponse
+
+
+router = APIRouter()
+
+response_encoders.register_entity(StoredProfile, ProfileInfo)
+
+
+class ProfileFormat(StrEnum):
+    PROF = "prof"
+    SPEEDSCOPE = "speedscope"
+
+
+@router.get(
+    "/profiles",
+    tags=["admin"],
+    response_model=list[ProfileInfo],
+)
+@inject
+def list_profiles(
+    store: ProfileStore = Depends(Provide[AppContainer.profile_store]),
+) -> AdvORJSONResponse:
+    """Recent profiles kept in memory, newest first."""
+    return AdvORJSONResponse(store.list())
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    tags=["admin"],
+    response_class=Response,
+    responses={200: {"content": {
+        "application/octet-stream": {},
+        "application/json": {},
+    }}},
+)
+@inject
+def download_profile(
+    profile_id: int,
+    format: ProfileFormat = ProfileFormat.PROF,  # noqa: A002
+    store: ProfileStore = Depends(Provide[AppContainer.profile_store]),
+) -> Response:
+    """
+    Download a profile as ``.prof`` (pstats) or speedscope JSON.
+
+    Raises:
+        NotFoundError: The profile is unknown or already evicted.
+    """
+    profile = store.get(profile_id)
+    if profile is None:
+        msg = f"Profile {profile_id} not found"
+        raise NotFoundError(msg)
+
+    if format is ProfileFormat.SPEEDSCOPE:
+        content = orjson.dumps(
+            speedscope_document({profile.name: profile.stacks()}, profile.name)
+        )
+        filename = f"{profile.name}.speedscope.json"
+        media_type = "application/json"
+    else:
+        content = profile.to_pstats()
+        filename = f"{profile.name}.prof"
+        media_type = "application/octet-stream"
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
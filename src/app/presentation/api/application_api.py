@@ -1,7 +1,13 @@
+from dependency_injector.wiring import Provide
+from dependency_injector.wiring import inject
 from fastapi import APIRouter
+from loguru import logger
 
+from app.core.containers import AppContainer
+from app.presentation.api.admin.api import admin_endpoints
 from app.presentation.api.common.api import common_endpoints
 from app.presentation.api.v1.api import config_routers_endpoints_v1
+from app.utils.configs import AdminConfig
 
 
 def add_common_endpoints(router: APIRouter) -> None:
@@ -12,8 +18,26 @@ def add_endpoints_v1(router: APIRouter) -> None:
     router.include_router(config_routers_endpoints_v1(), prefix="/v1")
 
 
+@inject
+def add_admin_endpoints(
+    router: APIRouter,
+    admin_config: AdminConfig = Provide[
+        AppContainer.infra_container.admin_config
+    ],
+) -> None:
+    # Диагностика для операторов: по умолчанию не монтируется, а без
+    # токена не монтируется вовсе — иначе /admin открыт всем
+    if not admin_config.enabled:
+        return
+    if not admin_config.token.get_secret_value():
+        logger.warning("Admin endpoints are not mounted: ADMIN.TOKEN is empty")
+        return
+    router.include_router(admin_endpoints(), prefix="/admin")
+
+
 def create_main_router() -> APIRouter:
     router = APIRouter()
     add_common_endpoints(router)
     add_endpoints_v1(router)
+    add_admin_endpoints(router)
     return router
@@ -5,6 +5,7 @@ from fastapi import APIRouter
 from app.core.events import Events
 from app.presentation.api.schemas.healthcheck import Healthcheck
 from app.utils.monitor import monitor
+from app.utils.serializer import AdvORJSONResponse
 
 router = APIRouter()
 
@@ -16,5 +17,6 @@ router = APIRouter()
     response_model=Healthcheck,
 )
 @monitor(Events.HEALTHCHECK)
-def healthcheck() -> Healthcheck:
-    return Healthcheck()
+def healthcheck() -> AdvORJSONResponse:
+    # Rendered by the precompiled encoder, response_model documents it
+    return AdvORJSONResponse(Healthcheck())
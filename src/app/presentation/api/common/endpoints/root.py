@@ -2,6 +2,7 @@ from fastapi import APIRouter
 
 from app.core.constants import HELLO_WORLD
 from app.presentation.api.schemas.root import HelloWorld
+from app.utils.serializer import AdvORJSONResponse
 
 router = APIRouter()
 
@@ -11,5 +12,5 @@ router = APIRouter()
     tags=["root"],
     response_model=HelloWorld,
 )
-def root() -> HelloWorld:
-    return HelloWorld(message=HELLO_WORLD)
+def root() -> AdvORJSONResponse:
+    return AdvORJSONResponse(HelloWorld(message=HELLO_WORLD))
@@ -0,0 +1,24 @@
+"""Conditional request helpers (RFC 9110, section 13)."""
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check If-None-Match against the current entity tag.
+
+    Uses weak comparison, as required for If-None-Match: the compression
+    middleware marks tags of compressed responses as weak.
+
+    Args:
+        if_none_match: Raw If-None-Match header value.
+        etag: Current quoted entity tag.
+
+    Returns:
+        True if the client's cached representation is still current.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
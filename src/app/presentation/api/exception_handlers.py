@@ -10,6 +10,7 @@ from app.core.constants import TRACE_ID
 from app.core.constants import USER_ID
 from app.core.exceptions import ProblemDetail
 from app.core.exceptions import Reasons
+from app.utils.serializer import AdvORJSONResponse
 
 
 def business_error_handler(
@@ -76,9 +77,9 @@ def business_error_handler(
         invalid_params=getattr(exc, "invalid_params", NO_PARAMS),
     )
 
-    return JSONResponse(
+    return AdvORJSONResponse(
         status_code=status_code,
-        content=problem.model_dump(by_alias=True, exclude_none=True),
+        content=problem,
     )
 
 
@@ -126,10 +127,9 @@ def infra_error_handler(request: Request, exc: Exception) -> JSONResponse:
         invalid_params=NO_PARAMS,
     )
 
-    return JSONResponse(
+    return AdvORJSONResponse(
         status_code=http_status.HTTP_503_SERVICE_UNAVAILABLE,
-        # by_alias=True превратит urn_type_error -> type
-        content=problem.model_dump(by_alias=True, exclude_none=True),
+        content=problem,
         # Хорошим тоном для 503 ошибки является заголовок Retry-After
         headers={"Retry-After": "30"},
     )
@@ -180,12 +180,11 @@ def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     )
 
     # Тут можно отправить алерт в Sentry
-    return JSONResponse(
+    return AdvORJSONResponse(
         status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-        # model_dump(by_alias=True) нужен, чтобы
-        # urn_type_error превратился в type
-        # exclude_none=True уберет пустые поля (invalid_params)
-        content=problem.model_dump(by_alias=True, exclude_none=True),
+        # Кодировщик ProblemDetail скомпилирован заранее: urn_type_error
+        # превращается в type, пустые поля (invalid_params) убираются
+        content=problem,
     )
 
 
@@ -226,7 +225,7 @@ def request_validation_handler(
         invalid_params=invalid_params,
     )
 
-    return JSONResponse(
+    return AdvORJSONResponse(
         status_code=http_status.HTTP_422_UNPROCESSABLE_CONTENT,
-        content=problem.model_dump(by_alias=True, exclude_none=True),
+        content=problem,
     )
@@ -0,0 +1,312 @@
+"""
+Response compression with Accept-Encoding negotiation.
+
+Кодировка выбирается по q-значениям клиента, при равенстве — по порядку
+``CompressionConfig.encodings``. gzip доступен всегда; ``br`` и ``zstd``
+предлагаются, только если установлены модули ``brotli`` и ``zstandard``.
+Тело из одного сообщения сжимается целиком (если оно не меньше
+minimum_size), потоковый ответ — инкрементально: каждый чанк сжимается и
+сбрасывается (sync flush), чтобы клиент мог декодировать его сразу.
+Чанки от threadpool_threshold байт сжимаются в пуле потоков — zlib,
+brotli и zstd отпускают GIL и не блокируют event loop.
+"""
+from __future__ import annotations
+
+import asyncio
+import zlib
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from typing import Protocol
+
+from starlette.datastructures import Headers
+from starlette.datastructures import MutableHeaders
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from starlette.types import ASGIApp
+    from starlette.types import Message
+    from starlette.types import Receive
+    from starlette.types import Scope
+    from starlette.types import Send
+
+    from app.utils.configs import CompressionConfig
+
+try:
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Ответы без тела или уже сжатые не трогаем
+_NO_BODY_STATUSES = frozenset({204, 304})
+
+
+class Compressor(Protocol):
+    """Stateful streaming compressor for one response."""
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it, so the output is decodable."""
+
+    def finish(self, data: bytes) -> bytes:
+        """Compress the last chunk and terminate the stream."""
+
+
+class GzipCompressor:
+    __slots__ = ("_obj",)
+
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor:
+    __slots__ = ("_obj",)
+
+    def __init__(self, level: int) -> None:
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        chunk: bytes = self._obj.process(data) + self._obj.flush()
+        return chunk
+
+    def finish(self, data: bytes) -> bytes:
+        chunk: bytes = self._obj.process(data) + self._obj.finish()
+        return chunk
+
+
+class ZstdCompressor:
+    __slots__ = ("_obj",)
+
+    def __init__(self, level: int) -> None:
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        chunk: bytes = self._obj.compress(data) + self._obj.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+        return chunk
+
+    def finish(self, data: bytes) -> bytes:
+        chunk: bytes = self._obj.compress(data) + self._obj.flush()
+        return chunk
+
+
+def available_encodings() -> dict[str, Callable[[int], Compressor]]:
+    """Content codings supported by installed modules."""
+    encodings: dict[str, Callable[[int], Compressor]] = {
+        "gzip": GzipCompressor,
+    }
+    if brotli is not None:
+        encodings["br"] = BrotliCompressor
+    if zstandard is not None:
+        encodings["zstd"] = ZstdCompressor
+    return encodings
+
+
+@lru_cache(maxsize=256)
+def negotiate_encoding(
+    accept_encoding: str, offered: tuple[str, ...]
+) -> str | None:
+    """
+    Pick a content coding for the Accept-Encoding header (RFC 9110).
+
+    Args:
+        accept_encoding: Raw header value.
+        offered: Server codings in order of preference.
+
+    Returns:
+        Coding with the highest non-zero q-value, ties broken by the
+        server order, or None if the client accepts none of them.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        name, _, value = params.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        weights[coding] = q
+
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in offered:
+        q = weights.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionMiddleware:
+    """Pure ASGI middleware that compresses response bodies."""
+
+    def __init__(self, app: ASGIApp, config: CompressionConfig) -> None:
+        self.app = app
+        self.config = config
+        factories = available_encodings()
+        self._factories = factories
+        self._offered = tuple(
+            coding for coding in config.encodings if coding in factories
+        )
+        self._levels = config.levels
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        coding = (
+            negotiate_encoding(accept_encoding, self._offered)
+            if accept_encoding
+            else None
+        )
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            send,
+            coding=coding,
+            factory=self._factories[coding],
+            level=self._levels.get(coding, -1),
+            minimum_size=self.config.minimum_size,
+            threadpool_threshold=self.config.threadpool_threshold,
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Per-response state: buffers the start message until the first body."""
+
+    __slots__ = (
+        "_coding",
+        "_compressor",
+        "_factory",
+        "_level",
+        "_minimum_size",
+        "_passthrough",
+        "_send",
+        "_start",
+        "_threadpool_threshold",
+    )
+
+    def __init__(
+        self,
+        send: Send,
+        *,
+        coding: str,
+        factory: Callable[[int], Compressor],
+        level: int,
+        minimum_size: int,
+        threadpool_threshold: int,
+    ) -> None:
+        self._send = send
+        self._coding = coding
+        self._factory = factory
+        self._level = level
+        self._minimum_size = minimum_size
+        self._threadpool_threshold = threadpool_threshold
+        self._start: Message | None = None
+        self._compressor: Compressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+            return
+
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            headers = Headers(raw=message.get("headers", []))
+            if (
+                message["status"] in _NO_BODY_STATUSES
+                or "content-encoding" in headers
+            ):
+                self._passthrough = True
+                await self._send(message)
+                return
+            self._start = message
+            return
+
+        if message_type != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._compressor is None:
+            await self._send_first(body, more_body=more_body)
+            return
+
+        chunk = await self._run(
+            self._compressor.compress if more_body else self._compressor.finish,
+            body,
+        )
+        if chunk or not more_body:
+            await self._send({
+                "type": "http.response.body",
+                "body": chunk,
+                "more_body": more_body,
+            })
+
+    async def _send_first(self, body: bytes, *, more_body: bool) -> None:
+        start = self._start
+        self._start = None
+        if start is None:  # pragma: no cover - protocol violation upstream
+            msg = "Response body sent before response start"
+            raise RuntimeError(msg)
+
+        if not more_body and len(body) < self._minimum_size:
+            self._passthrough = True
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        self._compressor = self._factory(self._level)
+        headers = MutableHeaders(scope=start)
+        headers["Content-Encoding"] = self._coding
+        headers.add_vary_header("Accept-Encoding")
+        # Сжатое представление не побайтово равно исходному: strong ETag
+        # становится weak (RFC 9110, 8.8.1)
+        etag = headers.get("ETag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        if more_body:
+            del headers["Content-Length"]
+            chunk = await self._run(self._compressor.compress, body)
+        else:
+            chunk = await self._run(self._compressor.finish, body)
+            headers["Content-Length"] = str(len(chunk))
+        await self._send(start)
+        await self._send({
+            "type": "http.response.body",
+            "body": chunk,
+            "more_body": more_body,
+        })
+
+    async def _run(
+        self, compress: Callable[[bytes], bytes], data: bytes
+    ) -> bytes:
+        if len(data) < self._threadpool_threshold:
+            return compress(data)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, compress, data)
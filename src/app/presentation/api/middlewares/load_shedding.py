@@ -0,0 +1,187 @@
+"""
+CoDel-style load shedding for a single worker.
+
+Ограничивает число одновременно обрабатываемых запросов; остальные ждут в
+очереди. Если минимальная задержка в очереди за интервал наблюдения
+превышает target, очередь считается «стоячей» (перегрузка): запросы с
+низким приоритетом отклоняются сразу, остальные — если ждут дольше
+своего таймаута. Так при всплеске нагрузки быстро падают немногие
+запросы, а не замедляются все.
+"""
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from fastapi import status as http_status
+from loguru import logger
+from opentelemetry import metrics
+
+from app.core import constants
+from app.core.exceptions import Reasons
+from app.core.priority import current_priority
+from app.presentation.api.middlewares.problem import problem_response
+from app.utils.configs import RequestPriority
+
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp
+    from starlette.types import Receive
+    from starlette.types import Scope
+    from starlette.types import Send
+
+    from app.utils.configs import LoadSheddingConfig
+
+
+class CoDelController:
+    """
+    Контроллер перегрузки по алгоритму CoDel (Nichols & Jacobson).
+
+    Overload is declared when the minimum queue delay observed during a
+    whole interval stays above target; it is cleared by the first interval
+    whose minimum drops below target.
+    """
+
+    __slots__ = (
+        "_interval",
+        "_target",
+        "_window_end",
+        "_window_min",
+        "overloaded",
+    )
+
+    def __init__(self, target: float, interval: float) -> None:
+        self._target = target
+        self._interval = interval
+        self._window_end = 0.0
+        self._window_min = float("inf")
+        self.overloaded = False
+
+    def observe(self, delay: float, now: float) -> None:
+        """
+        Record queue delay of a request that just got a worker slot.
+
+        Args:
+            delay: Time the request spent in the queue, seconds.
+            now: Current perf_counter() value.
+        """
+        if now >= self._window_end:
+            if self._window_end:
+                self.overloaded = self._window_min > self._target
+            self._window_end = now + self._interval
+            self._window_min = delay
+        else:
+            self._window_min = min(delay, self._window_min)
+
+    def queue_timeout(self, priority: RequestPriority) -> float:
+        """
+        Maximum time a request of given priority may wait for a slot.
+
+        Args:
+            priority: Priority class of the request.
+
+        Returns:
+            Timeout in seconds; zero means the request is shed on arrival.
+        """
+        if not self.overloaded:
+            return self._interval
+        if priority is RequestPriority.BATCH:
+            return 0.0
+        if priority is RequestPriority.NORMAL:
+            return self._target
+        return self._interval
+
+
+class LoadSheddingMiddleware:
+    """
+    Pure ASGI middleware that sheds load based on queueing delay.
+
+    Priority class is taken from ``current_priority``, so the middleware
+    must run inside PriorityMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp, config: LoadSheddingConfig) -> None:
+        self.app = app
+        self.config = config
+        self.in_flight = 0
+        self._slots = asyncio.Semaphore(config.max_concurrency)
+        self._controller = CoDelController(
+            target=config.target, interval=config.interval
+        )
+        self._exempt = frozenset(config.exempt_paths)
+        self._retry_headers = {"Retry-After": str(config.retry_after)}
+
+        meter = metrics.get_meter(__name__)
+        self._shed_total = meter.create_counter(
+            name=constants.METRICS_SHED_REQUESTS_NAME,
+            description=constants.METRICS_SHED_REQUESTS_DESC,
+            unit=constants.METRICS_SHED_REQUESTS_UNIT,
+        )
+        self._queue_delay = meter.create_histogram(
+            name=constants.METRICS_QUEUE_DELAY_NAME,
+            description=constants.METRICS_QUEUE_DELAY_DESC,
+            unit=constants.METRICS_QUEUE_DELAY_UNIT,
+        )
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http" or scope["path"] in self._exempt:
+            await self.app(scope, receive, send)
+            return
+
+        priority = current_priority.get()
+        max_wait = self._controller.queue_timeout(priority)
+        if not await self._acquire(max_wait):
+            await self._reject(scope, receive, send, priority)
+            return
+
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    async def _acquire(self, max_wait: float) -> bool:
+        """Wait for a worker slot and feed the queue delay to CoDel."""
+        enqueued_at = perf_counter()
+        if not self._slots.locked():
+            await self._slots.acquire()
+        elif max_wait <= 0:
+            return False
+        else:
+            try:
+                await asyncio.wait_for(self._slots.acquire(), max_wait)
+            except TimeoutError:
+                self._controller.observe(max_wait, perf_counter())
+                return False
+
+        now = perf_counter()
+        delay = now - enqueued_at
+        self._controller.observe(delay, now)
+        self._queue_delay.record(delay)
+        return True
+
+    async def _reject(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        priority: RequestPriority,
+    ) -> None:
+        self._shed_total.add(1, {"priority": priority.value})
+        logger.warning(
+            "Request shed: {path} priority={priority} in_flight={in_flight}",
+            path=scope["path"],
+            priority=priority.value,
+            in_flight=self.in_flight,
+        )
+        response = problem_response(
+            scope,
+            reason=Reasons.overloaded,
+            status_code=http_status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers=self._retry_headers,
+        )
+        await response(scope, receive, send)
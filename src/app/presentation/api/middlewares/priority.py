@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from app.core.constants import PRIORITY
+from app.core.priority import PriorityResolver
+from app.core.priority import current_priority
+
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp
+    from starlette.types import Receive
+    from starlette.types import Scope
+    from starlette.types import Send
+
+    from app.utils.configs import PriorityConfig
+
+_PRIORITY_HEADER = PRIORITY.lower().encode("latin-1")
+
+
+class PriorityMiddleware:
+    """Pure ASGI middleware that classifies requests into priority classes."""
+
+    def __init__(self, app: ASGIApp, config: PriorityConfig) -> None:
+        self.app = app
+        self._resolver = PriorityResolver(config)
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header = None
+        for name, value in scope["headers"]:
+            if name == _PRIORITY_HEADER:
+                header = value.decode("latin-1")
+                break
+
+        token = current_priority.set(
+            self._resolver.resolve(scope["path"], header)
+        )
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_priority.reset(token)
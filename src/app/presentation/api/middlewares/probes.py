@@ -0,0 +1,116 @@
+"""
+Raw ASGI fast path for liveness, readiness and metrics probes.
+
+Пробы Kubernetes приходят от каждого пода постоянно, поэтому отвечаем на
+них на самом внешнем уровне: без correlation id, CORS, профилирования,
+роутинга FastAPI, threadpool и @monitor. Тела и заголовки liveness и
+readiness закодированы заранее. Готовность отслеживается по сообщениям
+lifespan: до startup.complete и после начала shutdown readiness отдаёт
+503, чтобы под не получал трафик, пока не готов или завершается.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from prometheus_client import generate_latest
+
+from app.presentation.api.schemas.healthcheck import Healthcheck
+from app.utils.encoders import response_encoders
+
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp
+    from starlette.types import Message
+    from starlette.types import Receive
+    from starlette.types import Scope
+    from starlette.types import Send
+
+    from app.utils.configs import ProbesConfig
+
+_PROBE_METHODS = frozenset({"GET", "HEAD"})
+_JSON = b"application/json"
+_TEXT = b"text/plain; charset=utf-8"
+_NOT_READY_BODY = b'{"status":"starting"}'
+_HEAD_BODY: Message = {"type": "http.response.body", "body": b""}
+
+
+def _encode_response(
+    status: int, content_type: bytes, body: bytes
+) -> tuple[Message, Message]:
+    start: Message = {
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"cache-control", b"no-store"),
+        ],
+    }
+    return start, {"type": "http.response.body", "body": body}
+
+
+class ProbeMiddleware:
+    """Pure ASGI middleware answering probe routes with preencoded bytes."""
+
+    def __init__(self, app: ASGIApp, config: ProbesConfig) -> None:
+        self.app = app
+        self.config = config
+        self.ready = False
+
+        healthy = _encode_response(
+            200, _JSON, response_encoders.dumps(Healthcheck())
+        )
+        self._responses = {
+            config.health_path: healthy,
+            config.readiness_path: healthy,
+        }
+        self._not_ready = _encode_response(503, _JSON, _NOT_READY_BODY)
+        self._readiness_path = config.readiness_path
+        self._metrics_path = config.metrics_path
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        scope_type = scope["type"]
+        if scope_type == "lifespan":
+            await self.app(
+                scope,
+                self._track_shutdown(receive),
+                self._track_startup(send),
+            )
+            return
+        if scope_type != "http" or scope["method"] not in _PROBE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        response = self._responses.get(path)
+        if response is not None:
+            if path == self._readiness_path and not self.ready:
+                response = self._not_ready
+            start, body = response
+        elif path == self._metrics_path:
+            start, body = _encode_response(200, _TEXT, generate_latest())
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        await send(start)
+        await send(_HEAD_BODY if scope["method"] == "HEAD" else body)
+
+    def _track_startup(self, send: Send) -> Send:
+        async def wrapped(message: Message) -> None:
+            if message["type"] == "lifespan.startup.complete":
+                self.ready = True
+            await send(message)
+
+        return wrapped
+
+    def _track_shutdown(self, receive: Receive) -> Receive:
+        async def wrapped() -> Message:
+            message = await receive()
+            if message["type"] == "lifespan.shutdown":
+                self.ready = False
+            return message
+
+        return wrapped
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING
+
+from asgi_correlation_id import correlation_id
+from starlette.requests import Request
+
+from app.core.constants import NO_PARAMS
+from app.core.constants import TRACE_ID
+from app.core.exceptions import ProblemDetail
+from app.utils.serializer import AdvORJSONResponse
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from starlette.types import Scope
+
+    from app.core.exceptions import Reason
+
+
+def problem_response(
+    scope: Scope,
+    reason: Reason,
+    status_code: int,
+    headers: Mapping[str, str] | None = None,
+) -> AdvORJSONResponse:
+    """
+    Build a ProblemDetail response directly from ASGI scope.
+
+    Used by middlewares that reject requests before they reach routing,
+    so exception handlers are not involved.
+
+    Args:
+        scope: ASGI connection scope.
+        reason: Reason describing the problem.
+        status_code: HTTP status code.
+        headers: Extra response headers (e.g. Retry-After).
+
+    Returns:
+        Response with ProblemDetail body.
+    """
+    request = Request(scope)
+    trace_id = (
+        request.headers.get(TRACE_ID)
+        or correlation_id.get()
+        or str(uuid.uuid4())
+    )
+    problem = ProblemDetail(
+        urn_type_error=reason.urn_type_error,
+        title=reason.title,
+        status=status_code,
+        reason=reason.code,
+        detail=reason.message,
+        instance=request.url.path,
+        trace_id=trace_id,
+        invalid_params=NO_PARAMS,
+    )
+    return AdvORJSONResponse(
+        status_code=status_code,
+        content=problem,
+        headers=dict(headers) if headers else None,
+    )
@@ -0,0 +1,181 @@
+"""
+Per-tenant token-bucket rate limiting keyed by X-User-ID.
+
+Бакеты хранятся в OrderedDict ``key -> (tokens, last_update)`` в порядке
+последнего обращения и пополняются лениво, без фоновых задач. Бакет,
+простоявший время полного пополнения, неотличим от нового, поэтому такие
+бакеты снимаются с начала словаря понемногу на каждом запросе. Число
+бакетов ограничено max_buckets: когда таблица заполнена, неизвестный
+X-User-ID учитывается в бакете адреса клиента — клиент, меняющий ID на
+каждый запрос, не получает новый полный бакет.
+"""
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from fastapi import status as http_status
+from opentelemetry import metrics
+
+from app.core import constants
+from app.core.constants import USER_ID
+from app.core.exceptions import Reasons
+from app.presentation.api.middlewares.problem import problem_response
+
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp
+    from starlette.types import Receive
+    from starlette.types import Scope
+    from starlette.types import Send
+
+    from app.utils.configs import RateLimit
+    from app.utils.configs import RateLimitConfig
+
+_USER_ID_HEADER = USER_ID.lower().encode("latin-1")
+_ANONYMOUS = "anonymous"
+
+
+class TokenBucketLimiter:
+    """Token buckets for many keys sharing one rate limit."""
+
+    __slots__ = (
+        "_buckets",
+        "_burst",
+        "_max_buckets",
+        "_rate",
+        "_refill_time",
+    )
+
+    def __init__(self, limit: RateLimit, max_buckets: int) -> None:
+        self._rate = limit.rate
+        self._burst = float(limit.burst)
+        self._refill_time = self._burst / self._rate
+        self._max_buckets = max_buckets
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def acquire(
+        self, key: str, now: float, fallback_key: str | None = None
+    ) -> float:
+        """
+        Take one token from the bucket of the key.
+
+        Args:
+            key: Tenant key.
+            now: Current monotonic time.
+            fallback_key: Key charged instead of an unknown key when
+                the table is full (client address).
+
+        Returns:
+            0.0 if the request is allowed, otherwise seconds until the
+            next token becomes available.
+        """
+        buckets = self._buckets
+        self._evict_idle(now)
+        if key not in buckets and len(buckets) >= self._max_buckets:
+            if fallback_key is not None:
+                key = fallback_key
+            if key not in buckets:
+                buckets.popitem(last=False)
+
+        tokens, updated_at = buckets.pop(key, (self._burst, now))
+        tokens = min(self._burst, tokens + (now - updated_at) * self._rate)
+        if tokens < 1.0:
+            buckets[key] = (tokens, now)
+            return (1.0 - tokens) / self._rate
+
+        buckets[key] = (tokens - 1.0, now)
+        return 0.0
+
+    def _evict_idle(self, now: float) -> None:
+        # Least recently used first: stop at the first bucket still in use
+        idle_since = now - self._refill_time
+        buckets = self._buckets
+        while buckets:
+            _, updated_at = next(iter(buckets.values()))
+            if updated_at > idle_since:
+                return
+            buckets.popitem(last=False)
+
+
+class RateLimitMiddleware:
+    """Pure ASGI middleware that answers 429 when a tenant exceeds a limit."""
+
+    def __init__(self, app: ASGIApp, config: RateLimitConfig) -> None:
+        self.app = app
+        self._exempt = frozenset(config.exempt_paths)
+        # Longest prefix first, so specific routes win over broad ones
+        self._routes = sorted(
+            (
+                (prefix, TokenBucketLimiter(limit, config.max_buckets))
+                for prefix, limit in config.routes.items()
+            ),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self._default = (
+            TokenBucketLimiter(config.default, config.max_buckets)
+            if config.default
+            else None
+        )
+        self._limited_total = metrics.get_meter(__name__).create_counter(
+            name=constants.METRICS_RATE_LIMITED_NAME,
+            description=constants.METRICS_RATE_LIMITED_DESC,
+            unit=constants.METRICS_RATE_LIMITED_UNIT,
+        )
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        path = scope.get("path", "")
+        limiter = (
+            self._limiter_for(path)
+            if scope["type"] == "http" and path not in self._exempt
+            else None
+        )
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        client = _client_key(scope)
+        wait = limiter.acquire(
+            _tenant_key(scope) or client, monotonic(), fallback_key=client
+        )
+        if not wait:
+            await self.app(scope, receive, send)
+            return
+
+        self._limited_total.add(1, {"path": path})
+        response = problem_response(
+            scope,
+            reason=Reasons.too_many_requests,
+            status_code=http_status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": str(math.ceil(wait))},
+        )
+        await response(scope, receive, send)
+
+    def _limiter_for(self, path: str) -> TokenBucketLimiter | None:
+        for prefix, limiter in self._routes:
+            if path.startswith(prefix):
+                return limiter
+        return self._default
+
+
+def _tenant_key(scope: Scope) -> str | None:
+    """Tenant declared by the X-User-ID header."""
+    for name, value in scope["headers"]:
+        if name == _USER_ID_HEADER:
+            key: str = value.decode("latin-1")
+            return key
+    return None
+
+
+def _client_key(scope: Scope) -> str:
+    """Address of the client, for anonymous and overflow traffic."""
+    client: tuple[str, int] | None = scope.get("client")
+    return f"addr:{client[0]}" if client else _ANONYMOUS
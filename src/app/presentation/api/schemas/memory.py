@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+from pydantic import Field
+
+
+class AllocationSiteInfo(BaseModel):
+    file: str
+    line: int
+    size: int = Field(..., description="Bytes still allocated by the line")
+    count: int = Field(..., description="Memory blocks still allocated")
+
+
+class MemoryProfileInfo(BaseModel):
+    id: int
+    method: str
+    path: str
+    route: str = Field(..., description="Method and route template")
+    captured_at: datetime
+    duration: float = Field(..., description="Request wall time, seconds")
+    net_bytes: int = Field(
+        ..., description="Allocated during the request and not freed"
+    )
+    peak_bytes: int = Field(
+        ..., description="Traced memory peak above the request start"
+    )
+    sites: list[AllocationSiteInfo] = Field(
+        ..., description="Top allocation sites by size"
+    )
+
+
+class RouteMemoryInfo(BaseModel):
+    route: str = Field(..., description="Method and route template")
+    requests: int = Field(..., description="Profiled requests")
+    net_bytes: int = Field(
+        ..., description="Memory left allocated by all profiled requests"
+    )
+    peak_bytes: int = Field(..., description="Largest peak of a request")
+    sites: list[AllocationSiteInfo] = Field(
+        ..., description="Top allocation sites by size"
+    )
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+from pydantic import Field
+
+
+class ProfileInfo(BaseModel):
+    id: int
+    method: str
+    path: str
+    captured_at: datetime
+    duration: float = Field(..., description="Request wall time, seconds")
+    mode: str = Field(..., description="Profiler: cprofile or sampling")
+
+
+class RouteProfileInfo(BaseModel):
+    route: str = Field(..., description="Method and route template")
+    requests: int = Field(..., description="Profiled requests in the window")
+    seconds: float = Field(..., description="Total profiled time")
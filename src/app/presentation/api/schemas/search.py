@@ -13,3 +13,10 @@ class Document(BaseModel):
 
 class SearchResponse(BaseModel):
     documents: list[Document] = Field([], description="List of documents")
+    partial: bool = Field(
+        default=False,
+        description=(
+            "True if the search deadline expired and documents contain "
+            "only the best results found so far"
+        ),
+    )
@@ -2,30 +2,71 @@ from dependency_injector.wiring import Provide
 from dependency_injector.wiring import inject
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import Header
+from fastapi import Response
+from fastapi import status
 
 from app.application.services.search_service import SearchService
 from app.core.containers import AppContainer
+from app.domain.entities.document import Document as DocumentEntity
+from app.domain.entities.search_result import SearchResult
+from app.presentation.api.conditional import etag_matches
 from app.presentation.api.schemas.search import Document
 from app.presentation.api.schemas.search import SearchRequest
 from app.presentation.api.schemas.search import SearchResponse
+from app.utils.encoders import log_encoders
+from app.utils.encoders import response_encoders
+from app.utils.serializer import AdvORJSONResponse
+
 
 router = APIRouter()
 
+# Domain entities are written to JSON directly; schemas only document them
+response_encoders.register_entity(DocumentEntity, Document)
+response_encoders.register_entity(SearchResult, SearchResponse)
+# Search results in @monitor logs have the shape of the API response
+log_encoders.register_entity(DocumentEntity, Document)
+log_encoders.register_entity(SearchResult, SearchResponse)
+
 
-@router.post("/answer/generate", tags=["rag"])
+@router.post(
+    "/answer/generate",
+    tags=["rag"],
+    response_model=dict[str, SearchResponse],
+)
 @inject
 async def generate_answer(
     request: SearchRequest,
     search_service: SearchService = Depends(
         Provide[AppContainer.search_service]
     ),
-) -> dict[str, SearchResponse]:
-    documents = await search_service.search(query=request.query)
-
-    # Mapper Logic (Domain Entity -> Schema)
-    response = SearchResponse(
-        documents=[
-            Document(text=doc.text, metadata=doc.metadata) for doc in documents
-        ]
-    )
-    return {"hello": response}
+) -> AdvORJSONResponse:
+    result = await search_service.search_until(query=request.query)
+    return AdvORJSONResponse({"hello": result})
+
+
+@router.get(
+    "/search",
+    tags=["rag"],
+    response_model=SearchResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified"}},
+)
+@inject
+async def search(
+    query: str,
+    if_none_match: str | None = Header(default=None),
+    search_service: SearchService = Depends(
+        Provide[AppContainer.search_service]
+    ),
+) -> Response:
+    # ETag is known before searching: polling clients cost one hash
+    etag = search_service.etag(query)
+    if if_none_match is not None and etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    result = await search_service.search_until(query=query)
+    # Partial results depend on timing, not only on the index and query
+    headers = None if result.partial else {"ETag": etag}
+    return AdvORJSONResponse(result, headers=headers)
@@ -2,6 +2,8 @@ from enum import StrEnum
 
 from dynaconf import Dynaconf
 from pydantic import BaseModel
+from pydantic import Field
+from pydantic import SecretStr
 
 from app.core.constants import PATH_TO_ENVS
 from app.core.constants import PATH_TO_SECRETS
@@ -29,6 +31,22 @@ class LogLevel(StrEnum):
     NOTSET = "NOTSET"
 
 
+class RequestPriority(StrEnum):
+    """Классы приоритета запросов, от наименее к наиболее важному."""
+
+    BATCH = "batch"
+    NORMAL = "normal"
+    INTERACTIVE = "interactive"
+
+
+class OverflowPolicy(StrEnum):
+    """What the batching log sink does when its queue is full."""
+
+    BLOCK = "block"
+    DROP = "drop"
+    SAMPLE = "sample"
+
+
 class LoggerConfig(BaseModel):
     level: LogLevel
     format: str
@@ -36,11 +54,29 @@ class LoggerConfig(BaseModel):
     rotation: str
     retention: str
     loggers_to_root: list[str]
+    serialize: bool = False  # stdout as JSON lines instead of FORMAT
+    # stdout is written by a background thread, not the logging one
+    batching: bool = True
+    queue_size: int = Field(default=10_000, gt=0)  # records
+    batch_size: int = Field(default=256, gt=0)  # records waking the writer
+    flush_interval: float = Field(default=0.05, gt=0)  # seconds
+    overflow: OverflowPolicy = OverflowPolicy.DROP
+    overflow_sample_every: int = Field(default=10, gt=0)  # sample policy
+
+
+class PayloadLoggingConfig(BaseModel):
+    """Sampling of arguments and results logged by @monitor."""
+    sample_every: int = Field(default=1, gt=0)  # successes with payload: 1 in N
+    slow_threshold: float = Field(default=1.0, gt=0)  # seconds; slower -> logged
+    max_bytes: int = Field(default=16_384, gt=0)  # payload budget per record
 
 
 class MetricsConfig(BaseModel):
     duration_buckets: list[float]
     service_name: str
+    loop_lag_buckets: list[float] = [
+        0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+    ]
 
 
 class ServerConfig(BaseModel):
@@ -77,11 +113,131 @@ class SerializationConfig(BaseModel):
     detect_cycles: bool = True
     fallback_on_error: bool = True
     use_orjson: bool = True
+    # Bounded serialization of logged payloads (encode_bounded)
+    max_string: int = Field(default=1024, gt=0)  # characters per string
+    max_items: int = Field(default=100, gt=0)  # items per container
+
+
+class AdminConfig(BaseModel):
+    """Configuration for the operator-only /admin endpoints."""
+    enabled: bool = False
+    token: SecretStr = SecretStr("")  # required token; empty -> not mounted
+    token_header: str = "X-Admin-Token"  # noqa: S105
+
+
+class ProfilingMode(StrEnum):
+    CPROFILE = "cprofile"
+    SAMPLING = "sampling"
 
 
 class ProfilingConfig(BaseModel):
-    """Configuration for cProfile profiling."""
+    """Configuration for request profiling."""
     enabled: bool = False
+    mode: ProfilingMode = ProfilingMode.CPROFILE
+    sampling_hz: int = Field(default=100, gt=0)  # stack samples per second
     output_dir: str = "profiles"
     sort_by: str = "cumulative"  # cumulative, time, calls
-    top_n: int = 50
\ No newline at end of file
+    top_n: int = 50
+    max_pending_writes: int = Field(default=64, gt=0)  # profiles queued
+    write_files: bool = True  # also dump kept profiles to output_dir
+    # Triggers: which requests are profiled and which profiles are kept
+    sample_every: int = Field(default=1, gt=0)  # profile 1 in N requests
+    routes: list[str] = []  # path prefixes; empty -> every route
+    trigger_header: str = ""  # header forcing a profile; "" -> disabled
+    latency_threshold: float = 0.0  # seconds; faster profiles are dropped
+    ring_size: int = Field(default=32, gt=0)  # recent profiles in memory
+    # Rolling per-route aggregate of every profiled request
+    aggregate: bool = True
+    aggregate_window: float = Field(default=300.0, gt=0)  # seconds
+    aggregate_buckets: int = Field(default=10, gt=0)  # window granularity
+
+
+class MemoryProfilingConfig(BaseModel):
+    """Configuration for tracemalloc request memory profiling."""
+    enabled: bool = False
+    sample_every: int = Field(default=100, gt=0)  # profile 1 in N requests
+    routes: list[str] = []  # path prefixes; empty -> every route
+    frames: int = Field(default=1, gt=0)  # traceback depth of allocations
+    top_n: int = Field(default=20, gt=0)  # allocation sites per profile
+    ring_size: int = Field(default=32, gt=0)  # recent profiles in memory
+    output_dir: str = "profiles"
+    write_files: bool = True  # dump snapshots to output_dir
+    max_pending_writes: int = Field(default=16, gt=0)  # snapshots queued
+
+
+class LoopMonitorConfig(BaseModel):
+    """Configuration for the event loop lag monitor."""
+    enabled: bool = True
+    interval: float = Field(default=0.1, gt=0)  # seconds between lag probes
+    threshold: float = Field(default=0.05, gt=0)  # seconds; log blocking code
+    stack_depth: int = Field(default=30, gt=0)  # innermost frames logged
+
+
+class SearchConfig(BaseModel):
+    """Configuration for deadline-bounded (anytime) search."""
+    deadline: float = 1.0  # seconds
+    deadline_grace: float = 0.05  # seconds, before repository is cancelled
+    max_concurrency: int = 16  # concurrent searches per worker
+
+
+class LoadSheddingConfig(BaseModel):
+    """Configuration for CoDel-style load shedding middleware."""
+    enabled: bool = True
+    max_concurrency: int = 64  # in-flight requests per worker
+    target: float = 0.005  # seconds, acceptable standing queue delay
+    interval: float = 0.1  # seconds, CoDel observation window
+    retry_after: int = 1  # seconds
+    exempt_paths: list[str] = []
+
+
+class PriorityConfig(BaseModel):
+    """Configuration for request priority classes and fair scheduling."""
+    header_enabled: bool = True
+    default: RequestPriority = RequestPriority.NORMAL
+    routes: dict[str, RequestPriority] = {}  # path prefix -> priority
+    weights: dict[RequestPriority, float] = {
+        RequestPriority.INTERACTIVE: 8.0,
+        RequestPriority.NORMAL: 4.0,
+        RequestPriority.BATCH: 1.0,
+    }
+
+
+class RateLimit(BaseModel):
+    rate: float = Field(gt=0)  # tokens per second
+    burst: int = Field(gt=0)  # bucket capacity
+
+
+class RateLimitConfig(BaseModel):
+    """Configuration for per-tenant token-bucket rate limiting."""
+    enabled: bool = True
+    default: RateLimit | None = None  # None -> unmatched routes unlimited
+    routes: dict[str, RateLimit] = {}  # path prefix -> limit
+    exempt_paths: list[str] = []
+    max_buckets: int = Field(default=100_000, gt=0)  # per route, per worker
+
+
+class ProbesConfig(BaseModel):
+    """Configuration for the raw ASGI probe fast path."""
+    enabled: bool = True
+    health_path: str = "/common/healthcheck"
+    readiness_path: str = "/common/readiness"
+    metrics_path: str = "/common/metrics"
+
+
+class CompressionConfig(BaseModel):
+    """Configuration for response compression middleware."""
+    enabled: bool = True
+    minimum_size: int = Field(default=1024, ge=0)  # bytes
+    encodings: list[str] = ["zstd", "br", "gzip"]  # server preference order
+    levels: dict[str, int] = {"zstd": 3, "br": 4, "gzip": 6}
+    threadpool_threshold: int = 65_536  # bytes, larger chunks leave the loop
+
+
+class EmbeddingConfig(BaseModel):
+    """Configuration for dynamic batching of embeddings."""
+    dimension: int = 256
+    max_batch_size: int = 64
+    max_wait: float = 0.002  # seconds to wait for a batch to fill up
+    cache_backend: str = "disk"  # "disk" | "none"
+    cache_dir: str = "cache/embeddings"
+    cache_initial_capacity: int = 1024  # index slots, doubles at 70% load
@@ -0,0 +1,368 @@
+"""
+Per-type compiled JSON encoders for orjson.
+
+Для каждого типа, который orjson не сериализует сам (Pydantic-модели,
+dataclass'ы, доменные сущности), функция кодирования собирается один раз —
+при регистрации или при первой встрече типа — и кэшируется по типу.
+Дальше ``default`` для каждого объекта стоит один поиск в dict вместо
+цепочки ``isinstance``/``hasattr``.
+
+Доменные сущности можно зарегистрировать по Pydantic-схеме ответа: схема
+остаётся источником правды для OpenAPI, а сущность пишется в JSON без
+пересборки в модель и валидации.
+"""
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import enum
+import uuid
+from collections.abc import Callable
+from functools import partial
+from operator import attrgetter
+from types import MappingProxyType
+from types import NoneType
+from types import UnionType
+from typing import TYPE_CHECKING
+from typing import Annotated
+from typing import Any
+from typing import Literal
+from typing import Union
+from typing import get_args
+from typing import get_origin
+
+import orjson
+from pydantic import BaseModel
+from pydantic import PlainSerializer
+from pydantic import WrapSerializer
+
+
+if TYPE_CHECKING:
+    from pydantic.fields import FieldInfo
+
+
+Encoder = Callable[[Any], Any]
+
+# OPT_UTC_Z: UTC-время как у pydantic ("...Z"), а не "+00:00"
+_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_UTC_Z
+)
+
+# Значения этих типов orjson пишет так же, как pydantic в mode="json".
+# bytes, timedelta, time, SecretStr, Decimal и прочие сюда не входят:
+# их JSON-форма у pydantic своя (base64/ISO 8601/маска/строка)
+_NATIVE_TYPES = (str, int, float, NoneType, dt.date, uuid.UUID, enum.Enum)
+_NATIVE_CONTAINERS = (list, tuple, set, frozenset, Union, UnionType)
+
+
+def _has_custom_serializer(metadata: list[Any] | tuple[Any, ...]) -> bool:
+    return any(
+        isinstance(item, (PlainSerializer, WrapSerializer)) for item in metadata
+    )
+
+
+def _is_orjson_native(annotation: Any) -> bool:  # noqa: ANN401
+    """
+    Whether orjson writes values of the annotation as pydantic mode="json".
+
+    Nested Pydantic models count as native: orjson hands them back to the
+    registry, which compiles them by the same rules.
+    """
+    origin = get_origin(annotation)
+    if origin is None:
+        return isinstance(annotation, type) and (
+            issubclass(annotation, _NATIVE_TYPES)
+            or issubclass(annotation, BaseModel)
+        )
+    args = get_args(annotation)
+    if origin is Annotated:
+        return not _has_custom_serializer(args[1:]) and _is_orjson_native(
+            args[0]
+        )
+    if origin is Literal:
+        return all(isinstance(arg, (str, int, NoneType)) for arg in args)
+    if origin is dict:
+        # orjson без OPT_NON_STR_KEYS принимает только строковые ключи
+        return (
+            len(args) == 2  # noqa: PLR2004
+            and args[0] is str
+            and _is_orjson_native(args[1])
+        )
+    if origin in _NATIVE_CONTAINERS:
+        return all(arg is Ellipsis or _is_orjson_native(arg) for arg in args)
+    return False
+
+
+def _fields_are_native(fields: dict[str, FieldInfo]) -> bool:
+    return all(
+        not _has_custom_serializer(info.metadata)
+        and _is_orjson_native(info.annotation)
+        for info in fields.values()
+    )
+
+
+def compile_fields_encoder(
+    keys: tuple[str, ...],
+    names: tuple[str, ...],
+    *,
+    exclude_none: bool = False,
+) -> Encoder:
+    """
+    Compile a function reading attributes ``names`` into a dict by ``keys``.
+
+    Args:
+        keys: Output keys (serialization names).
+        names: Attribute names, in the same order.
+        exclude_none: Drop keys whose value is None.
+
+    Returns:
+        Encoder producing a dict.
+    """
+    if not names:
+        return lambda _: {}
+    if len(names) == 1:
+        single = attrgetter(names[0])
+        getter: Callable[[Any], tuple[Any, ...]] = lambda obj: (single(obj),)  # noqa: E731
+    else:
+        getter = attrgetter(*names)
+
+    if exclude_none:
+        return lambda obj: {
+            key: value
+            for key, value in zip(keys, getter(obj), strict=True)
+            if value is not None
+        }
+    return lambda obj: dict(zip(keys, getter(obj), strict=True))
+
+
+def _reads_attributes(model: type[BaseModel]) -> bool:
+    """Whether reading the model attributes gives its mode="json" dump."""
+    decorators = model.__pydantic_decorators__
+    config = model.model_config
+    if (
+        decorators.model_serializers
+        or decorators.field_serializers
+        or model.model_computed_fields
+    ):
+        return False
+    if config.get("extra") == "allow" or any(
+        key.startswith("ser_json_") for key in config
+    ):
+        return False
+    return _fields_are_native(model.model_fields)
+
+
+def compile_model_encoder(
+    model: type[BaseModel], *, exclude_none: bool = False
+) -> Encoder:
+    """
+    Compile an encoder of a Pydantic model (by alias, mode="json").
+
+    Attributes are read directly only when orjson writes every field the
+    same way pydantic does (see ``_is_orjson_native``). Everything else —
+    custom serializers, computed fields, extra="allow", ``ser_json_*``
+    settings, fields like SecretStr/bytes/timedelta — and ``exclude_none``,
+    which pydantic applies to nested models too, goes through the
+    compiled pydantic-core serializer.
+
+    Args:
+        model: Pydantic model type.
+        exclude_none: Drop fields whose value is None, at every depth.
+
+    Returns:
+        Encoder producing a dict.
+    """
+    if exclude_none or not _reads_attributes(model):
+        return partial(
+            model.__pydantic_serializer__.to_python,
+            mode="json",
+            by_alias=True,
+            exclude_none=exclude_none,
+        )
+
+    fields = {
+        name: info
+        for name, info in model.model_fields.items()
+        if not info.exclude
+    }
+    return compile_fields_encoder(
+        tuple(
+            info.serialization_alias or info.alias or name
+            for name, info in fields.items()
+        ),
+        tuple(fields),
+        exclude_none=exclude_none,
+    )
+
+
+def compile_dump_encoder(model: type[BaseModel]) -> Encoder:
+    """
+    Compile an encoder of a Pydantic model matching ``model_dump(mode="json")``.
+
+    Field names, not aliases; the whole model is dumped in one call of its
+    pydantic-core serializer.
+    """
+    return partial(model.__pydantic_serializer__.to_python, mode="json")
+
+
+def compile_dataclass_encoder(cls: type) -> Encoder:
+    """Compile an encoder of a dataclass (shallow: nested values via orjson)."""
+    names = tuple(field.name for field in dataclasses.fields(cls))
+    return compile_fields_encoder(names, names)
+
+
+def compile_entity_encoder(entity: type, schema: type[BaseModel]) -> Encoder:
+    """
+    Compile an encoder writing a domain dataclass in the schema JSON shape.
+
+    Args:
+        entity: Domain dataclass type.
+        schema: Response schema documenting the entity in OpenAPI.
+
+    Attributes are read directly when the schema fields are orjson-native
+    (nested entities are registered on their own). Otherwise the entity is
+    validated into the schema and dumped by pydantic, so the JSON still
+    matches the documented shape.
+
+    Returns:
+        Encoder producing a dict keyed by the schema serialization names.
+
+    Raises:
+        TypeError: If the entity lacks a field declared by the schema.
+    """
+    entity_fields = {field.name for field in dataclasses.fields(entity)}
+    missing = [name for name in schema.model_fields if name not in entity_fields]
+    if missing:
+        msg = (
+            f"{entity.__name__} has no fields {missing} "
+            f"declared by {schema.__name__}"
+        )
+        raise TypeError(msg)
+    if not _fields_are_native(schema.model_fields):
+        validate = partial(schema.model_validate, from_attributes=True)
+        dump = partial(
+            schema.__pydantic_serializer__.to_python, mode="json", by_alias=True
+        )
+        return lambda obj: dump(validate(obj))
+    return compile_fields_encoder(
+        tuple(
+            info.serialization_alias or info.alias or name
+            for name, info in schema.model_fields.items()
+        ),
+        tuple(schema.model_fields),
+    )
+
+
+def _compile_fallback(cls: type) -> Encoder:
+    """Same decisions as ``ItemSerializer.orjson_default``, made per type."""
+    if issubclass(cls, (set, frozenset)):
+        return list
+    if hasattr(cls, "isoformat"):
+        return lambda obj: obj.isoformat()
+    if hasattr(cls, "hex"):
+        return lambda obj: obj.hex()
+    return _fallback_instance
+
+
+def _fallback_instance(obj: Any) -> Any:  # noqa: ANN401
+    if callable(obj):
+        return f"<{type(obj).__name__}>"
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    return str(obj)
+
+
+class EncoderRegistry:
+    """Compiled encoders keyed by exact type, built lazily on first use."""
+
+    __slots__ = ("_encoders", "_model_encoder", "_registered", "_structured")
+
+    def __init__(
+        self,
+        *,
+        model_encoder: Callable[[type[BaseModel]], Encoder] = (
+            compile_model_encoder
+        ),
+    ) -> None:
+        """
+        Args:
+            model_encoder: Compiles encoders of Pydantic models met
+                without registration.
+        """
+        self._model_encoder = model_encoder
+        self._encoders: dict[type, Encoder] = {MappingProxyType: dict}
+        self._registered: set[type] = set(self._encoders)
+        # Per-type answers of ``structured``, reset on registration
+        self._structured: dict[type, Encoder | None] = {}
+
+    def register(self, cls: type, encoder: Encoder) -> None:
+        self._encoders[cls] = encoder
+        self._registered.add(cls)
+        self._structured.clear()
+
+    def register_model(
+        self, model: type[BaseModel], *, exclude_none: bool = False
+    ) -> None:
+        self.register(
+            model, compile_model_encoder(model, exclude_none=exclude_none)
+        )
+
+    def register_entity(self, entity: type, schema: type[BaseModel]) -> None:
+        self.register(entity, compile_entity_encoder(entity, schema))
+
+    def structured(self, cls: type) -> Encoder | None:
+        """
+        Encoder of a type written as a JSON object or array.
+
+        Registered types, Pydantic models and dataclasses get their
+        encoder; anything else — orjson-native values and types left to
+        the fallback — gets None. Lets a serializer walking the data
+        decide per type, not per object.
+        """
+        try:
+            return self._structured[cls]
+        except KeyError:
+            pass
+        encoder = None
+        if (
+            cls in self._registered
+            or issubclass(cls, BaseModel)
+            or dataclasses.is_dataclass(cls)
+        ):
+            encoder = self.encoder(cls)
+        self._structured[cls] = encoder
+        return encoder
+
+    def encoder(self, cls: type) -> Encoder:
+        """Encoder of the exact type, compiled on first use."""
+        encoder = self._encoders.get(cls)
+        if encoder is None:
+            encoder = self._encoders[cls] = self._compile(cls)
+        return encoder
+
+    def default(self, obj: Any) -> Any:  # noqa: ANN401
+        """orjson ``default`` hook: one dict lookup per non-native object."""
+        encoder = self._encoders.get(type(obj))
+        if encoder is None:
+            encoder = self.encoder(type(obj))
+        return encoder(obj)
+
+    def dumps(self, content: Any) -> bytes:  # noqa: ANN401
+        return orjson.dumps(content, default=self.default, option=_OPTIONS)
+
+    def _compile(self, kind: type) -> Encoder:
+        if issubclass(kind, BaseModel):
+            return self._model_encoder(kind)
+        if dataclasses.is_dataclass(kind):
+            return compile_dataclass_encoder(kind)
+        return _compile_fallback(kind)
+
+
+# Общий реестр для рендера HTTP-ответов
+response_encoders = EncoderRegistry()
+
+# Реестр для payload в логах (ItemSerializer); регистрации форму ответов
+# не меняют. Модели — как model_dump(mode="json"), одним вызовом
+log_encoders = EncoderRegistry(model_encoder=compile_dump_encoder)
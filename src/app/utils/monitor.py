@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import functools
 import inspect
+from dataclasses import dataclass
 from time import perf_counter
 from typing import Any
 from typing import ParamSpec
@@ -20,6 +21,8 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from collections.abc import Coroutine
 
+    from app.domain.interfaces.observability import IEventLogger
+    from app.domain.interfaces.observability import IEventMetrics
     from app.domain.interfaces.observability import ILoggingStrategy
     from app.domain.interfaces.observability import IMetricsStrategy
     from app.domain.interfaces.observability import ITracingStrategy
@@ -52,12 +55,43 @@ def _get_metrics_strategy(
     return strategy
 
 
+@dataclass(frozen=True, slots=True)
+class _EventState:
+    """Per-event objects of the strategies, prepared once."""
+
+    span: Callable[[], Any]
+    logger: IEventLogger
+    metrics: IEventMetrics
+
+
 class _MonitoringHandler:
     """
     Helper class to handle logging and tracing logic for the monitor decorator.
     Delegates to injected strategies.
+
+    Everything that doesn't depend on the call — span name, bound logger,
+    metric attribute sets — is prepared once, so a call only pays for the
+    span, two log records and two measurements. Strategies come from the
+    container, which is wired after the decorated modules are imported,
+    so the state is built on the first call rather than at import.
     """
 
+    __slots__ = (
+        "_logging_strategy",
+        "_metrics_strategy",
+        "_tracing_strategy",
+        "action_when_exception",
+        "event_name",
+        "func",
+        "log_every",
+        "log_max_bytes",
+        "log_slower_than",
+        "reraise",
+        "state",
+        "use_log_args",
+        "use_log_result",
+    )
+
     def __init__(
         self,
         func: Callable[..., Any],
@@ -67,6 +101,9 @@ class _MonitoringHandler:
         action_when_exception: Callable[[Exception], Any] | None = None,
         use_log_args: bool = False,
         use_log_result: bool = False,
+        log_every: int | None = None,
+        log_slower_than: float | None = None,
+        log_max_bytes: int | None = None,
     ) -> None:
         self.func = func
         if isinstance(event_name, Events):
@@ -78,6 +115,10 @@ class _MonitoringHandler:
         self.action_when_exception = action_when_exception
         self.use_log_args = use_log_args
         self.use_log_result = use_log_result
+        self.log_every = log_every
+        self.log_slower_than = log_slower_than
+        self.log_max_bytes = log_max_bytes
+        self.state: _EventState | None = None
 
         self._logging_strategy: ILoggingStrategy | None = None
         self._tracing_strategy: ITracingStrategy | None = None
@@ -101,38 +142,35 @@ class _MonitoringHandler:
             self._metrics_strategy = _get_metrics_strategy()
         return self._metrics_strategy
 
-    def log_start(
-        self, args: tuple[Any, ...], kwargs: dict[str, Any]
-    ) -> tuple[float, Any]:
-        """Logs start and returns (start_time, log_context)."""
-        context = self.logging_strategy.log_start(
-            self.event_name, args, kwargs, use_log_args=self.use_log_args
-        )
-        return perf_counter(), context
-
-    def log_success(self, result: Any, start_time: float, context: Any) -> None:
-        duration = perf_counter() - start_time
-        self.metrics_strategy.record_request(
-            event_name=self.event_name,
-            duration=duration,
-            status="success",
+    def prepare(self) -> _EventState:
+        """Build the per-event state of the strategies."""
+        self.state = _EventState(
+            span=self.tracing_strategy.span_factory(self.event_name),
+            logger=self.logging_strategy.event_logger(
+                self.event_name,
+                use_log_args=self.use_log_args,
+                use_log_result=self.use_log_result,
+                sample_every=self.log_every,
+                slow_threshold=self.log_slower_than,
+                max_bytes=self.log_max_bytes,
+            ),
+            metrics=self.metrics_strategy.event_metrics(self.event_name),
         )
+        return self.state
 
-        self.logging_strategy.log_success(
-            self.event_name, result, context, use_log_result=self.use_log_result
-        )
-
-    def log_error(self, exc: Exception, start_time: float, context: Any) -> None:
-        duration = perf_counter() - start_time
-        error_type = _classify_error(exc)
-        self.metrics_strategy.record_request(
-            event_name=self.event_name,
-            duration=duration,
-            status="error",
-            error_type=error_type,
+    def log_error(
+        self,
+        state: _EventState,
+        exc: Exception,
+        start_time: float,
+        context: Any,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        state.metrics.record_error(
+            perf_counter() - start_time, _classify_error(exc)
         )
-
-        self.logging_strategy.log_error(self.event_name, exc, context)
+        state.logger.log_error(exc, context, args, kwargs)
 
         if self.action_when_exception:
             self._safe_execute_callback(exc)
@@ -159,18 +197,23 @@ def _async_wrapper(
 ) -> Callable[P, Coroutine[Any, Any, R]]:
     @functools.wraps(func)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        span = handler.tracing_strategy.start_span(handler.event_name)
-        with span:
-            start_time, context = handler.log_start(args, kwargs)
+        state = handler.state or handler.prepare()
+        with state.span():
+            context = state.logger.log_start(args, kwargs)
+            start_time = perf_counter()
             try:
                 result = await func(*args, **kwargs)
             except Exception as exc:
-                handler.log_error(exc, start_time, context)
+                handler.log_error(
+                    state, exc, start_time, context, args, kwargs
+                )
                 if handler.reraise:
                     raise
                 return cast("R", None)
 
-            handler.log_success(result, start_time, context)
+            duration = perf_counter() - start_time
+            state.metrics.record_success(duration)
+            state.logger.log_success(result, context, args, kwargs, duration)
             return result
 
     return wrapper
@@ -182,23 +225,34 @@ def _sync_wrapper(
 ) -> Callable[P, R]:
     @functools.wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        span = handler.tracing_strategy.start_span(handler.event_name)
-        with span:
-            start_time, context = handler.log_start(args, kwargs)
+        state = handler.state or handler.prepare()
+        with state.span():
+            context = state.logger.log_start(args, kwargs)
+            start_time = perf_counter()
             try:
                 result = func(*args, **kwargs)
             except Exception as exc:
-                handler.log_error(exc, start_time, context)
+                handler.log_error(
+                    state, exc, start_time, context, args, kwargs
+                )
                 if handler.reraise:
                     raise
                 return cast("R", None)
 
-            handler.log_success(result, start_time, context)
+            duration = perf_counter() - start_time
+            state.metrics.record_success(duration)
+            state.logger.log_success(result, context, args, kwargs, duration)
             return result
 
     return wrapper
 
 
+def _check_positive(name: str, value: float | None) -> None:
+    if value is not None and value <= 0:
+        msg = f"monitor({name}={value!r}): must be positive or None"
+        raise ValueError(msg)
+
+
 def monitor(
     event_name: Events | str,
     *,
@@ -206,8 +260,26 @@ def monitor(
     action_when_exception: Callable[[Exception], Any] | None = None,
     use_log_args: bool = True,
     use_log_result: bool = True,
+    log_every: int | None = None,
+    log_slower_than: float | None = None,
+    log_max_bytes: int | None = None,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
-    """Decorator factory for monitoring function execution."""
+    """
+    Decorator factory for monitoring function execution.
+
+    Arguments and result are logged for 1 in ``log_every`` successful
+    calls, for calls slower than ``log_slower_than`` seconds and for
+    every error, within ``log_max_bytes`` of JSON per record. None takes
+    the value from ``LOGGING.PAYLOAD``.
+
+    Raises:
+        ValueError: If ``log_every``, ``log_slower_than`` or
+            ``log_max_bytes`` is not positive — at decoration time,
+            not on the first call.
+    """
+    _check_positive("log_every", log_every)
+    _check_positive("log_slower_than", log_slower_than)
+    _check_positive("log_max_bytes", log_max_bytes)
 
     def decorator(
         func: Callable[P, R] | Callable[P, Coroutine[Any, Any, R]],
@@ -219,6 +291,9 @@ def monitor(
             action_when_exception=action_when_exception,
             use_log_args=use_log_args,
             use_log_result=use_log_result,
+            log_every=log_every,
+            log_slower_than=log_slower_than,
+            log_max_bytes=log_max_bytes,
         )
 
         if inspect.iscoroutinefunction(func):
@@ -237,4 +312,3 @@ def monitor(
         "Callable[[Callable[P, R] | Callable[P, Coroutine[Any, Any, R]]], Any]",
         decorator,
     )
-
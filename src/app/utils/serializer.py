@@ -2,18 +2,90 @@ from __future__ import annotations
 
 import logging
 from collections import deque
-from dataclasses import asdict
-from dataclasses import is_dataclass
+from collections.abc import Iterator
 from typing import Any
 
+import numpy as np
 import orjson
-from pydantic import BaseModel
 from starlette.responses import JSONResponse
 
 from app.utils.configs import SerializationConfig
+from app.utils.encoders import EncoderRegistry
+from app.utils.encoders import log_encoders
+from app.utils.encoders import response_encoders
 
 logger = logging.getLogger(__name__)
 
+_END = object()  # exhausted container iterator
+_SCALAR_TYPES = frozenset({int, float, bool, type(None)})
+_CONTAINER_TYPES = (dict, list, tuple, set, frozenset, deque)
+
+
+def _fits(root: Any, limit: int, max_string: int, max_items: int) -> bool:
+    """
+    Whether plain JSON data fits ``limit`` bytes with no truncation.
+
+    The probe only reads types and lengths, stops as soon as the estimate
+    goes over ``limit`` and rejects anything orjson would need ``default``
+    for, so it costs a fraction of walking the data item by item.
+    """
+    size = 0
+    stack = [root]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is str:
+            if len(value) > max_string:
+                return False
+            size += len(value) + 2
+        elif value_type in _SCALAR_TYPES:
+            size += 5
+        elif value_type is dict:
+            if len(value) > max_items:
+                return False
+            for key in value:
+                if type(key) is not str or len(key) > max_string:
+                    return False
+                size += len(key) + 4
+            stack.extend(value.values())
+        elif value_type is list or value_type is tuple:
+            if len(value) > max_items:
+                return False
+            size += len(value) + 2
+            stack.extend(value)
+        else:
+            return False
+        if size > limit:
+            return False
+    return True
+
+
+class RawJSON:
+    """
+    Payload already encoded to JSON, bound to log records as is.
+
+    The JSON log format embeds the bytes with ``orjson.Fragment`` and the
+    text format prints them, so the payload is never parsed back.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def __repr__(self) -> str:
+        return self.data.decode()
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RawJSON) and other.data == self.data
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+
+def _raw_fragment(raw: RawJSON) -> orjson.Fragment:
+    return orjson.Fragment(raw.data)
+
 
 class ItemSerializer:
     """
@@ -23,12 +95,23 @@ class ItemSerializer:
     1. Try orjson first (handles 99% of cases fast)
     2. If orjson fails → iterative Python serialization
     3. If anything fails → return str(obj) or "<unserializable>"
+
+    Objects orjson doesn't support are converted by per-type encoders of
+    ``encoders`` (``log_encoders`` by default), compiled on first sight
+    of a type. Domain types and Pydantic models can be registered there
+    to control their shape in logs.
     """
 
-    __slots__ = ("config", "_stats")
+    __slots__ = ("config", "encoders", "_stats")
 
-    def __init__(self, config: SerializationConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: SerializationConfig | None = None,
+        encoders: EncoderRegistry | None = None,
+    ) -> None:
         self.config = config or SerializationConfig()
+        self.encoders = encoders or log_encoders
+        self.encoders.register(RawJSON, _raw_fragment)
         self._stats: dict[str, int] = {
             "orjson_success": 0,
             "orjson_fallback": 0,
@@ -37,6 +120,7 @@ class ItemSerializer:
             "fallbacks_triggered": 0,
             "total_objects": 0,
             "errors_caught": 0,
+            "truncated": 0,
         }
 
     def serialize(self, obj: Any) -> Any:
@@ -55,17 +139,176 @@ class ItemSerializer:
             )
             return self._safe_fallback(obj)
 
+    def serialize_bounded(self, obj: Any, max_bytes: int) -> tuple[Any, int]:
+        """
+        Fail-safe serialization within a byte budget. NEVER raises.
+
+        Args:
+            obj: Object to serialize.
+            max_bytes: Budget of the JSON representation.
+
+        Returns:
+            Serialized object, truncated as by ``encode_bounded``, and the
+            bytes of its JSON.
+        """
+        data = self.encode_bounded(obj, max_bytes).data
+        return orjson.loads(data), len(data)
+
+    def encode_bounded(self, obj: Any, max_bytes: int) -> RawJSON:
+        """
+        Fail-safe serialization straight to JSON within a byte budget.
+
+        Limits are enforced while the object is walked, so a huge payload
+        costs no more CPU than its truncated JSON:
+
+        * strings are cut to ``max_string`` characters and to the budget
+          left, with a ``...<truncated, N chars>`` suffix;
+        * containers keep ``max_items`` items, followed by a
+          ``"...<N more items>"`` item (``"...": "<N more items>"`` in
+          objects);
+        * once ``max_bytes`` are written, the current container gets a
+          ``"...<truncated>"`` item and every open container is closed;
+          other values over the budget left become a marker string.
+
+        The result is always valid JSON; markers and closing brackets may
+        take it a few bytes over ``max_bytes``. NEVER raises.
+        """
+        try:
+            return RawJSON(self._encode_bounded(obj, max_bytes))
+        except Exception:
+            self._stats["errors_caught"] += 1
+            return RawJSON(orjson.dumps(self._safe_fallback(obj)))
+
+    def _encode_bounded(self, root: Any, max_bytes: int) -> bytes:
+        max_string = self.config.max_string
+        max_items = self.config.max_items
+        out: list[bytes] = []
+        used = 0
+        truncated = False
+        # Open containers: [items iterator, closing bracket, is object,
+        # items written, items total, id]
+        stack: list[list[Any]] = []
+        open_ids: set[int] = set()
+
+        def emit(data: bytes) -> None:
+            nonlocal used
+            out.append(data)
+            used += len(data)
+
+        def write(value: Any) -> None:
+            """Write a scalar or open a container for the loop below."""
+            nonlocal truncated
+            left = max_bytes - used
+            if isinstance(value, str):
+                limit = min(max_string, max(left - 2, 0))
+                if len(value) > limit:
+                    truncated = True
+                    value = f"{value[:limit]}...<truncated, {len(value)} chars>"
+                emit(orjson.dumps(value))
+                return
+            # Arrays over max_items are walked like lists, so only the
+            # items that get written are converted
+            is_array = (
+                isinstance(value, np.ndarray)
+                and value.ndim > 0
+                and value.size > max_items
+            )
+            if not is_array and not isinstance(value, _CONTAINER_TYPES):
+                # Models, dataclasses and registered types are walked as
+                # the dict of their fields; nested values stay lazy
+                encoder = self.encoders.structured(type(value))
+                if encoder is not None:
+                    write(encoder(value))
+                    return
+                try:
+                    data = orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+                except TypeError:
+                    write(self.orjson_default(value))
+                    return
+                if len(data) > left:
+                    truncated = True
+                    data = orjson.dumps(
+                        f"<{type(value).__name__}, truncated, {len(data)} bytes>"
+                    )
+                emit(data)
+            elif id(value) in open_ids:
+                self._stats["cycles_detected"] += 1
+                emit(b'"<cycle>"')
+            elif len(stack) >= self.config.max_depth:
+                truncated = True
+                emit(b'"<max_depth_exceeded>"')
+            elif (data := self._plain_json(value, left)) and len(
+                data
+            ) <= left:
+                # Plain data within the limits is written by orjson at once
+                emit(data)
+            else:
+                is_object = isinstance(value, dict)
+                emit(b"{" if is_object else b"[")
+                items: Iterator[Any] = iter(
+                    value.items() if isinstance(value, dict) else value
+                )
+                closing = b"}" if is_object else b"]"
+                stack.append(
+                    [items, closing, is_object, 0, len(value), id(value)]
+                )
+                open_ids.add(id(value))
+
+        write(root)
+        while stack:
+            frame = stack[-1]
+            items, closing, is_object, written, total, container_id = frame
+            item: Any = next(items, _END)
+            if item is not _END and (written >= max_items or used >= max_bytes):
+                # The rest of the container is replaced by a marker; with
+                # the budget spent, every outer container gets one too
+                truncated = True
+                marker = (
+                    f"<{total - written} more items>"
+                    if used < max_bytes
+                    else "<truncated>"
+                )
+                if written:
+                    emit(b",")
+                emit(
+                    b'"...":' + orjson.dumps(marker)
+                    if is_object
+                    else orjson.dumps(f"...{marker}")
+                )
+                item = _END
+            if item is _END:
+                emit(closing)
+                stack.pop()
+                open_ids.discard(container_id)
+                continue
+            if written:
+                emit(b",")
+            frame[3] = written + 1
+            if is_object:
+                key, item = item
+                key = key if isinstance(key, str) else str(key)
+                emit(orjson.dumps(key[:max_string]) + b":")
+            write(item)
+
+        if truncated:
+            self._stats["truncated"] += 1
+        return b"".join(out)
+
+    def _plain_json(self, container: Any, limit: int) -> bytes:
+        """JSON of a container needing no truncation, b"" if it may."""
+        config = self.config
+        if not _fits(container, limit, config.max_string, config.max_items):
+            return b""
+        try:
+            return orjson.dumps(container)
+        except TypeError:  # an int over 64 bits or too deep nesting
+            return b""
+
     def _serialize_internal(self, obj: Any) -> Any:
         """Internal serialization that may raise exceptions."""
         if self.config.use_orjson:
             try:
-                serialized = orjson.loads(
-                    orjson.dumps(
-                        obj,
-                        default=self.orjson_default,
-                        option=orjson.OPT_SERIALIZE_NUMPY,
-                    )
-                )
+                serialized = orjson.loads(self.encoders.dumps(obj))
                 self._stats["orjson_success"] += 1
                 return serialized
 
@@ -79,33 +322,14 @@ class ItemSerializer:
 
         return self._serialize_iterative(obj)
 
-    @staticmethod
-    def orjson_default(obj: Any) -> Any:
-        """Custom handler for orjson for types it doesn't support."""
-        if isinstance(obj, BaseModel):
-            return obj.model_dump(mode="json")
-
-        if is_dataclass(obj) and not isinstance(obj, type):
-            return asdict(obj)
-
-        if isinstance(obj, (set, frozenset)):
-            return list(obj)
-
-        if hasattr(obj, "isoformat"):
-            return obj.isoformat()
-
-        if hasattr(obj, "hex"):
-            return obj.hex()
-
-        # Skip callable objects (functions, methods, mocks) to avoid issues
-        if callable(obj):
-            return f"<{type(obj).__name__}>"
-
-        if hasattr(obj, "__dict__"):
-            return obj.__dict__
+    def orjson_default(self, obj: Any) -> Any:
+        """
+        Custom handler for orjson for types it doesn't support.
 
-        # Final fallback for orjson - convert to string
-        return str(obj)
+        One dict lookup per object: the encoder of the exact type is
+        taken from ``encoders``, compiled on first sight of the type.
+        """
+        return self.encoders.default(obj)
 
     def _serialize_iterative(self, root: Any) -> Any:
         """
@@ -118,6 +342,7 @@ class ItemSerializer:
         stack: deque[tuple[Any, int]] = deque([(root, 0)])
         seen: dict[int, Any] = {}
         processing_order: list[int] = []
+        converted: list[Any] = []
         max_depth_seen = 0
         object_count = 0
 
@@ -155,11 +380,13 @@ class ItemSerializer:
             processing_order.append(obj_id)
 
             try:
-                if isinstance(current, BaseModel):
-                    seen[obj_id] = current.model_dump(mode="json")
-                elif is_dataclass(current) and not isinstance(current, type):
-                    seen[obj_id] = asdict(current)
-                elif isinstance(current, dict):
+                if not isinstance(current, _CONTAINER_TYPES):
+                    # Models, dataclasses, registered types: the cached
+                    # encoder of the type, its output is walked in place.
+                    # Kept alive, so ids of its items aren't reused
+                    current = self.orjson_default(current)
+                    converted.append(current)
+                if isinstance(current, dict):
                     result: dict[str, Any] = {}
                     for key, val in current.items():
                         str_key = str(key)
@@ -169,7 +396,7 @@ class ItemSerializer:
                             result[str_key] = ("__ref__", id(val))
                             stack.append((val, depth + 1))
                     seen[obj_id] = result
-                elif isinstance(current, (list, tuple, set, frozenset)):
+                elif isinstance(current, _CONTAINER_TYPES):
                     result_list: list[Any] = []
                     for item in current:
                         if self._is_primitive(item):
@@ -217,13 +444,7 @@ class ItemSerializer:
             return obj
 
         try:
-            if hasattr(obj, "isoformat"):
-                return obj.isoformat()
-            if hasattr(obj, "hex"):
-                return obj.hex()
-            if hasattr(obj, "__dict__"):
-                return obj.__dict__
-            return str(obj)
+            return self.orjson_default(obj)
         except Exception:
             return self._safe_fallback(obj)
 
@@ -256,11 +477,9 @@ class AdvORJSONResponse(JSONResponse):
     def _serialize_to_bytes(cls, obj: Any) -> bytes:
         """Serialize object to bytes for FastAPI Response."""
         try:
-            return orjson.dumps(
-                obj,
-                default=ItemSerializer.orjson_default,
-                option=orjson.OPT_SERIALIZE_NUMPY,
-            )
+            # Encoders are compiled once per type (models, dataclasses,
+            # registered domain entities) and cached by type
+            return response_encoders.dumps(obj)
         except (TypeError, ValueError, RecursionError):
             # Fallback: encode string as bytes
             return orjson.dumps(str(obj))
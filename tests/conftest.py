@@ -8,6 +8,9 @@ from httpx import AsyncClient
 from app.core.app_factory import create_app
 
 
+ADMIN_TOKEN = "test-admin-token"  # noqa: S105
+
+
 @pytest.fixture(scope="session")
 def anyio_backend() -> str:
     return "asyncio"
@@ -15,7 +18,16 @@ def anyio_backend() -> str:
 
 @pytest.fixture(scope="session")
 def app() -> FastAPI:
-    return create_app()
+    # /admin is mounted only with ADMIN.ENABLED and a token
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("ADMIN__ENABLED", "true")
+        patch.setenv("ADMIN__TOKEN", ADMIN_TOKEN)
+        return create_app()
+
+
+@pytest.fixture(scope="session")
+def admin_headers() -> dict[str, str]:
+    return {"X-Admin-Token": ADMIN_TOKEN}
 
 
 @pytest.fixture(scope="session")
@@ -0,0 +1,139 @@
+from time import monotonic
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.infrastructure.observability.route_profiles import (
+    RouteProfileAggregator,
+)
+from tests.schemas.e2e.api.profiles import FlamegraphEntity
+from tests.schemas.e2e.api.profiles import FlamegraphExpected
+
+
+ROUTE = "POST /v1/answer/generate"
+HANDLER = ("search.py", 10, "generate_answer")
+SEARCH = ("search.py", 20, "search_until")
+
+
+@pytest.fixture()
+def aggregator(app: FastAPI) -> RouteProfileAggregator:
+    aggregator = app.state.container.route_profiles()
+    stacks = {(HANDLER,): 0.5, (HANDLER, SEARCH): 1.5}
+    aggregator.add(ROUTE, stacks, monotonic())
+    return aggregator
+
+
+@pytest.mark.anyio()
+@pytest.mark.usefixtures("aggregator")
+async def test_list_flamegraphs(
+    client: AsyncClient,
+    admin_headers: dict[str, str],
+) -> None:
+    # Act
+    response = await client.get("/admin/flamegraphs", headers=admin_headers)
+
+    # Assert
+    assert response.status_code == 200, (
+        f"Test failed, actual status = {response.status_code}, "
+        f"but expected status was = 200"
+    )
+    routes = {item["route"]: item for item in response.json()}
+    assert ROUTE in routes, (
+        f"Test failed, actual routes = {list(routes)}, "
+        f"but expected route {ROUTE} to be present"
+    )
+    assert routes[ROUTE]["seconds"] >= 2.0, (
+        f"Test failed, actual seconds = {routes[ROUTE]['seconds']}, "
+        f"but expected at least 2.0"
+    )
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            FlamegraphEntity(format="collapsed", route=ROUTE),
+            FlamegraphExpected(
+                status_code=200,
+                content_type="text/plain",
+                body_part="generate_answer (search.py:10);search_until",
+            ),
+            id="collapsed_route",
+        ),
+        pytest.param(
+            FlamegraphEntity(format="collapsed"),
+            FlamegraphExpected(
+                status_code=200,
+                content_type="text/plain",
+                body_part=f"{ROUTE};generate_answer (search.py:10)",
+            ),
+            id="collapsed_all_routes",
+        ),
+        pytest.param(
+            FlamegraphEntity(format="speedscope", route=ROUTE),
+            FlamegraphExpected(
+                status_code=200,
+                content_type="application/json",
+                body_part='"name":"POST /v1/answer/generate"',
+            ),
+            id="speedscope_route",
+        ),
+        pytest.param(
+            FlamegraphEntity(format="speedscope", route="GET /unknown"),
+            FlamegraphExpected(
+                status_code=404,
+                content_type="application/json",
+            ),
+            id="route_not_profiled",
+        ),
+    ],
+)
+@pytest.mark.usefixtures("aggregator")
+async def test_download_flamegraph(
+    client: AsyncClient,
+    admin_headers: dict[str, str],
+    entity: FlamegraphEntity,
+    expected: FlamegraphExpected,
+) -> None:
+    # Act
+    response = await client.get(
+        "/admin/flamegraphs/stacks",
+        params=entity.model_dump(exclude_none=True),
+        headers=admin_headers,
+    )
+
+    # Assert
+    assert response.status_code == expected.status_code, (
+        f"Test failed, actual status = {response.status_code}, "
+        f"but expected status was = {expected.status_code}"
+    )
+    content_type = response.headers["content-type"]
+    assert content_type.startswith(expected.content_type), (
+        f"Test failed, actual content type = {content_type}, "
+        f"but expected content type was = {expected.content_type}"
+    )
+    if expected.body_part:
+        assert expected.body_part in response.text, (
+            f"Test failed, actual body = {response.text[:200]}, "
+            f"but expected to contain = {expected.body_part}"
+        )
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    "url", ["/admin/flamegraphs", "/admin/flamegraphs/stacks"]
+)
+async def test_flamegraphs_require_admin_token(
+    client: AsyncClient,
+    url: str,
+) -> None:
+    # Act
+    response = await client.get(url)
+
+    # Assert
+    assert response.status_code == 401, (
+        f"Test failed, actual status = {response.status_code}, "
+        f"but expected status was = 401"
+    )
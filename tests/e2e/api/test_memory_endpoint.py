@@ -0,0 +1,114 @@
+from datetime import UTC
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.infrastructure.observability.memory_store import AllocationSite
+from app.infrastructure.observability.memory_store import StoredMemoryProfile
+from tests.schemas.e2e.api.memory import MemoryEndpointEntity
+from tests.schemas.e2e.api.memory import MemoryEndpointExpected
+
+
+ROUTE = "POST /v1/answer/generate"
+PROFILE_ID = 1_000_001
+
+
+@pytest.fixture()
+def profile(app: FastAPI) -> StoredMemoryProfile:
+    stored = StoredMemoryProfile(
+        id=PROFILE_ID,
+        method="POST",
+        path="/v1/answer/generate",
+        route=ROUTE,
+        captured_at=datetime(2026, 1, 1, tzinfo=UTC),
+        duration=0.25,
+        net_bytes=4096,
+        peak_bytes=65536,
+        sites=(
+            AllocationSite(
+                file="search_repository.py", line=42, size=4096, count=3
+            ),
+        ),
+    )
+    app.state.container.memory_profile_store().add(stored)
+    return stored
+
+
+@pytest.mark.anyio()
+@pytest.mark.usefixtures("profile")
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            MemoryEndpointEntity(url="/admin/memory/routes"),
+            MemoryEndpointExpected(
+                status_code=200, body_part='"route":"POST /v1/answer/generate"'
+            ),
+            id="routes",
+        ),
+        pytest.param(
+            MemoryEndpointEntity(url="/admin/memory/profiles"),
+            MemoryEndpointExpected(
+                status_code=200, body_part=f'"id":{PROFILE_ID}'
+            ),
+            id="profiles",
+        ),
+        pytest.param(
+            MemoryEndpointEntity(url=f"/admin/memory/profiles/{PROFILE_ID}"),
+            MemoryEndpointExpected(
+                status_code=200,
+                body_part='"file":"search_repository.py","line":42',
+            ),
+            id="profile_sites",
+        ),
+        pytest.param(
+            MemoryEndpointEntity(url="/admin/memory/profiles/999999999"),
+            MemoryEndpointExpected(status_code=404),
+            id="evicted_profile",
+        ),
+    ],
+)
+async def test_memory_endpoints(
+    client: AsyncClient,
+    admin_headers: dict[str, str],
+    entity: MemoryEndpointEntity,
+    expected: MemoryEndpointExpected,
+) -> None:
+    # Act
+    response = await client.get(entity.url, headers=admin_headers)
+
+    # Assert
+    assert response.status_code == expected.status_code, (
+        f"Test failed, actual status = {response.status_code}, "
+        f"but expected status was = {expected.status_code}"
+    )
+    if expected.body_part:
+        assert expected.body_part in response.text, (
+            f"Test failed, actual body = {response.text[:200]}, "
+            f"but expected to contain = {expected.body_part}"
+        )
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/admin/memory/routes",
+        "/admin/memory/profiles",
+        f"/admin/memory/profiles/{PROFILE_ID}",
+    ],
+)
+async def test_memory_endpoints_require_admin_token(
+    client: AsyncClient,
+    url: str,
+) -> None:
+    # Act
+    response = await client.get(url)
+
+    # Assert
+    assert response.status_code == 401, (
+        f"Test failed, actual status = {response.status_code}, "
+        f"but expected status was = 401"
+    )
@@ -13,7 +13,7 @@ from tests.schemas.e2e.api.metrics import MetricsExpected
         pytest.param(
             MetricsEntity(
                 path="/common/metrics",
-                trigger_path="/common/healthcheck",
+                trigger_path="/v1/search?query=metrics",
             ),
             MetricsExpected(
                 status_code=200,
@@ -21,7 +21,7 @@ from tests.schemas.e2e.api.metrics import MetricsExpected
                 contains=[
                     METRICS_REQUESTS_TOTAL_NAME,
                     'status="success"',
-                    'event="HEALTHCHECK"',
+                    'event="SEARCH_SERVICE_UNTIL"',
                     'le="0.005"',
                 ],
             ),
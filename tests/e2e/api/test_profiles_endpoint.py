@@ -0,0 +1,165 @@
+import pstats
+from datetime import UTC
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.infrastructure.observability.profile_store import StoredProfile
+from tests.schemas.e2e.api.profiles import ProfileDownloadEntity
+from tests.schemas.e2e.api.profiles import ProfileDownloadExpected
+
+
+HANDLER = ("search.py", 10, "handler")
+SEARCH = ("search.py", 20, "search")
+
+
+@pytest.fixture()
+def profile(app: FastAPI) -> StoredProfile:
+    store = app.state.container.profile_store()
+    stored = StoredProfile(
+        id=store.next_id(),
+        method="GET",
+        path="/v1/search",
+        captured_at=datetime(2026, 1, 1, tzinfo=UTC),
+        duration=0.25,
+        mode="cprofile",
+        stats={
+            HANDLER: (1, 1, 0.05, 0.2, {}),
+            SEARCH: (1, 1, 0.15, 0.15, {HANDLER: (1, 1, 0.15, 0.15)}),
+        },
+    )
+    store.add(stored)
+    return stored
+
+
+@pytest.mark.anyio()
+async def test_list_profiles(
+    client: AsyncClient,
+    admin_headers: dict[str, str],
+    profile: StoredProfile,
+) -> None:
+    # Act
+    response = await client.get("/admin/profiles", headers=admin_headers)
+
+    # Assert
+    assert response.status_code == 200, (
+        f"Test failed, actual status = {response.status_code}, "
+        f"but expected status was = 200"
+    )
+    latest = response.json()[0]
+    assert latest["id"] == profile.id, (
+        f"Test failed, actual id = {latest['id']}, "
+        f"but expected id was = {profile.id}"
+    )
+    assert set(latest) == {
+        "id", "method", "path", "captured_at", "duration", "mode"
+    }, f"Test failed, actual keys = {set(latest)}"
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            ProfileDownloadEntity(format="prof"),
+            ProfileDownloadExpected(
+                content_type="application/octet-stream", extension=".prof"
+            ),
+            id="pstats",
+        ),
+        pytest.param(
+            ProfileDownloadEntity(format="speedscope"),
+            ProfileDownloadExpected(
+                content_type="application/json",
+                extension=".speedscope.json",
+            ),
+            id="speedscope",
+        ),
+    ],
+)
+async def test_download_profile(
+    tmp_path: Path,
+    client: AsyncClient,
+    admin_headers: dict[str, str],
+    profile: StoredProfile,
+    entity: ProfileDownloadEntity,
+    expected: ProfileDownloadExpected,
+) -> None:
+    # Act
+    response = await client.get(
+        f"/admin/profiles/{profile.id}",
+        params={"format": entity.format},
+        headers=admin_headers,
+    )
+
+    # Assert
+    assert response.status_code == 200, (
+        f"Test failed, actual status = {response.status_code}, "
+        f"but expected status was = 200"
+    )
+    content_type = response.headers["content-type"]
+    assert content_type.startswith(expected.content_type), (
+        f"Test failed, actual content type = {content_type}, "
+        f"but expected content type was = {expected.content_type}"
+    )
+    disposition = response.headers["content-disposition"]
+    assert disposition.endswith(f'{expected.extension}"'), (
+        f"Test failed, actual disposition = {disposition}, "
+        f"but expected extension was = {expected.extension}"
+    )
+    if entity.format == "prof":
+        downloaded = tmp_path / "downloaded.prof"
+        downloaded.write_bytes(response.content)
+        loaded = pstats.Stats(str(downloaded))
+        stats = loaded.stats  # type: ignore[attr-defined]
+        assert stats == profile.stats, (
+            "Test failed, downloaded .prof differs from the stored stats"
+        )
+    else:
+        weights = sorted(response.json()["profiles"][0]["weights"])
+        assert weights == [0.05, 0.15], (
+            f"Test failed, actual weights = {weights}, "
+            f"but expected weights was = [0.05, 0.15]"
+        )
+
+
+@pytest.mark.anyio()
+async def test_download_evicted_profile(
+    client: AsyncClient,
+    admin_headers: dict[str, str],
+) -> None:
+    # Act
+    response = await client.get(
+        "/admin/profiles/999999", headers=admin_headers
+    )
+
+    # Assert
+    assert response.status_code == 404, (
+        f"Test failed, actual status = {response.status_code}, "
+        f"but expected status was = 404"
+    )
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    "headers",
+    [
+        pytest.param({}, id="no_token"),
+        pytest.param({"X-Admin-Token": "wrong"}, id="wrong_token"),
+    ],
+)
+async def test_profiles_require_admin_token(
+    client: AsyncClient,
+    headers: dict[str, str],
+) -> None:
+    # Act
+    response = await client.get("/admin/profiles", headers=headers)
+
+    # Assert
+    assert response.status_code == 401, (
+        f"Test failed, actual status = {response.status_code}, "
+        f"but expected status was = 401"
+    )
@@ -1,6 +1,11 @@
+from unittest.mock import AsyncMock
+
 import pytest
 from httpx import AsyncClient
 
+from app.infrastructure.persistence.repositories.search_repository import (
+    SearchRepository,
+)
 from app.presentation.api.schemas.search import SearchRequest
 from tests.schemas.e2e.api.search import InvalidSearchEntity
 from tests.schemas.e2e.api.search import InvalidSearchExpected
@@ -99,3 +104,37 @@ async def test_search_endpoint_invalid_payload(
         f"Test failed, actual status = {response.status_code}, "
         f"but expected status was = {expected.status_code}"
     )
+
+
+@pytest.mark.anyio()
+async def test_search_not_modified_skips_repository(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    response = await client.get("/v1/search", params={"query": "poll"})
+    etag = response.headers.get("ETag")
+    assert etag is not None, "Test failed, search response has no ETag"
+
+    search_until = AsyncMock()
+    monkeypatch.setattr(SearchRepository, "search_until", search_until)
+
+    # Act
+    not_modified = await client.get(
+        "/v1/search",
+        params={"query": "poll"},
+        headers={"If-None-Match": etag},
+    )
+
+    # Assert
+    assert not_modified.status_code == 304, (
+        f"Test failed, actual status = {not_modified.status_code}, "
+        f"but expected status was = 304"
+    )
+    actual_etag = not_modified.headers.get("ETag")
+    assert actual_etag == etag, (
+        f"Test failed, actual ETag = {actual_etag}, "
+        f"but expected ETag was = {etag}"
+    )
+    assert not not_modified.content, "Test failed, 304 response has a body"
+    search_until.assert_not_awaited()
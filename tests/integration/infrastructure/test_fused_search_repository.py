@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+from app.domain.entities.deadline import Deadline
+from app.domain.entities.document import Document
+from app.domain.entities.document_batch import DocumentBatch
+from app.domain.entities.search_result import SearchResult
+from app.infrastructure.persistence.repositories.fused_search_repository import (
+    FusedSearchRepository,
+)
+from app.infrastructure.persistence.repositories.fused_search_repository import (
+    fuse_rrf,
+)
+from app.infrastructure.persistence.repositories.fused_search_repository import (
+    fuse_rrf_batch,
+)
+from tests.schemas.integration.infrastructure.fused_search_repository import (
+    FusedSearchEntity,
+)
+from tests.schemas.integration.infrastructure.fused_search_repository import (
+    FusedSearchExpected,
+)
+
+
+class DelayedLeg:
+    def __init__(self, name: str, delay: float, *, fail: bool = False) -> None:
+        self._name = name
+        self._delay = delay
+        self._fail = fail
+
+    async def search(self, query: str) -> list[Document]:
+        await asyncio.sleep(self._delay)
+        if self._fail:
+            msg = f"{self._name} is unavailable"
+            raise ConnectionError(msg)
+        return [Document(text=f"{self._name}: {query}")]
+
+    async def search_until(
+        self, query: str, deadline: Deadline
+    ) -> SearchResult:
+        return SearchResult(documents=await self.search(query))
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            FusedSearchEntity(
+                query="q",
+                timeout=1.0,
+                leg_delays={"bm25": 0.0, "dense": 0.0},
+            ),
+            FusedSearchExpected(partial=False, texts=["bm25: q", "dense: q"]),
+            id="all_legs_in_time",
+        ),
+        pytest.param(
+            FusedSearchEntity(
+                query="q",
+                timeout=0.05,
+                leg_delays={"bm25": 0.0, "dense": 5.0},
+            ),
+            FusedSearchExpected(partial=True, texts=["bm25: q"]),
+            id="slow_leg_dropped",
+        ),
+        pytest.param(
+            FusedSearchEntity(
+                query="q",
+                timeout=0.05,
+                leg_delays={"bm25": 5.0, "dense": 5.0},
+            ),
+            FusedSearchExpected(partial=True, texts=[]),
+            id="all_legs_dropped",
+        ),
+        pytest.param(
+            FusedSearchEntity(
+                query="q",
+                timeout=1.0,
+                leg_delays={"bm25": 0.0, "dense": 0.0},
+                failing_legs=["dense"],
+            ),
+            FusedSearchExpected(partial=True, texts=["bm25: q"]),
+            id="failed_leg_dropped",
+        ),
+    ],
+)
+async def test_fused_search_until(
+    entity: FusedSearchEntity,
+    expected: FusedSearchExpected,
+) -> None:
+    # Arrange
+    repository = FusedSearchRepository(
+        legs={
+            name: DelayedLeg(name, delay, fail=name in entity.failing_legs)
+            for name, delay in entity.leg_delays.items()
+        }
+    )
+
+    # Act
+    result = await repository.search_until(
+        query=entity.query, deadline=Deadline.after(entity.timeout)
+    )
+
+    # Assert
+    assert result.partial == expected.partial, (
+        f"Test failed, actual partial = {result.partial}, "
+        f"but expected partial was = {expected.partial}"
+    )
+    actual_texts = [doc.text for doc in result.documents]
+    assert actual_texts == expected.texts, (
+        f"Test failed, actual texts = {actual_texts}, "
+        f"but expected texts were = {expected.texts}"
+    )
+
+
+def test_fuse_rrf_batch_matches_row_fusion() -> None:
+    # Arrange
+    bm25 = [Document(text=t) for t in ["a", "b", "c"]]
+    dense = [Document(text=t) for t in ["c", "d", "a"]]
+    sparse = [Document(text=t) for t in ["d", "e"]]
+    rankings = [bm25, dense, sparse]
+
+    # Act
+    fused = fuse_rrf_batch(
+        DocumentBatch.from_documents(ranking) for ranking in rankings
+    )
+
+    # Assert
+    expected = [document.text for document in fuse_rrf(rankings)]
+    assert fused.texts() == expected, (
+        f"Test failed, actual texts = {fused.texts()}, "
+        f"but expected texts were = {expected}"
+    )
+    assert list(fused.scores) == sorted(fused.scores, reverse=True)
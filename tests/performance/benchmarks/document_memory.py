@@ -0,0 +1,66 @@
+"""
+Memory footprint of Document for a large in-memory result set.
+
+Сравнивает прежнее представление (dataclass с ``__dict__`` и собственным
+dict metadata на экземпляр) с компактным ``Document``.
+
+Запуск::
+
+    uv run python -m tests.performance.benchmarks.document_memory --count 1000000
+"""
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from app.domain.entities.document import Document
+
+
+@dataclass
+class LegacyDocument:
+    text: str
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+def measure(factory: Callable[[int], object], count: int) -> int:
+    """Bytes retained by ``count`` objects built by ``factory``."""
+    gc.collect()
+    tracemalloc.start()
+    items = [factory(i) for i in range(count)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+    count: int = args.count
+    # Texts are built up front: only per-document overhead is measured
+    texts = [f"Result for query {i}" for i in range(count)]
+
+    results = {
+        "legacy dataclass": measure(
+            lambda i: LegacyDocument(texts[i], {"source": "mock"}), count
+        ),
+        "Document": measure(
+            lambda i: Document(texts[i], {"source": "mock"}), count
+        ),
+    }
+
+    baseline = results["legacy dataclass"]
+    for name, retained in results.items():
+        print(  # noqa: T201
+            f"{name:>18}: {retained / 2**20:8.1f} MiB, "
+            f"{retained / count:6.1f} B/doc, "
+            f"{retained / baseline:5.0%} of legacy"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Cost of one structured log record with a payload, in microseconds.
+
+Сравнивает прежний путь (payload: ``serialize`` — ``orjson.dumps`` →
+``orjson.loads`` в Python-структуру, затем ``serialize=True`` loguru —
+``json.dumps`` всей записи) с ``RawJSON`` + ``json_format``: payload
+кодируется один раз и вставляется в строку записи как есть. Записи уходят в пустой sink.
+С большим ``--items`` видно, что ``encode_bounded`` обходит payload
+только в пределах бюджета ``LOGGING.PAYLOAD.MAX_BYTES``.
+
+Запуск::
+
+    uv run python -m tests.performance.benchmarks.log_serialization --records 20000
+"""
+import argparse
+from collections.abc import Callable
+from time import perf_counter_ns
+
+from loguru import logger
+
+from app.infrastructure.observability.logging import json_format
+from app.utils.serializer import ItemSerializer
+
+
+def payload(items: int) -> dict[str, object]:
+    """Search result-like payload."""
+    return {
+        "query": "test query",
+        "results": [
+            {
+                "id": f"doc-{index}",
+                "score": index / items,
+                "content": "lorem ipsum dolor sit amet " * 4,
+                "metadata": {"source": "wiki", "tags": ["a", "b"]},
+            }
+            for index in range(items)
+        ],
+    }
+
+
+def measure(log: Callable[[], None], records: int) -> float:
+    """Microseconds per logged record."""
+    log()
+    started = perf_counter_ns()
+    for _ in range(records):
+        log()
+    return (perf_counter_ns() - started) / records / 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--items", type=int, default=10)
+    args = parser.parse_args()
+    records: int = args.records
+    serializer = ItemSerializer()
+    data = payload(args.items)
+    max_bytes = 4096  # LOGGING.PAYLOAD.MAX_BYTES
+    logger.remove()
+
+    handler_id = logger.add(lambda _: None, serialize=True)
+    loads = measure(
+        lambda: logger.bind(
+            result=serializer.serialize(data)
+        ).info("SEARCH_SUCCESS"),
+        records,
+    )
+    logger.remove(handler_id)
+
+    handler_id = logger.add(lambda _: None, format=json_format)
+    raw = measure(
+        lambda: logger.bind(
+            result=serializer.encode_bounded(data, max_bytes)
+        ).info("SEARCH_SUCCESS"),
+        records,
+    )
+    logger.remove(handler_id)
+
+    print(f"{'loads + serialize=True':>24}: {loads:8.1f} us")  # noqa: T201
+    print(f"{'RawJSON + json_format':>24}: {raw:8.1f} us")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Per-call overhead of the ``@monitor`` decorator, in nanoseconds.
+
+Сравнивает вызов голой функции, функции под ``@monitor`` и прежний путь
+(span, bind логгера и словари атрибутов на каждый вызов — через
+per-call методы стратегий) при включённом и выключенном уровне INFO.
+Логи уходят в пустой sink, метрики — в SDK MeterProvider, спаны — в SDK
+TracerProvider без экспортёра: измеряется только работа в процессе.
+
+Запуск::
+
+    uv run python -m tests.performance.benchmarks.monitor_overhead --calls 200000
+"""
+import argparse
+import asyncio
+from collections.abc import Callable
+from time import perf_counter
+from time import perf_counter_ns
+from typing import Any
+
+from loguru import logger
+from opentelemetry import metrics
+from opentelemetry import trace
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+
+from app.core.containers import AppContainer
+from app.core.events import Events
+from app.utils.configs import load_settings
+from app.utils.monitor import monitor
+
+
+def search(query: str) -> list[str]:
+    return [query]
+
+
+async def search_async(query: str) -> list[str]:
+    return [query]
+
+
+def legacy(container: AppContainer) -> Callable[[str], list[str]]:
+    """The previous wrapper: every call goes through per-call strategy API."""
+    infra = container.infra_container
+    logging_strategy = infra.logging_strategy()
+    tracing_strategy = infra.tracing_strategy()
+    metrics_strategy = infra.metrics_strategy()
+    event_name = Events.SEARCH_SERVICE.value.code
+
+    def wrapper(query: str) -> list[str]:
+        with tracing_strategy.start_span(event_name):
+            context = logging_strategy.log_start(
+                event_name, (query,), {}, use_log_args=True
+            )
+            start_time = perf_counter()
+            result = search(query)
+            metrics_strategy.record_request(
+                event_name=event_name,
+                duration=perf_counter() - start_time,
+                status="success",
+            )
+            logging_strategy.log_success(
+                event_name, result, context, use_log_result=True
+            )
+            return result
+
+    return wrapper
+
+
+def measure(func: Callable[[str], Any], calls: int) -> float:
+    """Nanoseconds per call of a sync function."""
+    func("warmup")
+    started = perf_counter_ns()
+    for _ in range(calls):
+        func("query")
+    return (perf_counter_ns() - started) / calls
+
+
+def measure_async(func: Callable[[str], Any], calls: int) -> float:
+    """Nanoseconds per call of a coroutine function, awaited in a loop."""
+
+    async def run() -> float:
+        await func("warmup")
+        started = perf_counter_ns()
+        for _ in range(calls):
+            await func("query")
+        return (perf_counter_ns() - started) / calls
+
+    return asyncio.run(run())
+
+
+def configure(level: str) -> AppContainer:
+    settings = load_settings().as_dict()
+    settings["LOGGING"]["LEVEL"] = level
+    container = AppContainer()
+    container.infra_container().config.from_dict(settings)
+    container.wire(modules=["app.utils.monitor"])
+    logger.remove()
+    logger.add(lambda _: None, level=level)
+    return container
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+    calls: int = args.calls
+    metrics.set_meter_provider(
+        MeterProvider(metric_readers=[InMemoryMetricReader()])
+    )
+    trace.set_tracer_provider(TracerProvider())
+
+    bare = measure(search, calls)
+    bare_async = measure_async(search_async, calls)
+    print(f"{'bare call':>28}: {bare:8.0f} ns")  # noqa: T201
+    print(f"{'bare async call':>28}: {bare_async:8.0f} ns")  # noqa: T201
+    for level in ("INFO", "WARNING"):
+        container = configure(level)
+        decorate = monitor(Events.SEARCH_SERVICE)
+        # name -> (ns per call, ns per call of the undecorated function)
+        results = {
+            f"legacy wrapper, {level}": (
+                measure(legacy(container), calls), bare
+            ),
+            f"@monitor, {level}": (measure(decorate(search), calls), bare),
+            f"@monitor async, {level}": (
+                measure_async(decorate(search_async), calls), bare_async
+            ),
+        }
+        container.unwire()
+        for name, (per_call, baseline) in results.items():
+            print(  # noqa: T201
+                f"{name:>28}: {per_call:8.0f} ns, "
+                f"overhead {per_call - baseline:8.0f} ns/call"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+``default`` of orjson on mixed payloads, in microseconds per payload.
+
+Сравнивает прежнюю цепочку проверок ``isinstance``/``is_dataclass``/
+``hasattr`` на каждый объект с поиском кодировщика по типу в
+``EncoderRegistry`` (кодировщик собирается при первой встрече типа).
+Payload — результат поиска: Pydantic-модели, dataclass'ы, доменные
+``Document`` с read-only metadata, даты, множества и объекты с
+``__dict__``.
+
+Запуск::
+
+    uv run python -m tests.performance.benchmarks.serializer_dispatch --rounds 2000
+"""
+import argparse
+import datetime as dt
+from collections.abc import Callable
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import is_dataclass
+from time import perf_counter_ns
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+
+from app.domain.entities.document import Document
+from app.utils.serializer import ItemSerializer
+
+
+class Hit(BaseModel):
+    id: str
+    score: float
+    tags: set[str]
+
+
+@dataclass
+class Span:
+    start: int
+    end: int
+    created: dt.datetime
+
+
+class Cursor:
+    def __init__(self, offset: int) -> None:
+        self.offset = offset
+
+
+def legacy_default(obj: Any) -> Any:  # noqa: ANN401
+    """The previous ``ItemSerializer.orjson_default``."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if hasattr(obj, "hex"):
+        return obj.hex()
+    if callable(obj):
+        return f"<{type(obj).__name__}>"
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    return str(obj)
+
+
+def payload(items: int) -> dict[str, Any]:
+    now = dt.datetime(2024, 1, 1, tzinfo=dt.UTC)
+    return {
+        "hits": [
+            Hit(id=f"doc-{index}", score=index / items, tags={"a", "b"})
+            for index in range(items)
+        ],
+        "documents": [
+            Document(text=f"text {index}", metadata={"source": "wiki"})
+            for index in range(items)
+        ],
+        "spans": [Span(index, index + 10, now) for index in range(items)],
+        "cursor": Cursor(items),
+        "seen": frozenset(range(items)),
+        "at": now.date(),
+    }
+
+
+def measure(default: Callable[[Any], Any], data: Any, rounds: int) -> float:  # noqa: ANN401
+    """Microseconds per ``orjson.dumps`` of the payload."""
+    orjson.dumps(data, default=default)
+    started = perf_counter_ns()
+    for _ in range(rounds):
+        orjson.dumps(data, default=default)
+    return (perf_counter_ns() - started) / rounds / 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=20)
+    args = parser.parse_args()
+    data = payload(args.items)
+    serializer = ItemSerializer()
+
+    legacy = measure(legacy_default, data, args.rounds)
+    cached = measure(serializer.orjson_default, data, args.rounds)
+    print(f"{'isinstance chain':>20}: {legacy:8.1f} us")  # noqa: T201
+    print(  # noqa: T201
+        f"{'type-dispatch cache':>20}: {cached:8.1f} us "
+        f"(x{legacy / cached:.1f})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class MemoryEndpointEntity(BaseModel):
+    url: str
+
+
+class MemoryEndpointExpected(BaseModel):
+    status_code: int
+    body_part: str | None = None
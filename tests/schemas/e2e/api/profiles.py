@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+
+
+class ProfileDownloadEntity(BaseModel):
+    format: str
+
+
+class ProfileDownloadExpected(BaseModel):
+    content_type: str
+    extension: str
+
+
+class FlamegraphEntity(BaseModel):
+    format: str
+    route: str | None = None
+
+
+class FlamegraphExpected(BaseModel):
+    status_code: int
+    content_type: str
+    body_part: str | None = None
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class FusedSearchEntity(BaseModel):
+    query: str
+    timeout: float
+    leg_delays: dict[str, float]
+    failing_legs: list[str] = []
+
+
+class FusedSearchExpected(BaseModel):
+    partial: bool
+    texts: list[str]
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class EmbeddingBatchEntity:
+    texts: list[str]
+    max_batch_size: int
+
+
+@dataclass
+class EmbeddingBatchExpected:
+    batch_sizes: list[int]
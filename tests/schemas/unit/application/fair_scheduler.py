@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from app.utils.configs import RequestPriority
+
+
+@dataclass
+class FairSchedulerEntity:
+    weights: dict[RequestPriority, float]
+    queued: list[RequestPriority]
+
+
+@dataclass
+class FairSchedulerExpected:
+    admitted: list[RequestPriority]
@@ -3,6 +3,7 @@ from pydantic import ConfigDict
 from pydantic import Field
 
 from app.domain.entities.document import Document
+from app.domain.entities.search_result import SearchResult
 
 
 class SearchServiceEntity(BaseModel):
@@ -17,3 +18,29 @@ class SearchServiceExpected(BaseModel):
 
     count: int
     results: list[Document] = Field(default_factory=list)
+
+
+class SearchUntilEntity(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    query: str
+    timeout: float
+    repository_delay: float
+    mock_return: SearchResult = Field(default_factory=SearchResult)
+
+
+class SearchUntilExpected(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    result: SearchResult
+
+
+class EtagEntity(BaseModel):
+    generation: int
+    query: str
+    other_generation: int
+    other_query: str
+
+
+class EtagExpected(BaseModel):
+    equal: bool
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+
+@dataclass
+class JsonFormatEntity:
+    extra: dict[str, Any]
+    fail: bool = False
+
+
+@dataclass
+class JsonFormatExpected:
+    extra: dict[str, Any]
+    exception: str | None = None
+    keys: list[str] = field(
+        default_factory=lambda: [
+            "time",
+            "level",
+            "name",
+            "function",
+            "line",
+            "message",
+            "extra",
+            "exception",
+        ]
+    )
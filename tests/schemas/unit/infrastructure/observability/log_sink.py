@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from app.utils.configs import OverflowPolicy
+
+
+@dataclass
+class BatchingSinkEntity:
+    policy: OverflowPolicy
+    records: int
+    capacity: int = 100
+    sample_every: int = 10
+
+
+@dataclass
+class BatchingSinkExpected:
+    dropped: int
+    # Indexes of the records expected in the output, in order
+    written: list[int]
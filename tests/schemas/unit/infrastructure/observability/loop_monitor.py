@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class LoopMonitorEntity:
+    block: float  # seconds the loop is blocked for
+    threshold: float  # seconds
+
+
+@dataclass
+class LoopMonitorExpected:
+    stalls: int
+    # Function expected in the logged stack of the blocking code
+    blocking_function: str | None = None
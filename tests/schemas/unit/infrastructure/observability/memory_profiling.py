@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class MemoryProfilingEntity:
+    path: str
+
+
+@dataclass
+class MemoryProfilingExpected:
+    route: str
+    min_net_bytes: int
+    max_net_bytes: int
+    min_peak_bytes: int
+    # Function of the test app expected at the top allocation site
+    top_site: str | None = None
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from dataclasses import field
+
+from app.utils.configs import ProfilingMode
+
+
+@dataclass
+class ProfilingEntity:
+    mode: ProfilingMode
+    concurrent_requests: int = 1
+
+
+@dataclass
+class ProfilingExpected:
+    profiles: int
+
+
+@dataclass
+class TriggerEntity:
+    path: str = "/v1/search"
+    requests: int = 1
+    sample_every: int = 1
+    routes: list[str] = field(default_factory=list)
+    latency_threshold: float = 0.0
+    headers: dict[str, str] = field(default_factory=dict)
+    ring_size: int = 8
+
+
+@dataclass
+class TriggerExpected:
+    profiles: int
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class RouteProfilesEntity:
+    # (monotonic time, route, seconds in the single "handler" frame)
+    requests: list[tuple[float, str, float]]
+    now: float
+    window: float = 10.0
+    buckets: int = 5
+
+
+@dataclass
+class RouteProfilesExpected:
+    # route -> (requests, seconds), heaviest first
+    routes: dict[str, tuple[int, float]]
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class SampledStatsEntity:
+    # Stacks of function names, root first, with the number of samples
+    stacks: list[tuple[tuple[str, ...], int]]
+
+
+@dataclass
+class SampledStatsExpected:
+    # name -> (primitive calls, total time, cumulative time)
+    functions: dict[str, tuple[int, float, float]]
+    # (caller, callee) -> cumulative time
+    edges: dict[tuple[str, str], float]
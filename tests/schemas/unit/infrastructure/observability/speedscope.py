@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from app.infrastructure.observability.speedscope import MIN_FRACTION
+
+
+@dataclass
+class CallTreeEntity:
+    # Sampled stacks of function names, root first, with sample counts
+    stacks: list[tuple[tuple[str, ...], int]]
+    min_fraction: float = MIN_FRACTION
+
+
+@dataclass
+class CallTreeExpected:
+    # Stack of function names -> seconds spent in its leaf
+    stacks: dict[tuple[str, ...], float]
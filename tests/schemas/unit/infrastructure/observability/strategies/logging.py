@@ -36,3 +36,18 @@ class LogErrorEntity:
 @dataclass
 class LogErrorExpected:
     exception_called_with: str
+
+@dataclass
+class EventLoggerEntity:
+    level: str
+    durations: list[float]  # one call per duration, seconds
+    sample_every: int = 1
+    slow_threshold: float = 1.0
+    fail: bool = False
+
+@dataclass
+class EventLoggerExpected:
+    info_calls: int
+    exception_calls: int
+    # Calls whose arguments and result were serialized
+    payload_calls: int
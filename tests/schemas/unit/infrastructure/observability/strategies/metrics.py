@@ -14,3 +14,14 @@ class RecordRequestExpected:
     counter_attrs: dict[str, Any]
     histogram_record_value: float
     histogram_attrs: dict[str, Any]
+
+@dataclass
+class EventMetricsEntity:
+    event_name: str
+    duration: float
+    error_type: str | None
+
+@dataclass
+class EventMetricsExpected:
+    counter_attrs: dict[str, Any]
+    histogram_attrs: dict[str, Any]
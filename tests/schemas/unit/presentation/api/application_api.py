@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class AdminMountEntity:
+    enabled: bool
+    token: str
+
+
+@dataclass
+class AdminMountExpected:
+    mounted: bool
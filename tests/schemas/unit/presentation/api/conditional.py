@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class EtagMatchEntity:
+    if_none_match: str
+    etag: str
+
+
+@dataclass
+class EtagMatchExpected:
+    matches: bool
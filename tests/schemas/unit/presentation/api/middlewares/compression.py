@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class NegotiateEntity:
+    accept_encoding: str
+    offered: tuple[str, ...]
+
+
+@dataclass
+class NegotiateExpected:
+    coding: str | None
+
+
+@dataclass
+class CompressionEntity:
+    path: str
+    accept_encoding: str | None
+    threadpool_threshold: int = 65_536
+
+
+@dataclass
+class CompressionExpected:
+    content_encoding: str | None
+    vary: str | None
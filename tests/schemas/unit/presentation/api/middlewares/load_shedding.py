@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+from app.utils.configs import RequestPriority
+
+
+@dataclass
+class CoDelEntity:
+    delays: list[float]
+    priority: RequestPriority
+
+
+@dataclass
+class CoDelExpected:
+    overloaded: bool
+    queue_timeout: float
+
+
+@dataclass
+class SheddingEntity:
+    path: str
+    overloaded: bool
+
+
+@dataclass
+class SheddingExpected:
+    status_code: int
+    retry_after: str | None
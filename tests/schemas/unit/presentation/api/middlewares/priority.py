@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from app.utils.configs import RequestPriority
+
+
+@dataclass
+class ResolveEntity:
+    path: str
+    header: str | None = None
+    header_enabled: bool = True
+
+
+@dataclass
+class ResolveExpected:
+    priority: RequestPriority
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ProbeEntity:
+    path: str
+    method: str = "GET"
+    ready: bool = True
+
+
+@dataclass
+class ProbeExpected:
+    status_code: int
+    body: bytes | None
+    reached_app: bool
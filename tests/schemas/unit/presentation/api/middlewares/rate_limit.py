@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class TokenBucketEntity:
+    rate: float
+    burst: int
+    requests_at: list[float]
+
+
+@dataclass
+class TokenBucketExpected:
+    allowed: list[bool]
+
+
+@dataclass
+class RateLimitEntity:
+    user_ids: list[str]
+
+
+@dataclass
+class RateLimitExpected:
+    status_codes: list[int]
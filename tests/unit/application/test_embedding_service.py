@@ -0,0 +1,115 @@
+import asyncio
+from collections.abc import Sequence
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from app.application.services.embedding_service import EmbeddingService
+from app.infrastructure.services.hashing_embedder import HashingEmbedder
+from app.utils.configs import EmbeddingConfig
+from tests.schemas.unit.application.embedding_service import (
+    EmbeddingBatchEntity,
+)
+from tests.schemas.unit.application.embedding_service import (
+    EmbeddingBatchExpected,
+)
+
+
+class RecordingEmbedder(HashingEmbedder):
+    def __init__(self) -> None:
+        super().__init__(dimension=16)
+        self.batch_sizes: list[int] = []
+
+    def embed_batch(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        self.batch_sizes.append(len(texts))
+        return super().embed_batch(texts)
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            EmbeddingBatchEntity(texts=["a", "b", "c"], max_batch_size=8),
+            EmbeddingBatchExpected(batch_sizes=[3]),
+            id="concurrent_texts_single_batch",
+        ),
+        pytest.param(
+            EmbeddingBatchEntity(
+                texts=["a", "b", "c", "d", "e"], max_batch_size=2
+            ),
+            EmbeddingBatchExpected(batch_sizes=[2, 2, 1]),
+            id="split_by_max_batch_size",
+        ),
+    ],
+)
+async def test_concurrent_requests_are_batched(
+    entity: EmbeddingBatchEntity,
+    expected: EmbeddingBatchExpected,
+) -> None:
+    # Arrange
+    embedder = RecordingEmbedder()
+    service = EmbeddingService(
+        embedder=embedder,
+        config=EmbeddingConfig(
+            max_batch_size=entity.max_batch_size, max_wait=0.01
+        ),
+    )
+
+    # Act
+    vectors = await asyncio.gather(
+        *(service.embed(text) for text in entity.texts)
+    )
+    await service.aclose()
+
+    # Assert
+    assert embedder.batch_sizes == expected.batch_sizes, (
+        f"Test failed, actual batch sizes = {embedder.batch_sizes}, "
+        f"but expected batch sizes were = {expected.batch_sizes}"
+    )
+    reference = HashingEmbedder(dimension=16).embed_batch(entity.texts)
+    np.testing.assert_array_equal(np.stack(vectors), reference)
+
+
+@pytest.mark.anyio()
+async def test_embedder_error_propagates_to_callers() -> None:
+    # Arrange
+    class FailingEmbedder(HashingEmbedder):
+        def embed_batch(self, texts: Sequence[str]) -> NDArray[np.float32]:
+            raise RuntimeError("model crashed")
+
+    service = EmbeddingService(embedder=FailingEmbedder())
+
+    # Act / Assert
+    with pytest.raises(RuntimeError, match="model crashed"):
+        await service.embed("text")
+    await service.aclose()
+
+
+@pytest.mark.anyio()
+async def test_wrong_vector_count_fails_whole_batch() -> None:
+    # Arrange
+    class ShortEmbedder(HashingEmbedder):
+        def embed_batch(self, texts: Sequence[str]) -> NDArray[np.float32]:
+            return super().embed_batch(texts[1:])
+
+    service = EmbeddingService(
+        embedder=ShortEmbedder(),
+        config=EmbeddingConfig(max_wait=0.01),
+    )
+
+    # Act
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            service.embed("a"), service.embed("b"), return_exceptions=True
+        ),
+        timeout=1.0,
+    )
+    await service.aclose()
+
+    # Assert
+    assert all(isinstance(result, ValueError) for result in results), (
+        f"Test failed, actual results = {results}, "
+        f"but expected results were = ValueError for every caller"
+    )
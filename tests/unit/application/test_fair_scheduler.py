@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from app.application.services.fair_scheduler import WeightedFairScheduler
+from app.utils.configs import RequestPriority
+from tests.schemas.unit.application.fair_scheduler import FairSchedulerEntity
+from tests.schemas.unit.application.fair_scheduler import (
+    FairSchedulerExpected,
+)
+
+BATCH = RequestPriority.BATCH
+NORMAL = RequestPriority.NORMAL
+INTERACTIVE = RequestPriority.INTERACTIVE
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            FairSchedulerEntity(
+                weights={INTERACTIVE: 3.0, BATCH: 1.0},
+                queued=[BATCH] * 4 + [INTERACTIVE] * 4,
+            ),
+            FairSchedulerExpected(
+                admitted=[
+                    INTERACTIVE,
+                    INTERACTIVE,
+                    INTERACTIVE,
+                    BATCH,
+                    INTERACTIVE,
+                    BATCH,
+                    BATCH,
+                    BATCH,
+                ],
+            ),
+            id="weighted_share_under_contention",
+        ),
+        pytest.param(
+            FairSchedulerEntity(
+                weights={INTERACTIVE: 8.0, BATCH: 1.0},
+                queued=[BATCH] * 3,
+            ),
+            FairSchedulerExpected(admitted=[BATCH] * 3),
+            id="batch_uses_spare_capacity",
+        ),
+    ],
+)
+async def test_weighted_fair_order(
+    entity: FairSchedulerEntity,
+    expected: FairSchedulerExpected,
+) -> None:
+    # Arrange
+    scheduler = WeightedFairScheduler(max_concurrency=1, weights=entity.weights)
+    admitted: list[RequestPriority] = []
+    gate = asyncio.Event()
+
+    async def job(priority: RequestPriority) -> None:
+        async with scheduler.slot(priority):
+            admitted.append(priority)
+
+    async def blocker() -> None:
+        async with scheduler.slot(NORMAL):
+            await gate.wait()
+
+    # Act: hold the only slot until every job is queued
+    blocking = asyncio.create_task(blocker())
+    await asyncio.sleep(0)
+    jobs = [asyncio.create_task(job(priority)) for priority in entity.queued]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(blocking, *jobs)
+
+    # Assert
+    assert admitted == expected.admitted, (
+        f"Test failed, actual order = {admitted}, "
+        f"but expected order was = {expected.admitted}"
+    )
+
+
+@pytest.mark.anyio()
+async def test_cancelled_waiter_frees_queue() -> None:
+    # Arrange
+    scheduler = WeightedFairScheduler(
+        max_concurrency=1, weights={NORMAL: 1.0}
+    )
+    gate = asyncio.Event()
+
+    async def blocker() -> None:
+        async with scheduler.slot(NORMAL):
+            await gate.wait()
+
+    async def job() -> None:
+        async with scheduler.slot(NORMAL):
+            pass
+
+    blocking = asyncio.create_task(blocker())
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(job())
+    await asyncio.sleep(0)
+
+    # Act
+    waiting.cancel()
+    await asyncio.gather(waiting, return_exceptions=True)
+    gate.set()
+    await blocking
+
+    # Assert
+    assert scheduler.waiting == 0, (
+        f"Test failed, actual waiting = {scheduler.waiting}, "
+        f"but expected waiting was = 0"
+    )
+    await asyncio.wait_for(job(), timeout=1.0)
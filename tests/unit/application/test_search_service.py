@@ -1,12 +1,20 @@
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
 from app.application.services.search_service import SearchService
 from app.domain.entities.document import Document
+from app.domain.entities.document_batch import DocumentBatch
+from app.domain.entities.search_result import SearchResult
 from app.domain.interfaces.search_repository import ISearchRepository
+from app.utils.configs import SearchConfig
+from tests.schemas.unit.application.search_service import EtagEntity
+from tests.schemas.unit.application.search_service import EtagExpected
 from tests.schemas.unit.application.search_service import SearchServiceEntity
 from tests.schemas.unit.application.search_service import SearchServiceExpected
+from tests.schemas.unit.application.search_service import SearchUntilEntity
+from tests.schemas.unit.application.search_service import SearchUntilExpected
 
 
 @pytest.fixture()
@@ -68,3 +76,144 @@ async def test_search_success(
         f"Test failed, actual results = {actual_results}, "
         f"but expected results were = {expected.results}"
     )
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            SearchUntilEntity(
+                query="fast",
+                timeout=1.0,
+                repository_delay=0.0,
+                mock_return=SearchResult(documents=[Document(text="res1")]),
+            ),
+            SearchUntilExpected(
+                result=SearchResult(documents=[Document(text="res1")])
+            ),
+            id="complete_within_deadline",
+        ),
+        pytest.param(
+            SearchUntilEntity(
+                query="degraded",
+                timeout=1.0,
+                repository_delay=0.0,
+                mock_return=SearchResult(
+                    documents=[Document(text="res1")], partial=True
+                ),
+            ),
+            SearchUntilExpected(
+                result=SearchResult(
+                    documents=[Document(text="res1")], partial=True
+                )
+            ),
+            id="partial_from_repository",
+        ),
+        pytest.param(
+            SearchUntilEntity(
+                query="stuck",
+                timeout=0.01,
+                repository_delay=1.0,
+                mock_return=SearchResult(documents=[Document(text="late")]),
+            ),
+            SearchUntilExpected(result=SearchResult(partial=True)),
+            id="repository_overruns_deadline",
+        ),
+    ],
+)
+async def test_search_until(
+    mock_repository: AsyncMock,
+    entity: SearchUntilEntity,
+    expected: SearchUntilExpected,
+) -> None:
+    # Arrange
+    async def delayed_search(**_: object) -> SearchResult:
+        await asyncio.sleep(entity.repository_delay)
+        return entity.mock_return
+
+    mock_repository.search_until.side_effect = delayed_search
+    service = SearchService(
+        repository=mock_repository,
+        config=SearchConfig(deadline=entity.timeout, deadline_grace=0.01),
+    )
+
+    # Act
+    actual_result = await service.search_until(query=entity.query)
+
+    # Assert
+    assert actual_result == expected.result, (
+        f"Test failed, actual result = {actual_result}, "
+        f"but expected result was = {expected.result}"
+    )
+
+
+@pytest.mark.anyio()
+async def test_search_batch(
+    search_service: SearchService,
+    mock_repository: AsyncMock,
+) -> None:
+    # Arrange
+    batch = DocumentBatch.from_documents([Document(text="res1")])
+    mock_repository.search_batch.return_value = batch
+
+    # Act
+    actual = await search_service.search_batch(query="test")
+
+    # Assert
+    assert actual is batch
+    mock_repository.search_batch.assert_awaited_once_with(query="test")
+
+
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            EtagEntity(
+                generation=1, query="q", other_generation=1, other_query="q"
+            ),
+            EtagExpected(equal=True),
+            id="same_generation_and_query",
+        ),
+        pytest.param(
+            EtagEntity(
+                generation=1, query="q", other_generation=1, other_query="r"
+            ),
+            EtagExpected(equal=False),
+            id="other_query",
+        ),
+        pytest.param(
+            EtagEntity(
+                generation=1, query="q", other_generation=2, other_query="q"
+            ),
+            EtagExpected(equal=False),
+            id="index_refreshed",
+        ),
+    ],
+)
+def test_etag(
+    search_service: SearchService,
+    mock_repository: AsyncMock,
+    entity: EtagEntity,
+    expected: EtagExpected,
+) -> None:
+    # Arrange
+    mock_repository.generation = entity.generation
+    etag = search_service.etag(entity.query)
+    mock_repository.generation = entity.other_generation
+
+    # Act
+    other_etag = search_service.etag(entity.other_query)
+
+    # Assert
+    actual_equal = etag == other_etag
+    assert actual_equal == expected.equal, (
+        f"Test failed, actual equal = {actual_equal} ({etag}, {other_etag}), "
+        f"but expected equal was = {expected.equal}"
+    )
+    assert etag.startswith('"'), (
+        f"Test failed, actual ETag = {etag}, but expected a quoted tag"
+    )
+    assert etag.endswith('"'), (
+        f"Test failed, actual ETag = {etag}, but expected a quoted tag"
+    )
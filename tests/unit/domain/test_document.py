@@ -0,0 +1,60 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from app.domain.entities.document import Document
+
+
+def test_equal_metadata_is_shared() -> None:
+    first = Document(text="a", metadata={"source": "mock"})
+    second = Document(text="b", metadata={"source": "mock"})
+
+    assert first.metadata is second.metadata
+    assert first.metadata == {"source": "mock"}
+
+
+@pytest.mark.parametrize("value", [True, 1, 1.0])
+def test_equal_values_of_other_types_are_not_shared(value: object) -> None:
+    # True == 1 == 1.0: the pool must still keep the caller's type
+    for other in (True, 1, 1.0):
+        Document(text="warm", metadata={"flag": other})
+
+    document = Document(text="a", metadata={"flag": value})
+
+    actual = type(document.metadata["flag"])
+    assert actual is type(value), (
+        f"Test failed, actual type = {actual}, "
+        f"but expected type was = {type(value)}"
+    )
+
+
+def test_unhashable_metadata_is_copied() -> None:
+    tags = ["a", "b"]
+    document = Document(text="a", metadata={"tags": tags})
+
+    assert document.metadata == {"tags": ["a", "b"]}
+    assert Document(text="b", metadata={"tags": tags}).metadata is not (
+        document.metadata
+    )
+
+
+def test_document_is_immutable() -> None:
+    document = Document(text="a", metadata={"source": "mock"})
+
+    with pytest.raises(FrozenInstanceError):
+        document.text = "b"  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        document.metadata["source"] = "other"  # type: ignore[index]
+    assert not hasattr(document, "__dict__")
+
+
+def test_document_survives_pickle_and_copy() -> None:
+    document = Document(text="a", metadata={"source": "mock"})
+
+    restored = pickle.loads(pickle.dumps(document))  # noqa: S301
+
+    assert restored == document
+    assert restored.metadata is document.metadata
+    assert copy.deepcopy(document) == document
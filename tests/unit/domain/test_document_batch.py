@@ -0,0 +1,75 @@
+import numpy as np
+
+from app.domain.entities.document import Document
+from app.domain.entities.document_batch import DocumentBatch
+
+
+DOCUMENTS = [
+    Document(text="первый", metadata={"source": "bm25", "page": 1}),
+    Document(text="second", metadata={"source": "bm25"}),
+    Document(text="third", metadata={"source": "dense", "tags": ["a"]}),
+]
+
+
+def test_round_trip() -> None:
+    batch = DocumentBatch.from_documents(DOCUMENTS, scores=[0.1, 0.2, 0.3])
+
+    assert batch.to_documents() == DOCUMENTS
+    assert batch.texts() == [document.text for document in DOCUMENTS]
+    assert batch.metadata["source"].values == ("bm25", "dense")
+    np.testing.assert_array_equal(batch.metadata["page"].codes, [0, -1, -1])
+
+
+def test_top_k_reorders_all_columns() -> None:
+    batch = DocumentBatch.from_documents(DOCUMENTS, scores=[0.1, 0.3, 0.2])
+
+    top = batch.top_k(2)
+
+    assert top.texts() == ["second", "third"]
+    np.testing.assert_array_equal(top.scores, np.float32([0.3, 0.2]))
+    assert top.to_documents() == [DOCUMENTS[1], DOCUMENTS[2]]
+
+
+def test_dedupe_keeps_first_occurrence() -> None:
+    batch = DocumentBatch.from_documents(
+        [DOCUMENTS[0], DOCUMENTS[1], DOCUMENTS[0], DOCUMENTS[2]]
+    )
+
+    assert batch.dedupe().texts() == ["первый", "second", "third"]
+
+
+def test_concat_merges_metadata_dictionaries() -> None:
+    first = DocumentBatch.from_documents(DOCUMENTS[:2])
+    second = DocumentBatch.from_documents(
+        [Document(text="fourth", metadata={"source": "dense", "lang": "en"})]
+    )
+
+    combined = DocumentBatch.concat([first, DocumentBatch.empty(), second])
+
+    assert combined.to_documents() == [*DOCUMENTS[:2], second.to_documents()[0]]
+    assert combined.metadata["source"].values == ("bm25", "dense")
+    np.testing.assert_array_equal(
+        combined.metadata["lang"].codes, [-1, -1, 0]
+    )
+
+
+def test_equal_values_of_other_types_keep_their_type() -> None:
+    documents = [
+        Document(text="a", metadata={"flag": True}),
+        Document(text="b", metadata={"flag": 1}),
+        Document(text="c", metadata={"flag": 1.0}),
+    ]
+
+    batch = DocumentBatch.concat(
+        [
+            DocumentBatch.from_documents(documents),
+            DocumentBatch.from_documents(documents[::-1]),
+        ]
+    )
+
+    actual = [type(doc.metadata["flag"]) for doc in batch.to_documents()]
+    expected = [bool, int, float, float, int, bool]
+    assert actual == expected, (
+        f"Test failed, actual types = {actual}, "
+        f"but expected types was = {expected}"
+    )
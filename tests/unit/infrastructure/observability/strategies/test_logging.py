@@ -2,9 +2,14 @@ from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from loguru import logger
 
 from app.infrastructure.observability.strategies.logging import StandardLoggingStrategy
+from app.utils.configs import PayloadLoggingConfig
+from app.utils.serializer import RawJSON
 from tests.schemas.unit.infrastructure.observability.strategies.logging import (
+    EventLoggerEntity,
+    EventLoggerExpected,
     LogErrorEntity,
     LogErrorExpected,
     LogStartEntity,
@@ -218,3 +223,119 @@ def test_log_error(
     context.exception.assert_called_with(
         expected.exception_called_with, entity.event_name
     )
+
+
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            EventLoggerEntity(level="INFO", durations=[0.01, 0.01]),
+            EventLoggerExpected(
+                info_calls=4, exception_calls=0, payload_calls=2
+            ),
+            id="every_call_sampled",
+        ),
+        pytest.param(
+            EventLoggerEntity(
+                level="INFO", durations=[0.01] * 6, sample_every=3
+            ),
+            EventLoggerExpected(
+                info_calls=12, exception_calls=0, payload_calls=2
+            ),
+            id="one_in_three_sampled",
+        ),
+        pytest.param(
+            EventLoggerEntity(
+                level="INFO",
+                durations=[0.01, 2.0, 0.01],
+                sample_every=100,
+            ),
+            EventLoggerExpected(
+                info_calls=6, exception_calls=0, payload_calls=1
+            ),
+            id="slow_call_logged",
+        ),
+        pytest.param(
+            EventLoggerEntity(
+                level="INFO", durations=[0.01], sample_every=100, fail=True
+            ),
+            EventLoggerExpected(
+                info_calls=1, exception_calls=1, payload_calls=1
+            ),
+            id="error_logged_with_args",
+        ),
+        pytest.param(
+            EventLoggerEntity(level="WARNING", durations=[2.0]),
+            EventLoggerExpected(
+                info_calls=0, exception_calls=0, payload_calls=0
+            ),
+            id="info_disabled_skips_serialization",
+        ),
+        pytest.param(
+            EventLoggerEntity(level="WARNING", durations=[0.01], fail=True),
+            EventLoggerExpected(
+                info_calls=0, exception_calls=1, payload_calls=1
+            ),
+            id="error_binds_args_when_info_disabled",
+        ),
+        pytest.param(
+            EventLoggerEntity(level="CRITICAL", durations=[0.01], fail=True),
+            EventLoggerExpected(
+                info_calls=0, exception_calls=0, payload_calls=0
+            ),
+            id="everything_disabled",
+        ),
+    ],
+)
+def test_event_logger(
+    mock_logger: MagicMock,
+    mock_serializer: MagicMock,
+    entity: EventLoggerEntity,
+    expected: EventLoggerExpected,
+) -> None:
+    # Arrange
+    mock_logger.level.side_effect = logger.level
+    bound = mock_logger.bind.return_value
+    bound.bind.return_value = bound
+    mock_serializer.encode_bounded.return_value = RawJSON(b'"payload"')
+    strategy = StandardLoggingStrategy(
+        serializer=mock_serializer,
+        level=entity.level,
+        payload=PayloadLoggingConfig(
+            sample_every=entity.sample_every,
+            slow_threshold=entity.slow_threshold,
+        ),
+    )
+    event_logger = strategy.event_logger(
+        "TEST_EVENT", use_log_args=True, use_log_result=False
+    )
+    args, kwargs = ("arg1",), {"key": "value"}
+
+    # Act
+    for duration in entity.durations:
+        context = event_logger.log_start(args, kwargs)
+        if entity.fail:
+            event_logger.log_error(
+                ValueError("test error"), context, args, kwargs
+            )
+        else:
+            event_logger.log_success(
+                {"data": "test"}, context, args, kwargs, duration
+            )
+
+    # Assert
+    mock_logger.bind.assert_called_once_with(event="TEST_EVENT")
+    assert bound.info.call_count == expected.info_calls, (
+        f"Test failed, actual info calls = {bound.info.call_count}, "
+        f"but expected info calls was = {expected.info_calls}"
+    )
+    assert bound.exception.call_count == expected.exception_calls, (
+        f"Test failed, actual exception calls = {bound.exception.call_count}, "
+        f"but expected exception calls was = {expected.exception_calls}"
+    )
+    # Arguments and keyword arguments are serialized separately
+    payload_calls = mock_serializer.encode_bounded.call_count // 2
+    assert payload_calls == expected.payload_calls, (
+        f"Test failed, actual payload calls = {payload_calls}, "
+        f"but expected payload calls was = {expected.payload_calls}"
+    )
@@ -5,6 +5,8 @@ import pytest
 from app.core import constants
 from app.infrastructure.observability.strategies.metrics import OpentelemetryMetricsStrategy
 from tests.schemas.unit.infrastructure.observability.strategies.metrics import (
+    EventMetricsEntity,
+    EventMetricsExpected,
     RecordRequestEntity,
     RecordRequestExpected,
 )
@@ -146,3 +148,68 @@ def test_record_request(
         f"Expected histogram attributes to match. "
         f"expected={expected.histogram_attrs}, actual={histogram_args[0][1]}"
     )
+
+
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            EventMetricsEntity(
+                event_name="TEST_EVENT", duration=0.123, error_type=None
+            ),
+            EventMetricsExpected(
+                counter_attrs={"event": "TEST_EVENT", "status": "success"},
+                histogram_attrs={"event": "TEST_EVENT"},
+            ),
+            id="event_success",
+        ),
+        pytest.param(
+            EventMetricsEntity(
+                event_name="TEST_EVENT", duration=0.456, error_type="business"
+            ),
+            EventMetricsExpected(
+                counter_attrs={
+                    "event": "TEST_EVENT",
+                    "status": "error",
+                    "error_type": "business",
+                },
+                histogram_attrs={"event": "TEST_EVENT"},
+            ),
+            id="event_error",
+        ),
+    ],
+)
+def test_event_metrics(
+    mock_metrics: MagicMock,
+    entity: EventMetricsEntity,
+    expected: EventMetricsExpected,
+) -> None:
+    # Arrange
+    strategy = OpentelemetryMetricsStrategy()
+    strategy.requests_total = MagicMock()
+    strategy.request_duration = MagicMock()
+    event_metrics = strategy.event_metrics(entity.event_name)
+
+    # Act
+    for _ in range(2):
+        if entity.error_type is None:
+            event_metrics.record_success(entity.duration)
+        else:
+            event_metrics.record_error(entity.duration, entity.error_type)
+
+    # Assert
+    first, second = strategy.requests_total.add.call_args_list
+    assert first.args == (1, expected.counter_attrs), (
+        f"Test failed, actual counter call = {first.args}, "
+        f"but expected counter call was = {(1, expected.counter_attrs)}"
+    )
+    assert first.args[1] is second.args[1], (
+        "Test failed, counter attributes were rebuilt for the second call, "
+        "but expected them to be precomputed"
+    )
+    histogram_args = strategy.request_duration.record.call_args.args
+    assert histogram_args == (entity.duration, expected.histogram_attrs), (
+        f"Test failed, actual histogram call = {histogram_args}, "
+        f"but expected histogram call was = "
+        f"{(entity.duration, expected.histogram_attrs)}"
+    )
@@ -0,0 +1,81 @@
+import orjson
+import pytest
+from loguru import logger
+
+from app.infrastructure.observability.logging import json_format
+from app.utils.serializer import RawJSON
+from tests.schemas.unit.infrastructure.observability.log_format import (
+    JsonFormatEntity,
+)
+from tests.schemas.unit.infrastructure.observability.log_format import (
+    JsonFormatExpected,
+)
+
+
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            JsonFormatEntity(
+                extra={"event": "SEARCH", "args": RawJSON(b'["query",3]')}
+            ),
+            JsonFormatExpected(extra={"event": "SEARCH", "args": ["query", 3]}),
+            id="raw_json_embedded",
+        ),
+        pytest.param(
+            JsonFormatEntity(extra={"value": {1, 2}, "big": 2**70}),
+            JsonFormatExpected(extra={"value": "{1, 2}", "big": str(2**70)}),
+            id="unsupported_values_as_strings",
+        ),
+        pytest.param(
+            JsonFormatEntity(extra={}, fail=True),
+            JsonFormatExpected(extra={}, exception="ValueError: boom"),
+            id="exception_traceback",
+        ),
+    ],
+)
+def test_json_format(
+    entity: JsonFormatEntity, expected: JsonFormatExpected
+) -> None:
+    # Arrange
+    lines: list[str] = []
+    handler_id = logger.add(lines.append, format=json_format, level="INFO")
+
+    # Act
+    try:
+        bound = logger.bind(**entity.extra)
+        if entity.fail:
+            try:
+                raise ValueError("boom")  # noqa: TRY301
+            except ValueError:
+                bound.exception("TEST_ERROR")
+        else:
+            bound.info("TEST_EVENT")
+    finally:
+        logger.remove(handler_id)
+
+    # Assert
+    assert len(lines) == 1, (
+        f"Test failed, actual lines = {len(lines)}, "
+        f"but expected lines was = 1"
+    )
+    record = orjson.loads(str(lines[0]))
+    assert list(record) == expected.keys, (
+        f"Test failed, actual keys = {list(record)}, "
+        f"but expected keys was = {expected.keys}"
+    )
+    assert record["extra"] == expected.extra, (
+        f"Test failed, actual extra = {record['extra']}, "
+        f"but expected extra was = {expected.extra}"
+    )
+    exception = record["exception"]
+    if expected.exception is None:
+        assert exception is None, (
+            f"Test failed, actual exception = {exception}, "
+            f"but expected exception was = None"
+        )
+    else:
+        assert expected.exception in exception, (
+            f"Test failed, actual exception = {exception}, "
+            f"but expected exception was = {expected.exception}"
+        )
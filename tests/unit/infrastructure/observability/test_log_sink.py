@@ -0,0 +1,125 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.infrastructure.observability.log_sink import BatchingSink
+from app.utils.configs import OverflowPolicy
+from tests.schemas.unit.infrastructure.observability.log_sink import (
+    BatchingSinkEntity,
+)
+from tests.schemas.unit.infrastructure.observability.log_sink import (
+    BatchingSinkExpected,
+)
+
+
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            BatchingSinkEntity(policy=OverflowPolicy.DROP, records=50),
+            BatchingSinkExpected(dropped=0, written=list(range(50))),
+            id="queue_not_full",
+        ),
+        pytest.param(
+            BatchingSinkEntity(
+                policy=OverflowPolicy.DROP, records=15, capacity=10
+            ),
+            BatchingSinkExpected(dropped=5, written=list(range(10))),
+            id="drop_newest",
+        ),
+        pytest.param(
+            BatchingSinkEntity(
+                policy=OverflowPolicy.SAMPLE,
+                records=20,
+                capacity=10,
+                sample_every=5,
+            ),
+            BatchingSinkExpected(
+                dropped=10, written=[2, 3, 4, 5, 6, 7, 8, 9, 14, 19]
+            ),
+            id="sample_evicts_oldest",
+        ),
+    ],
+)
+def test_batching_sink_overflow(
+    tmp_path: Path,
+    entity: BatchingSinkEntity,
+    expected: BatchingSinkExpected,
+) -> None:
+    # Arrange
+    output = tmp_path / "log.txt"
+    writes = []
+    real_write = os.write
+
+    def counting_write(fd: int, data: memoryview) -> int:
+        writes.append(len(data))
+        return real_write(fd, data)
+
+    # Act
+    with output.open("w") as stream, patch(
+        "app.infrastructure.observability.log_sink.os.write", counting_write
+    ):
+        # The writer only wakes on stop: the queue fills deterministically
+        sink = BatchingSink(
+            stream,
+            capacity=entity.capacity,
+            batch_size=1000,
+            flush_interval=60.0,
+            policy=entity.policy,
+            sample_every=entity.sample_every,
+        )
+        for index in range(entity.records):
+            sink.write(f"record {index}\n")
+        sink.stop()
+
+    # Assert
+    lines = output.read_text().splitlines()
+    records = [int(line.split()[1]) for line in lines if line.startswith("record")]
+    assert records == expected.written, (
+        f"Test failed, actual records = {records}, "
+        f"but expected records was = {expected.written}"
+    )
+    assert sink.dropped == expected.dropped, (
+        f"Test failed, actual dropped = {sink.dropped}, "
+        f"but expected dropped was = {expected.dropped}"
+    )
+    reported = any("log records dropped" in line for line in lines)
+    assert reported == bool(expected.dropped), (
+        f"Test failed, actual drop report = {reported}, "
+        f"but expected drop report was = {bool(expected.dropped)}"
+    )
+    assert len(writes) == 1, (
+        f"Test failed, actual write calls = {len(writes)}, "
+        f"but expected write calls was = 1"
+    )
+
+
+def test_batching_sink_block_loses_nothing(tmp_path: Path) -> None:
+    # Arrange
+    output = tmp_path / "log.txt"
+
+    # Act
+    with output.open("w") as stream:
+        sink = BatchingSink(
+            stream,
+            capacity=4,
+            batch_size=4,
+            flush_interval=0.01,
+            policy=OverflowPolicy.BLOCK,
+        )
+        for index in range(100):
+            sink.write(f"record {index}\n")
+        sink.stop()
+
+    # Assert
+    records = [int(line.split()[1]) for line in output.read_text().splitlines()]
+    assert records == list(range(100)), (
+        f"Test failed, actual records = {records}, "
+        f"but expected records was = {list(range(100))}"
+    )
+    assert sink.dropped == 0, (
+        f"Test failed, actual dropped = {sink.dropped}, "
+        f"but expected dropped was = 0"
+    )
@@ -0,0 +1,96 @@
+import asyncio
+import time
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from app.infrastructure.observability.loop_monitor import init_loop_monitor
+from app.utils.configs import LoopMonitorConfig
+from tests.schemas.unit.infrastructure.observability.loop_monitor import (
+    LoopMonitorEntity,
+    LoopMonitorExpected,
+)
+
+
+INTERVAL = 0.01
+
+
+def blocking_serializer(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            LoopMonitorEntity(block=0.3, threshold=0.05),
+            LoopMonitorExpected(
+                stalls=1, blocking_function=blocking_serializer.__name__
+            ),
+            id="blocked_loop",
+        ),
+        pytest.param(
+            LoopMonitorEntity(block=0.0, threshold=0.2),
+            LoopMonitorExpected(stalls=0),
+            id="responsive_loop",
+        ),
+    ],
+)
+async def test_loop_monitor(
+    entity: LoopMonitorEntity,
+    expected: LoopMonitorExpected,
+) -> None:
+    # Arrange
+    config = LoopMonitorConfig(interval=INTERVAL, threshold=entity.threshold)
+
+    # Act
+    with patch(
+        "app.infrastructure.observability.loop_monitor.logger"
+    ) as mock_logger:
+        resource = init_loop_monitor(config)
+        monitor = await anext(resource)
+        await asyncio.sleep(3 * INTERVAL)
+        blocking_serializer(entity.block)
+        await asyncio.sleep(3 * INTERVAL)
+        await resource.aclose()
+
+    # Assert
+    assert monitor is not None
+    assert monitor.stalls == expected.stalls, (
+        f"Test failed, actual stalls = {monitor.stalls}, "
+        f"but expected stalls was = {expected.stalls}"
+    )
+    warning: MagicMock = mock_logger.warning
+    assert warning.call_count == expected.stalls, (
+        f"Test failed, actual warnings = {warning.call_count}, "
+        f"but expected warnings was = {expected.stalls}"
+    )
+    if expected.blocking_function is not None:
+        stack = warning.call_args.kwargs["stack"]
+        assert expected.blocking_function in stack, (
+            f"Test failed, actual stack = {stack}, "
+            f"but expected function was = {expected.blocking_function}"
+        )
+        lag_ms = warning.call_args.kwargs["lag_ms"]
+        assert lag_ms >= entity.block * 1000 * 0.8, (
+            f"Test failed, actual lag_ms = {lag_ms}, "
+            f"but expected lag_ms was >= {entity.block * 1000}"
+        )
+
+
+@pytest.mark.anyio()
+async def test_loop_monitor_disabled() -> None:
+    # Arrange
+    config = LoopMonitorConfig(enabled=False)
+
+    # Act
+    resource = init_loop_monitor(config)
+    monitor = await anext(resource)
+    await resource.aclose()
+
+    # Assert
+    assert monitor is None, (
+        f"Test failed, actual monitor = {monitor}, but expected monitor was = None"
+    )
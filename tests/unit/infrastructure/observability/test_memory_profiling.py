@@ -0,0 +1,133 @@
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport
+from httpx import AsyncClient
+
+from app.infrastructure.observability.memory_profiling import (
+    MemoryProfilingMiddleware,
+)
+from app.infrastructure.observability.memory_store import MemoryProfileStore
+from app.utils.configs import MemoryProfilingConfig
+from tests.schemas.unit.infrastructure.observability.memory_profiling import (
+    MemoryProfilingEntity,
+    MemoryProfilingExpected,
+)
+
+
+BLOCK = 1 << 20  # 1 MiB
+LEAKED: list[bytearray] = []
+
+
+def leak_block() -> int:
+    LEAKED.append(bytearray(BLOCK))
+    return len(LEAKED)
+
+
+def temporary_block() -> int:
+    return len(bytearray(BLOCK))
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/v1/leak/{tenant}")
+    async def leak(tenant: str) -> dict[str, int]:
+        return {tenant: leak_block()}
+
+    @app.get("/v1/temporary")
+    async def temporary() -> dict[str, int]:
+        return {"size": temporary_block()}
+
+    return app
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            MemoryProfilingEntity(path="/v1/leak/acme"),
+            MemoryProfilingExpected(
+                route="GET /v1/leak/{tenant}",
+                min_net_bytes=BLOCK,
+                max_net_bytes=2 * BLOCK,
+                min_peak_bytes=BLOCK,
+                top_site=leak_block.__name__,
+            ),
+            id="retained_allocation",
+        ),
+        pytest.param(
+            MemoryProfilingEntity(path="/v1/temporary"),
+            MemoryProfilingExpected(
+                route="GET /v1/temporary",
+                min_net_bytes=-BLOCK,
+                max_net_bytes=BLOCK // 2,
+                min_peak_bytes=BLOCK,
+            ),
+            id="temporary_allocation",
+        ),
+    ],
+)
+async def test_memory_profiling_middleware(
+    tmp_path: Path,
+    entity: MemoryProfilingEntity,
+    expected: MemoryProfilingExpected,
+) -> None:
+    # Arrange
+    store = MemoryProfileStore(size=8)
+    middleware = MemoryProfilingMiddleware(
+        _create_app(),
+        config=MemoryProfilingConfig(
+            enabled=True, sample_every=1, output_dir=str(tmp_path)
+        ),
+        store=store,
+    )
+
+    # Act
+    async with AsyncClient(
+        transport=ASGITransport(app=middleware), base_url="http://test"
+    ) as client:
+        response = await client.get(entity.path)
+    middleware.close()
+    LEAKED.clear()
+
+    # Assert
+    assert response.status_code == 200, (
+        f"Test failed, actual status = {response.status_code}, "
+        f"but expected status was = 200"
+    )
+    assert not tracemalloc.is_tracing(), (
+        "Test failed, tracemalloc is still tracing after the request"
+    )
+    [profile] = store.list()
+    assert profile.route == expected.route, (
+        f"Test failed, actual route = {profile.route}, "
+        f"but expected route was = {expected.route}"
+    )
+    assert (
+        expected.min_net_bytes <= profile.net_bytes <= expected.max_net_bytes
+    ), (
+        f"Test failed, actual net bytes = {profile.net_bytes}, but "
+        f"expected between {expected.min_net_bytes} "
+        f"and {expected.max_net_bytes}"
+    )
+    assert profile.peak_bytes >= expected.min_peak_bytes, (
+        f"Test failed, actual peak bytes = {profile.peak_bytes}, "
+        f"but expected at least {expected.min_peak_bytes}"
+    )
+    if expected.top_site:
+        top = profile.sites[0]
+        code = globals()[expected.top_site].__code__
+        allocation_line = code.co_firstlineno + 1
+        assert (top.file, top.line) == (code.co_filename, allocation_line), (
+            f"Test failed, actual top site = {top.file}:{top.line}, "
+            f"but expected the allocation in {expected.top_site}"
+        )
+    [snapshot_file] = tmp_path.glob("*.tracemalloc")
+    snapshot = tracemalloc.Snapshot.load(str(snapshot_file))
+    assert snapshot.traces, (
+        f"Test failed, snapshot {snapshot_file.name} has no traces"
+    )
@@ -0,0 +1,278 @@
+import asyncio
+import pstats
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport
+from httpx import AsyncClient
+
+from app.infrastructure.observability.profile_store import ProfileStore
+from app.infrastructure.observability.profiling import BackgroundWriter
+from app.infrastructure.observability.profiling import ProfilingMiddleware
+from app.infrastructure.observability.route_profiles import (
+    RouteProfileAggregator,
+)
+from app.utils.configs import ProfilingConfig
+from app.utils.configs import ProfilingMode
+from tests.schemas.unit.infrastructure.observability.profiling import (
+    ProfilingEntity,
+    ProfilingExpected,
+    TriggerEntity,
+    TriggerExpected,
+)
+
+
+def rank_documents() -> int:
+    return sum(i * i for i in range(500_000))
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/v1/search")
+    async def search() -> dict[str, int]:
+        await asyncio.sleep(0.01)
+        return {"score": rank_documents()}
+
+    @app.get("/v1/items/{item_id}")
+    async def item(item_id: int) -> dict[str, int]:
+        return {"score": item_id + rank_documents()}
+
+    @app.get("/v1/slow")
+    async def slow() -> dict[str, str]:
+        time.sleep(0.15)  # blocks the loop, so the sampler sees it
+        return {"status": "ok"}
+
+    return app
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            ProfilingEntity(mode=ProfilingMode.CPROFILE),
+            ProfilingExpected(profiles=1),
+            id="cprofile",
+        ),
+        pytest.param(
+            ProfilingEntity(
+                mode=ProfilingMode.CPROFILE, concurrent_requests=3
+            ),
+            ProfilingExpected(profiles=1),
+            id="cprofile_one_request_at_a_time",
+        ),
+        pytest.param(
+            ProfilingEntity(mode=ProfilingMode.SAMPLING),
+            ProfilingExpected(profiles=1),
+            id="sampling",
+        ),
+        pytest.param(
+            ProfilingEntity(
+                mode=ProfilingMode.SAMPLING, concurrent_requests=3
+            ),
+            ProfilingExpected(profiles=3),
+            id="sampling_concurrent_requests",
+        ),
+    ],
+)
+async def test_profiling_middleware(
+    tmp_path: Path,
+    entity: ProfilingEntity,
+    expected: ProfilingExpected,
+) -> None:
+    # Arrange
+    middleware = ProfilingMiddleware(
+        _create_app(),
+        config=ProfilingConfig(
+            enabled=True,
+            mode=entity.mode,
+            sampling_hz=1000,
+            output_dir=str(tmp_path),
+            top_n=5,
+        ),
+        store=ProfileStore(size=8),
+    )
+
+    # Act
+    async with AsyncClient(
+        transport=ASGITransport(app=middleware), base_url="http://test"
+    ) as client:
+        responses = await asyncio.gather(*(
+            client.get("/v1/search")
+            for _ in range(entity.concurrent_requests)
+        ))
+    middleware.close()
+
+    # Assert
+    statuses = [response.status_code for response in responses]
+    assert statuses == [200] * entity.concurrent_requests, (
+        f"Test failed, actual statuses = {statuses}, "
+        f"but expected all statuses to be 200"
+    )
+    files = sorted(tmp_path.glob("*_GET_v1_search.prof"))
+    assert len(files) == expected.profiles, (
+        f"Test failed, actual profiles = {len(files)}, "
+        f"but expected profiles was = {expected.profiles}"
+    )
+    functions = {name for _, _, name in pstats.Stats(str(files[0])).stats}
+    assert rank_documents.__name__ in functions, (
+        f"Test failed, {rank_documents.__name__} is missing from "
+        f"the profile of {entity.mode.value} mode"
+    )
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            TriggerEntity(sample_every=3, requests=7),
+            TriggerExpected(profiles=2),
+            id="every_third_request",
+        ),
+        pytest.param(
+            TriggerEntity(routes=["/v1/slow"], requests=3),
+            TriggerExpected(profiles=0),
+            id="route_not_in_allowlist",
+        ),
+        pytest.param(
+            TriggerEntity(path="/v1/slow", routes=["/v1/slow"], requests=2),
+            TriggerExpected(profiles=2),
+            id="route_in_allowlist",
+        ),
+        pytest.param(
+            TriggerEntity(
+                sample_every=100, requests=2, headers={"X-Profile": "1"}
+            ),
+            TriggerExpected(profiles=2),
+            id="trigger_header_forces_profile",
+        ),
+        pytest.param(
+            # Far above the 10 ms handler, so profiler overhead can't cross it
+            TriggerEntity(latency_threshold=1.0, requests=2),
+            TriggerExpected(profiles=0),
+            id="fast_requests_dropped",
+        ),
+        pytest.param(
+            TriggerEntity(path="/v1/slow", latency_threshold=0.1),
+            TriggerExpected(profiles=1),
+            id="slow_request_kept",
+        ),
+        pytest.param(
+            TriggerEntity(
+                latency_threshold=10, headers={"X-Profile": "1"}
+            ),
+            TriggerExpected(profiles=1),
+            id="trigger_header_ignores_latency_threshold",
+        ),
+        pytest.param(
+            TriggerEntity(requests=5, ring_size=2),
+            TriggerExpected(profiles=2),
+            id="ring_buffer_keeps_latest",
+        ),
+    ],
+)
+async def test_profiling_triggers(
+    entity: TriggerEntity,
+    expected: TriggerExpected,
+) -> None:
+    # Arrange
+    store = ProfileStore(size=entity.ring_size)
+    middleware = ProfilingMiddleware(
+        _create_app(),
+        config=ProfilingConfig(
+            enabled=True,
+            mode=ProfilingMode.SAMPLING,
+            sampling_hz=1000,
+            write_files=False,
+            sample_every=entity.sample_every,
+            routes=entity.routes,
+            trigger_header="X-Profile",
+            latency_threshold=entity.latency_threshold,
+        ),
+        store=store,
+    )
+
+    # Act
+    async with AsyncClient(
+        transport=ASGITransport(app=middleware), base_url="http://test"
+    ) as client:
+        for _ in range(entity.requests):
+            await client.get(entity.path, headers=entity.headers)
+    middleware.close()
+
+    # Assert
+    profiles = store.list()
+    assert len(profiles) == expected.profiles, (
+        f"Test failed, actual profiles = {len(profiles)}, "
+        f"but expected profiles was = {expected.profiles}"
+    )
+    ids = [profile.id for profile in profiles]
+    assert ids == sorted(ids, reverse=True), (
+        f"Test failed, actual profile ids = {ids}, "
+        f"but expected newest profiles first"
+    )
+    paths = {profile.path for profile in profiles}
+    assert paths <= {entity.path}, (
+        f"Test failed, actual paths = {paths}, "
+        f"but expected path was = {entity.path}"
+    )
+
+
+@pytest.mark.anyio()
+async def test_profiling_aggregates_by_route() -> None:
+    # Arrange
+    store = ProfileStore(size=8)
+    aggregator = RouteProfileAggregator(window=60, buckets=6)
+    middleware = ProfilingMiddleware(
+        _create_app(),
+        config=ProfilingConfig(
+            enabled=True,
+            mode=ProfilingMode.CPROFILE,
+            write_files=False,
+            latency_threshold=10,
+        ),
+        store=store,
+        aggregator=aggregator,
+    )
+
+    # Act
+    async with AsyncClient(
+        transport=ASGITransport(app=middleware), base_url="http://test"
+    ) as client:
+        for item_id in (1, 2):
+            await client.get(f"/v1/items/{item_id}")
+    middleware.close()
+
+    # Assert
+    assert not store.list(), (
+        "Test failed, fast requests were kept although below the threshold"
+    )
+    profiles = aggregator.snapshot(time.monotonic())
+    route = "GET /v1/items/{item_id}"  # noqa: RUF027
+    assert list(profiles) == [route], (
+        f"Test failed, actual routes = {list(profiles)}, "
+        f"but expected routes was = {[route]}"
+    )
+    assert profiles[route].requests == 2, (
+        f"Test failed, actual requests = {profiles[route].requests}, "
+        f"but expected requests was = 2"
+    )
+    functions = {
+        name for stack in profiles[route].stacks for _, _, name in stack
+    }
+    assert rank_documents.__name__ in functions, (
+        f"Test failed, {rank_documents.__name__} is missing from "
+        f"the aggregated stacks of {route}"
+    )
+
+
+def test_background_writer_requires_write() -> None:
+    class NoopWriter(BackgroundWriter[None]):
+        pass
+
+    with pytest.raises(TypeError, match="_write"):
+        NoopWriter("noop-writer", max_pending=1)  # type: ignore[abstract]
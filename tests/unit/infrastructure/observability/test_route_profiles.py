@@ -0,0 +1,78 @@
+import pytest
+
+from app.infrastructure.observability.route_profiles import (
+    RouteProfileAggregator,
+)
+from tests.schemas.unit.infrastructure.observability.route_profiles import (
+    RouteProfilesEntity,
+    RouteProfilesExpected,
+)
+
+
+HANDLER = ("search.py", 10, "handler")
+SEARCH = "POST /v1/answer/generate"
+HEALTH = "GET /common/healthcheck"
+
+
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            RouteProfilesEntity(
+                requests=[(0.0, SEARCH, 0.25), (0.5, SEARCH, 0.25)],
+                now=1.0,
+            ),
+            RouteProfilesExpected(routes={SEARCH: (2, 0.5)}),
+            id="same_route_merged",
+        ),
+        pytest.param(
+            RouteProfilesEntity(
+                requests=[(0.0, HEALTH, 0.01), (3.0, SEARCH, 0.5)],
+                now=9.0,
+            ),
+            RouteProfilesExpected(
+                routes={SEARCH: (1, 0.5), HEALTH: (1, 0.01)},
+            ),
+            id="routes_sorted_by_time",
+        ),
+        pytest.param(
+            RouteProfilesEntity(
+                requests=[(0.0, SEARCH, 0.5), (11.0, SEARCH, 0.25)],
+                now=11.0,
+            ),
+            RouteProfilesExpected(routes={SEARCH: (1, 0.25)}),
+            id="old_bucket_evicted",
+        ),
+        pytest.param(
+            RouteProfilesEntity(
+                requests=[(0.0, SEARCH, 0.5)],
+                now=30.0,
+            ),
+            RouteProfilesExpected(routes={}),
+            id="window_expired_on_read",
+        ),
+    ],
+)
+def test_route_profile_aggregator(
+    entity: RouteProfilesEntity,
+    expected: RouteProfilesExpected,
+) -> None:
+    # Arrange
+    aggregator = RouteProfileAggregator(
+        window=entity.window, buckets=entity.buckets
+    )
+    for now, route, seconds in entity.requests:
+        aggregator.add(route, {(HANDLER,): seconds}, now)
+
+    # Act
+    profiles = aggregator.snapshot(entity.now)
+
+    # Assert
+    actual = {
+        route: (profile.requests, round(profile.seconds, 9))
+        for route, profile in profiles.items()
+    }
+    assert list(actual.items()) == list(expected.routes.items()), (
+        f"Test failed, actual routes = {actual}, "
+        f"but expected routes was = {expected.routes}"
+    )
@@ -0,0 +1,153 @@
+import sys
+import time
+from collections import Counter
+from types import CodeType
+
+import pytest
+
+from app.infrastructure.observability.sampler import StackSampler
+from app.infrastructure.observability.sampler import function_key
+from app.infrastructure.observability.sampler import sampled_stats
+from tests.schemas.unit.infrastructure.observability.sampler import (
+    SampledStatsEntity,
+    SampledStatsExpected,
+)
+
+INTERVAL = 0.01
+
+
+def handler() -> None: ...
+
+
+def search() -> None: ...
+
+
+def serialize() -> None: ...
+
+
+CODES: dict[str, CodeType] = {
+    function.__name__: function.__code__
+    for function in (handler, search, serialize)
+}
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            SampledStatsEntity(
+                stacks=[
+                    (("handler", "search"), 3),
+                    (("handler", "serialize"), 1),
+                    (("handler",), 1),
+                ],
+            ),
+            SampledStatsExpected(
+                functions={
+                    "handler": (5, 0.01, 0.05),
+                    "search": (3, 0.03, 0.03),
+                    "serialize": (1, 0.01, 0.01),
+                },
+                edges={
+                    ("handler", "search"): 0.03,
+                    ("handler", "serialize"): 0.01,
+                },
+            ),
+            id="call_tree",
+        ),
+        pytest.param(
+            SampledStatsEntity(stacks=[(("handler", "search", "search"), 2)]),
+            SampledStatsExpected(
+                functions={
+                    "handler": (2, 0.0, 0.02),
+                    "search": (2, 0.02, 0.02),
+                },
+                edges={
+                    ("handler", "search"): 0.02,
+                    ("search", "search"): 0.02,
+                },
+            ),
+            id="recursion_counted_once",
+        ),
+    ],
+)
+def test_sampled_stats(
+    entity: SampledStatsEntity, expected: SampledStatsExpected
+) -> None:
+    # Arrange
+    samples = Counter({
+        tuple(CODES[name] for name in names): count
+        for names, count in entity.stacks
+    })
+
+    # Act
+    stats = sampled_stats(samples, INTERVAL)
+
+    # Assert
+    for name, (cc, tt, ct) in expected.functions.items():
+        actual_cc, _, actual_tt, actual_ct, _ = stats[
+            function_key(CODES[name])
+        ]
+        actual = (actual_cc, round(actual_tt, 6), round(actual_ct, 6))
+        assert actual == (cc, tt, ct), (
+            f"Test failed, actual {name} (cc, tt, ct) = {actual}, "
+            f"but expected {name} (cc, tt, ct) was = {(cc, tt, ct)}"
+        )
+    for (caller, callee), ct in expected.edges.items():
+        callers = stats[function_key(CODES[callee])][4]
+        actual_ct = round(callers[function_key(CODES[caller])][3], 6)
+        assert actual_ct == ct, (
+            f"Test failed, actual {caller}->{callee} ct = {actual_ct}, "
+            f"but expected {caller}->{callee} ct was = {ct}"
+        )
+
+
+def test_stack_sampler_attributes_samples_to_registered_frame() -> None:
+    # Arrange
+    sampler = StackSampler(hz=500)
+    sampler.start()
+
+    # Act
+    try:
+        with sampler.record(sys._getframe()) as profile:
+            _busy(0.1)
+    finally:
+        sampler.stop()
+
+    # Assert
+    total = sum(profile.samples.values())
+    assert total > 0, "Test failed, sampler collected no samples"
+    assert any(_busy.__code__ in stack for stack in profile.samples), (
+        "Test failed, busy function is missing from sampled stacks"
+    )
+    roots = {stack[0] for stack in profile.samples}
+    assert (
+        test_stack_sampler_attributes_samples_to_registered_frame.__code__
+        not in roots
+    ), "Test failed, registered frame itself must not be in the stack"
+
+
+def test_stack_sampler_ignores_unregistered_frames() -> None:
+    # Arrange
+    sampler = StackSampler(hz=500)
+    sampler.start()
+    with sampler.record(sys._getframe()) as profile:
+        pass
+
+    # Act
+    try:
+        _busy(0.05)
+    finally:
+        sampler.stop()
+
+    # Assert
+    assert not profile.samples, (
+        f"Test failed, actual samples = {sum(profile.samples.values())}, "
+        f"but expected samples was = 0"
+    )
@@ -0,0 +1,208 @@
+from collections import Counter
+from types import CodeType
+
+import pytest
+
+from app.infrastructure.observability.sampler import function_key
+from app.infrastructure.observability.sampler import sampled_stats
+from app.infrastructure.observability.speedscope import ProfileKind
+from app.infrastructure.observability.speedscope import call_tree_stacks
+from app.infrastructure.observability.speedscope import collapsed_diff
+from app.infrastructure.observability.speedscope import collapsed_stacks
+from app.infrastructure.observability.speedscope import speedscope_document
+from tests.schemas.unit.infrastructure.observability.speedscope import (
+    CallTreeEntity,
+    CallTreeExpected,
+)
+
+
+INTERVAL = 0.01
+
+
+def handler() -> None: ...
+
+
+def search() -> None: ...
+
+
+def serialize() -> None: ...
+
+
+def encode() -> None: ...
+
+
+CODES: dict[str, CodeType] = {
+    function.__name__: function.__code__
+    for function in (handler, search, serialize, encode)
+}
+
+
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            CallTreeEntity(
+                stacks=[
+                    (("handler", "search"), 3),
+                    (("handler", "serialize"), 1),
+                    (("handler",), 1),
+                ],
+            ),
+            CallTreeExpected(
+                stacks={
+                    ("handler", "search"): 0.03,
+                    ("handler", "serialize"): 0.01,
+                    ("handler",): 0.01,
+                },
+            ),
+            id="tree",
+        ),
+        pytest.param(
+            CallTreeEntity(
+                stacks=[
+                    (("handler", "search", "encode"), 2),
+                    (("handler", "serialize", "encode"), 2),
+                    (("handler", "serialize"), 1),
+                ],
+            ),
+            CallTreeExpected(
+                stacks={
+                    ("handler", "search", "encode"): 0.02,
+                    ("handler", "serialize", "encode"): 0.02,
+                    ("handler", "serialize"): 0.01,
+                },
+            ),
+            id="callee_shared_by_two_callers",
+        ),
+        pytest.param(
+            CallTreeEntity(
+                stacks=[
+                    (("handler", "search"), 999),
+                    (("handler", "serialize"), 1),
+                ],
+                min_fraction=0.01,
+            ),
+            CallTreeExpected(
+                stacks={
+                    ("handler", "search"): 9.99,
+                    ("handler",): 0.01,
+                },
+            ),
+            id="small_branch_folded_into_caller",
+        ),
+    ],
+)
+def test_call_tree_stacks(
+    entity: CallTreeEntity,
+    expected: CallTreeExpected,
+) -> None:
+    # Arrange
+    samples = Counter({
+        tuple(CODES[name] for name in names): count
+        for names, count in entity.stacks
+    })
+    stats = sampled_stats(samples, INTERVAL)
+
+    # Act
+    stacks = call_tree_stacks(stats, min_fraction=entity.min_fraction)
+
+    # Assert
+    actual = {
+        tuple(name for _, _, name in stack): round(weight, 9)
+        for stack, weight in stacks.items()
+    }
+    assert actual == expected.stacks, (
+        f"Test failed, actual stacks = {actual}, "
+        f"but expected stacks was = {expected.stacks}"
+    )
+
+
+def test_speedscope_document() -> None:
+    # Arrange
+    root = function_key(CODES["handler"])
+    leaf = function_key(CODES["search"])
+    stacks = {(root,): 0.5, (root, leaf): 1.5}
+
+    # Act
+    document = speedscope_document({"request": stacks}, name="request")
+    collapsed = collapsed_stacks(stacks)
+
+    # Assert
+    frames = [frame["name"] for frame in document["shared"]["frames"]]
+    assert frames == ["handler", "search"], (
+        f"Test failed, actual frames = {frames}, "
+        f"but expected frames was = ['handler', 'search']"
+    )
+    profile = document["profiles"][0]
+    assert profile["samples"] == [[0], [0, 1]], (
+        f"Test failed, actual samples = {profile['samples']}, "
+        f"but expected samples was = [[0], [0, 1]]"
+    )
+    assert profile["endValue"] == pytest.approx(2.0), (
+        f"Test failed, actual endValue = {profile['endValue']}, "
+        f"but expected endValue was = 2.0"
+    )
+    weights = [line.rsplit(" ", 1)[1] for line in collapsed.splitlines()]
+    assert weights == ["500000", "1500000"], (
+        f"Test failed, actual collapsed weights = {weights}, "
+        f"but expected weights was = ['500000', '1500000']"
+    )
+
+
+def test_evented_speedscope_document() -> None:
+    # Arrange
+    root = function_key(CODES["handler"])
+    search_key = function_key(CODES["search"])
+    serialize_key = function_key(CODES["serialize"])
+    stacks = {
+        (root,): 0.5,
+        (root, serialize_key): 1.0,
+        (root, search_key): 2.0,
+    }
+
+    # Act
+    document = speedscope_document(
+        {"request": stacks}, name="request", kind=ProfileKind.EVENTED
+    )
+
+    # Assert
+    profile = document["profiles"][0]
+    names = [frame["name"] for frame in document["shared"]["frames"]]
+    events = [
+        (event["type"], names[event["frame"]], event["at"])
+        for event in profile["events"]
+    ]
+    expected = [
+        ("O", "handler", 0.0),
+        ("O", "search", 0.0),
+        ("C", "search", 2.0),
+        ("O", "serialize", 2.0),
+        ("C", "serialize", 3.0),
+        ("C", "handler", 3.5),
+    ]
+    assert events == expected, (
+        f"Test failed, actual events = {events}, "
+        f"but expected events was = {expected}"
+    )
+    assert profile["endValue"] == pytest.approx(3.5), (
+        f"Test failed, actual endValue = {profile['endValue']}, "
+        f"but expected endValue was = 3.5"
+    )
+
+
+def test_collapsed_diff() -> None:
+    # Arrange
+    root = function_key(CODES["handler"])
+    leaf = function_key(CODES["search"])
+    before = {(root,): 0.5, (root, leaf): 1.5}
+    after = {(root, leaf): 0.25}
+
+    # Act
+    collapsed = collapsed_diff(before, after)
+
+    # Assert
+    columns = [line.split(" ")[-2:] for line in collapsed.splitlines()]
+    assert columns == [["500000", "0"], ["1500000", "250000"]], (
+        f"Test failed, actual columns = {columns}, but expected "
+        f"columns was = [['500000', '0'], ['1500000', '250000']]"
+    )
@@ -0,0 +1,123 @@
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from app.infrastructure.services.embedding_cache import CachedEmbedder
+from app.infrastructure.services.embedding_cache import EmbeddingCache
+from app.infrastructure.services.hashing_embedder import HashingEmbedder
+
+
+DIMENSION = 16
+
+
+class CountingEmbedder(HashingEmbedder):
+    def __init__(self) -> None:
+        super().__init__(dimension=DIMENSION)
+        self.calls: list[list[str]] = []
+
+    def embed_batch(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        self.calls.append(list(texts))
+        return super().embed_batch(texts)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> EmbeddingCache:
+    return EmbeddingCache(tmp_path, dimension=DIMENSION, initial_capacity=4)
+
+
+def test_vectors_survive_reopen(tmp_path: Path, cache: EmbeddingCache) -> None:
+    texts = [f"text {i}" for i in range(20)]
+    vectors = HashingEmbedder(DIMENSION).embed_batch(texts)
+
+    cache.put_many([cache.key(t) for t in texts], vectors)
+    cache.close()
+    reopened = EmbeddingCache(tmp_path, dimension=DIMENSION)
+    cached = reopened.get_many([reopened.key(t) for t in texts])
+
+    assert len(reopened) == len(texts)
+    np.testing.assert_array_equal(np.stack(cached), vectors)  # type: ignore[arg-type]
+
+
+def test_miss_returns_none(cache: EmbeddingCache) -> None:
+    assert cache.get_many([cache.key("missing")]) == [None]
+
+
+def test_entries_are_shared_between_instances(tmp_path: Path) -> None:
+    # Arrange: two handles on the same directory, as in two workers
+    writer = EmbeddingCache(tmp_path, dimension=DIMENSION, initial_capacity=4)
+    reader = EmbeddingCache(tmp_path, dimension=DIMENSION)
+    texts = [f"shared {i}" for i in range(10)]
+    vectors = HashingEmbedder(DIMENSION).embed_batch(texts)
+
+    # Act: the writer grows the index while the reader keeps the old mapping
+    writer.put_many([writer.key(t) for t in texts], vectors)
+    cached = reader.get_many([reader.key(t) for t in texts])
+
+    # Assert
+    np.testing.assert_array_equal(np.stack(cached), vectors)  # type: ignore[arg-type]
+
+
+@pytest.mark.usefixtures("cache")
+def test_dimension_mismatch_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="dimension"):
+        EmbeddingCache(tmp_path, dimension=DIMENSION * 2)
+
+
+def test_cached_embedder_computes_only_misses(cache: EmbeddingCache) -> None:
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(inner, cache)
+
+    first = embedder.embed_batch(["a", "b", "a"])
+    second = embedder.embed_batch(["b", "c"])
+
+    assert inner.calls == [["a", "b"], ["c"]], (
+        f"Test failed, actual calls = {inner.calls}, "
+        f"but expected calls was = {[['a', 'b'], ['c']]}"
+    )
+    np.testing.assert_array_equal(first[0], first[2])
+    np.testing.assert_array_equal(first[1], second[0])
+    np.testing.assert_array_equal(
+        second, HashingEmbedder(DIMENSION).embed_batch(["b", "c"])
+    )
+
+
+def test_namespace_separates_models(tmp_path: Path) -> None:
+    first = EmbeddingCache(tmp_path / "a", dimension=DIMENSION, namespace="m1")
+    second = EmbeddingCache(tmp_path / "b", dimension=DIMENSION, namespace="m2")
+
+    assert first.key("text") != second.key("text")
+
+
+def test_batch_larger_than_free_slots_grows_index(tmp_path: Path) -> None:
+    cache = EmbeddingCache(tmp_path, dimension=DIMENSION, initial_capacity=4)
+    texts = [f"text {i}" for i in range(5)]
+    vectors = HashingEmbedder(DIMENSION).embed_batch(texts)
+
+    cache.put_many([cache.key(t) for t in texts], vectors)
+
+    assert len(cache) == len(texts)
+    np.testing.assert_array_equal(
+        np.stack(cache.get_many([cache.key(t) for t in texts])),  # type: ignore[arg-type]
+        vectors,
+    )
+
+
+def test_torn_append_is_truncated(tmp_path: Path, cache: EmbeddingCache) -> None:
+    # Arrange: a crash left half a row at the end of the vectors file
+    embedder = HashingEmbedder(DIMENSION)
+    cache.put_many([cache.key("first")], embedder.embed_batch(["first"]))
+    with (tmp_path / "vectors.f32").open("ab") as file:
+        file.write(b"\x00" * (DIMENSION * 2))
+
+    # Act
+    cache.put_many([cache.key("second")], embedder.embed_batch(["second"]))
+    cached = cache.get_many([cache.key("first"), cache.key("second")])
+
+    # Assert
+    np.testing.assert_array_equal(
+        np.stack(cached),  # type: ignore[arg-type]
+        embedder.embed_batch(["first", "second"]),
+    )
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from app.infrastructure.services.hashing_embedder import HashingEmbedder
+
+
+@pytest.fixture
+def embedder() -> HashingEmbedder:
+    return HashingEmbedder(dimension=64)
+
+
+def test_embeddings_are_deterministic(embedder: HashingEmbedder) -> None:
+    first = embedder.embed_batch(["Hello world", "another text"])
+    second = HashingEmbedder(dimension=64).embed_batch(
+        ["Hello world", "another text"]
+    )
+
+    np.testing.assert_array_equal(first, second)
+
+
+def test_embeddings_are_normalized(embedder: HashingEmbedder) -> None:
+    vectors = embedder.embed_batch(["Hello world", "", "a b c"])
+
+    norms = np.linalg.norm(vectors, axis=1)
+    np.testing.assert_allclose(norms, [1.0, 0.0, 1.0], rtol=1e-6)
+    assert vectors.dtype == np.float32
+    assert vectors.shape == (3, 64)
+
+
+def test_similar_texts_are_closer(embedder: HashingEmbedder) -> None:
+    query, close, far = embedder.embed_batch(
+        ["search results", "search results page", "unrelated banana"]
+    )
+
+    assert float(query @ close) > float(query @ far)
@@ -0,0 +1,245 @@
+import zlib
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport
+from httpx import AsyncClient
+from starlette.types import Message
+
+from app.presentation.api.middlewares.compression import CompressionMiddleware
+from app.presentation.api.middlewares.compression import negotiate_encoding
+from app.utils.configs import CompressionConfig
+from tests.schemas.unit.presentation.api.middlewares.compression import (
+    CompressionEntity,
+    CompressionExpected,
+    NegotiateEntity,
+    NegotiateExpected,
+)
+
+
+LARGE_BODY = "document text " * 1000
+CHUNKS = ["first chunk " * 200, "second chunk " * 200, "tail"]
+
+
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            NegotiateEntity("gzip, br", ("zstd", "br", "gzip")),
+            NegotiateExpected(coding="br"),
+            id="server_order_breaks_ties",
+        ),
+        pytest.param(
+            NegotiateEntity("br;q=0.5, gzip;q=0.8", ("br", "gzip")),
+            NegotiateExpected(coding="gzip"),
+            id="client_q_wins",
+        ),
+        pytest.param(
+            NegotiateEntity("gzip;q=0", ("gzip",)),
+            NegotiateExpected(coding=None),
+            id="q_zero_refuses",
+        ),
+        pytest.param(
+            NegotiateEntity("*;q=0.1, gzip;q=0", ("zstd", "gzip")),
+            NegotiateExpected(coding="zstd"),
+            id="wildcard_covers_unlisted",
+        ),
+        pytest.param(
+            NegotiateEntity("deflate, identity", ("gzip",)),
+            NegotiateExpected(coding=None),
+            id="nothing_offered_accepted",
+        ),
+        pytest.param(
+            NegotiateEntity("GZIP ; Q=0.7", ("gzip",)),
+            NegotiateExpected(coding="gzip"),
+            id="case_insensitive",
+        ),
+    ],
+)
+def test_negotiate_encoding(
+    entity: NegotiateEntity, expected: NegotiateExpected
+) -> None:
+    # Act
+    actual = negotiate_encoding(entity.accept_encoding, entity.offered)
+
+    # Assert
+    assert actual == expected.coding, (
+        f"Test failed, actual coding = {actual}, "
+        f"but expected coding was = {expected.coding}"
+    )
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large() -> PlainTextResponse:
+        return PlainTextResponse(LARGE_BODY, headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    async def small() -> PlainTextResponse:
+        return PlainTextResponse("ok")
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[str]:
+            for chunk in CHUNKS:
+                yield chunk
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+EXPECTED_BODIES = {
+    "/large": LARGE_BODY,
+    "/small": "ok",
+    "/stream": "".join(CHUNKS),
+}
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            CompressionEntity(path="/large", accept_encoding="gzip"),
+            CompressionExpected(
+                content_encoding="gzip", vary="Accept-Encoding"
+            ),
+            id="large_body_gzipped",
+        ),
+        pytest.param(
+            CompressionEntity(
+                path="/large", accept_encoding="gzip", threadpool_threshold=0
+            ),
+            CompressionExpected(
+                content_encoding="gzip", vary="Accept-Encoding"
+            ),
+            id="large_body_gzipped_in_threadpool",
+        ),
+        pytest.param(
+            CompressionEntity(path="/small", accept_encoding="gzip"),
+            CompressionExpected(content_encoding=None, vary=None),
+            id="small_body_below_minimum_size",
+        ),
+        pytest.param(
+            CompressionEntity(path="/large", accept_encoding="identity"),
+            CompressionExpected(content_encoding=None, vary=None),
+            id="no_acceptable_coding",
+        ),
+        pytest.param(
+            CompressionEntity(path="/stream", accept_encoding="gzip"),
+            CompressionExpected(
+                content_encoding="gzip", vary="Accept-Encoding"
+            ),
+            id="stream_gzipped_incrementally",
+        ),
+    ],
+)
+async def test_compression_middleware(
+    entity: CompressionEntity,
+    expected: CompressionExpected,
+) -> None:
+    # Arrange
+    app = CompressionMiddleware(
+        _create_app(),
+        config=CompressionConfig(
+            encodings=["gzip"],
+            threadpool_threshold=entity.threadpool_threshold,
+        ),
+    )
+    headers = {"Accept-Encoding": entity.accept_encoding or ""}
+
+    # Act
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(entity.path, headers=headers)
+
+    # Assert
+    actual_encoding = response.headers.get("Content-Encoding")
+    assert actual_encoding == expected.content_encoding, (
+        f"Test failed, actual Content-Encoding = {actual_encoding}, "
+        f"but expected Content-Encoding was = {expected.content_encoding}"
+    )
+    actual_vary = response.headers.get("Vary")
+    assert actual_vary == expected.vary, (
+        f"Test failed, actual Vary = {actual_vary}, "
+        f"but expected Vary was = {expected.vary}"
+    )
+    assert response.text == EXPECTED_BODIES[entity.path], (
+        "Test failed, decoded body differs from the original body"
+    )
+
+
+@pytest.mark.anyio()
+async def test_compression_flushes_every_stream_chunk() -> None:
+    # Arrange
+    app = CompressionMiddleware(
+        _create_app(), config=CompressionConfig(encodings=["gzip"])
+    )
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip")],
+        "server": ("test", 80),
+    }
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    # Act
+    await app(scope, receive, send)
+
+    # Assert: each chunk decodes on arrival, before the stream is finished
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    decoded = [
+        decoder.decompress(message["body"]).decode()
+        for message in messages
+        if message["type"] == "http.response.body"
+    ]
+    # The last message carries only the gzip trailer
+    decoded_chunks = [chunk for chunk in decoded if chunk]
+    assert decoded_chunks == CHUNKS, (
+        f"Test failed, actual decoded chunks = {len(decoded_chunks)}, "
+        f"but expected decoded chunks was = {len(CHUNKS)}"
+    )
+    assert decoder.eof, "Test failed, gzip stream was not terminated"
+
+
+@pytest.mark.anyio()
+async def test_compression_weakens_strong_etag() -> None:
+    # Arrange
+    app = CompressionMiddleware(
+        _create_app(), config=CompressionConfig(encodings=["gzip"])
+    )
+
+    # Act
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(
+            "/large", headers={"Accept-Encoding": "gzip"}
+        )
+
+    # Assert
+    actual_etag = response.headers.get("ETag")
+    assert actual_etag == 'W/"v1"', (
+        f"Test failed, actual ETag = {actual_etag}, "
+        "but expected ETag was = W/\"v1\""
+    )
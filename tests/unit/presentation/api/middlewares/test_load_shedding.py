@@ -0,0 +1,168 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport
+from httpx import AsyncClient
+
+from app.presentation.api.middlewares.load_shedding import CoDelController
+from app.presentation.api.middlewares.load_shedding import (
+    LoadSheddingMiddleware,
+)
+from app.presentation.api.middlewares.priority import PriorityMiddleware
+from app.utils.configs import LoadSheddingConfig
+from app.utils.configs import PriorityConfig
+from app.utils.configs import RequestPriority
+from tests.schemas.unit.presentation.api.middlewares.load_shedding import (
+    CoDelEntity,
+    CoDelExpected,
+    SheddingEntity,
+    SheddingExpected,
+)
+
+TARGET = 0.005
+INTERVAL = 0.1
+
+
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            CoDelEntity(delays=[0.0, 0.0, 0.0], priority=RequestPriority.BATCH),
+            CoDelExpected(overloaded=False, queue_timeout=INTERVAL),
+            id="idle_queue",
+        ),
+        pytest.param(
+            CoDelEntity(
+                delays=[0.05, 0.05, 0.05], priority=RequestPriority.BATCH
+            ),
+            CoDelExpected(overloaded=True, queue_timeout=0.0),
+            id="standing_queue_sheds_batch",
+        ),
+        pytest.param(
+            CoDelEntity(
+                delays=[0.05, 0.05, 0.05], priority=RequestPriority.NORMAL
+            ),
+            CoDelExpected(overloaded=True, queue_timeout=TARGET),
+            id="standing_queue_shortens_normal",
+        ),
+        pytest.param(
+            CoDelEntity(
+                delays=[0.05, 0.05, 0.05],
+                priority=RequestPriority.INTERACTIVE,
+            ),
+            CoDelExpected(overloaded=True, queue_timeout=INTERVAL),
+            id="standing_queue_keeps_interactive",
+        ),
+        pytest.param(
+            CoDelEntity(
+                delays=[0.05, 0.0, 0.05], priority=RequestPriority.BATCH
+            ),
+            CoDelExpected(overloaded=False, queue_timeout=INTERVAL),
+            id="burst_drained_within_interval",
+        ),
+    ],
+)
+def test_codel_controller(entity: CoDelEntity, expected: CoDelExpected) -> None:
+    # Arrange
+    controller = CoDelController(target=TARGET, interval=INTERVAL)
+
+    # Act: two delays inside the first window, the last one after it
+    controller.observe(entity.delays[0], now=1.0)
+    controller.observe(entity.delays[1], now=1.0 + INTERVAL / 2)
+    controller.observe(entity.delays[2], now=1.0 + INTERVAL)
+
+    # Assert
+    assert controller.overloaded == expected.overloaded, (
+        f"Test failed, actual overloaded = {controller.overloaded}, "
+        f"but expected overloaded was = {expected.overloaded}"
+    )
+    actual_timeout = controller.queue_timeout(entity.priority)
+    assert actual_timeout == expected.queue_timeout, (
+        f"Test failed, actual timeout = {actual_timeout}, "
+        f"but expected timeout was = {expected.queue_timeout}"
+    )
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/bulk/export")
+    async def bulk_export() -> dict[str, str]:
+        await asyncio.sleep(0)
+        return {"status": "ok"}
+
+    @app.get("/v1/answer/generate")
+    async def generate() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            SheddingEntity(path="/bulk/export", overloaded=False),
+            SheddingExpected(status_code=200, retry_after=None),
+            id="batch_passes_without_overload",
+        ),
+        pytest.param(
+            SheddingEntity(path="/bulk/export", overloaded=True),
+            SheddingExpected(status_code=503, retry_after="1"),
+            id="batch_shed_on_overload",
+        ),
+        pytest.param(
+            SheddingEntity(path="/v1/answer/generate", overloaded=True),
+            SheddingExpected(status_code=200, retry_after=None),
+            id="interactive_served_on_overload",
+        ),
+    ],
+)
+async def test_load_shedding_middleware(
+    entity: SheddingEntity,
+    expected: SheddingExpected,
+) -> None:
+    # Arrange
+    middleware = LoadSheddingMiddleware(
+        _create_app(),
+        config=LoadSheddingConfig(
+            max_concurrency=1,
+            target=TARGET,
+            interval=INTERVAL,
+        ),
+    )
+    app = PriorityMiddleware(
+        middleware,
+        config=PriorityConfig(
+            routes={
+                "/bulk": RequestPriority.BATCH,
+                "/v1/answer/generate": RequestPriority.INTERACTIVE,
+            },
+        ),
+    )
+    middleware._controller.overloaded = entity.overloaded
+    if entity.overloaded:
+        # Occupy the only slot, so the request has to queue
+        await middleware._slots.acquire()
+        asyncio.get_running_loop().call_later(
+            TARGET, middleware._slots.release
+        )
+
+    # Act
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(entity.path)
+
+    # Assert
+    assert response.status_code == expected.status_code, (
+        f"Test failed, actual status = {response.status_code}, "
+        f"but expected status was = {expected.status_code}"
+    )
+    actual_retry_after = response.headers.get("Retry-After")
+    assert actual_retry_after == expected.retry_after, (
+        f"Test failed, actual Retry-After = {actual_retry_after}, "
+        f"but expected Retry-After was = {expected.retry_after}"
+    )
@@ -0,0 +1,112 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport
+from httpx import AsyncClient
+
+from app.core.constants import PRIORITY
+from app.core.priority import PriorityResolver
+from app.core.priority import current_priority
+from app.presentation.api.middlewares.priority import PriorityMiddleware
+from app.utils.configs import PriorityConfig
+from app.utils.configs import RequestPriority
+from tests.schemas.unit.presentation.api.middlewares.priority import (
+    ResolveEntity,
+)
+from tests.schemas.unit.presentation.api.middlewares.priority import (
+    ResolveExpected,
+)
+
+
+ROUTES = {
+    "/v1": RequestPriority.NORMAL,
+    "/v1/answer": RequestPriority.INTERACTIVE,
+    "/bulk": RequestPriority.BATCH,
+}
+
+
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            ResolveEntity(path="/v1/answer/generate"),
+            ResolveExpected(priority=RequestPriority.INTERACTIVE),
+            id="longest_prefix_wins",
+        ),
+        pytest.param(
+            ResolveEntity(path="/v1/other"),
+            ResolveExpected(priority=RequestPriority.NORMAL),
+            id="broad_prefix",
+        ),
+        pytest.param(
+            ResolveEntity(path="/unknown"),
+            ResolveExpected(priority=RequestPriority.NORMAL),
+            id="default_without_route",
+        ),
+        pytest.param(
+            ResolveEntity(path="/v1/answer/generate", header="batch"),
+            ResolveExpected(priority=RequestPriority.BATCH),
+            id="header_lowers_route",
+        ),
+        pytest.param(
+            ResolveEntity(path="/bulk/export", header=" Interactive "),
+            ResolveExpected(priority=RequestPriority.BATCH),
+            id="header_cannot_raise_route",
+        ),
+        pytest.param(
+            ResolveEntity(path="/v1/answer/generate", header="urgent"),
+            ResolveExpected(priority=RequestPriority.INTERACTIVE),
+            id="invalid_header_ignored",
+        ),
+        pytest.param(
+            ResolveEntity(
+                path="/v1/answer/generate",
+                header="batch",
+                header_enabled=False,
+            ),
+            ResolveExpected(priority=RequestPriority.INTERACTIVE),
+            id="header_disabled",
+        ),
+    ],
+)
+def test_priority_resolver(
+    entity: ResolveEntity, expected: ResolveExpected
+) -> None:
+    # Arrange
+    resolver = PriorityResolver(
+        PriorityConfig(routes=ROUTES, header_enabled=entity.header_enabled)
+    )
+
+    # Act
+    actual = resolver.resolve(entity.path, entity.header)
+
+    # Assert
+    assert actual == expected.priority, (
+        f"Test failed, actual priority = {actual}, "
+        f"but expected priority was = {expected.priority}"
+    )
+
+
+@pytest.mark.anyio()
+async def test_priority_middleware_sets_context() -> None:
+    # Arrange
+    app = FastAPI()
+
+    @app.get("/v1/answer/generate")
+    async def generate() -> dict[str, str]:
+        return {"priority": current_priority.get()}
+
+    middleware = PriorityMiddleware(app, config=PriorityConfig(routes=ROUTES))
+
+    # Act
+    async with AsyncClient(
+        transport=ASGITransport(app=middleware), base_url="http://test"
+    ) as client:
+        routed = await client.get("/v1/answer/generate")
+        lowered = await client.get(
+            "/v1/answer/generate", headers={PRIORITY: "batch"}
+        )
+
+    # Assert
+    assert routed.json() == {"priority": "interactive"}
+    assert lowered.json() == {"priority": "batch"}
+    assert current_priority.get() == RequestPriority.NORMAL
@@ -0,0 +1,145 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport
+from httpx import AsyncClient
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from app.presentation.api.middlewares.probes import ProbeMiddleware
+from app.utils.configs import ProbesConfig
+from tests.schemas.unit.presentation.api.middlewares.probes import (
+    ProbeEntity,
+    ProbeExpected,
+)
+
+
+def _create_app(calls: list[str]) -> ASGIApp:
+    app = FastAPI()
+
+    @app.get("/common/healthcheck")
+    async def healthcheck() -> dict[str, str]:
+        return {"source": "app"}
+
+    @app.get("/v1/search")
+    async def search() -> dict[str, str]:
+        return {"source": "app"}
+
+    async def recording_app(scope: Scope, receive: Receive, send: Send) -> None:
+        calls.append(scope["path"])
+        await app(scope, receive, send)
+
+    return recording_app
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            ProbeEntity(path="/common/healthcheck"),
+            ProbeExpected(status_code=200, body=b"{}", reached_app=False),
+            id="liveness_answered_outside_app",
+        ),
+        pytest.param(
+            ProbeEntity(path="/common/healthcheck", method="HEAD"),
+            ProbeExpected(status_code=200, body=b"", reached_app=False),
+            id="liveness_head_without_body",
+        ),
+        pytest.param(
+            ProbeEntity(path="/common/readiness"),
+            ProbeExpected(status_code=200, body=b"{}", reached_app=False),
+            id="ready",
+        ),
+        pytest.param(
+            ProbeEntity(path="/common/readiness", ready=False),
+            ProbeExpected(
+                status_code=503,
+                body=b'{"status":"starting"}',
+                reached_app=False,
+            ),
+            id="not_ready",
+        ),
+        pytest.param(
+            ProbeEntity(path="/common/metrics"),
+            ProbeExpected(status_code=200, body=None, reached_app=False),
+            id="metrics_answered_outside_app",
+        ),
+        pytest.param(
+            ProbeEntity(path="/v1/search"),
+            ProbeExpected(
+                status_code=200, body=b'{"source":"app"}', reached_app=True
+            ),
+            id="other_routes_pass_through",
+        ),
+        pytest.param(
+            ProbeEntity(path="/common/healthcheck", method="POST"),
+            ProbeExpected(status_code=405, body=None, reached_app=True),
+            id="other_methods_pass_through",
+        ),
+    ],
+)
+async def test_probe_middleware(
+    entity: ProbeEntity,
+    expected: ProbeExpected,
+) -> None:
+    # Arrange
+    calls: list[str] = []
+    app = ProbeMiddleware(_create_app(calls), config=ProbesConfig())
+    app.ready = entity.ready
+
+    # Act
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.request(entity.method, entity.path)
+
+    # Assert
+    assert response.status_code == expected.status_code, (
+        f"Test failed, actual status = {response.status_code}, "
+        f"but expected status was = {expected.status_code}"
+    )
+    if expected.body is not None:
+        assert response.content == expected.body, (
+            f"Test failed, actual body = {response.content!r}, "
+            f"but expected body was = {expected.body!r}"
+        )
+    actual_reached_app = bool(calls)
+    assert actual_reached_app == expected.reached_app, (
+        f"Test failed, actual reached app = {actual_reached_app}, "
+        f"but expected reached app was = {expected.reached_app}"
+    )
+
+
+@pytest.mark.anyio()
+async def test_probe_middleware_tracks_lifespan() -> None:
+    # Arrange
+    app = ProbeMiddleware(FastAPI(), config=ProbesConfig())
+    events = iter([
+        {"type": "lifespan.startup"},
+        {"type": "lifespan.shutdown"},
+    ])
+    readiness: list[bool] = []
+
+    async def receive() -> Message:
+        readiness.append(app.ready)
+        return next(events)
+
+    async def send(message: Message) -> None:
+        readiness.append(app.ready)
+
+    # Act
+    await app({"type": "lifespan", "asgi": {"version": "3.0"}}, receive, send)
+
+    # Assert: not ready before startup, ready after it, not ready on shutdown
+    assert readiness[0] is False, (
+        "Test failed, application was ready before startup"
+    )
+    assert True in readiness, (
+        "Test failed, application never became ready after startup"
+    )
+    assert app.ready is False, (
+        "Test failed, application stayed ready during shutdown"
+    )
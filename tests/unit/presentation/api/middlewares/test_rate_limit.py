@@ -0,0 +1,170 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport
+from httpx import AsyncClient
+from pydantic import ValidationError
+
+from app.core.constants import USER_ID
+from app.presentation.api.middlewares.rate_limit import RateLimitMiddleware
+from app.presentation.api.middlewares.rate_limit import TokenBucketLimiter
+from app.utils.configs import RateLimit
+from app.utils.configs import RateLimitConfig
+from tests.schemas.unit.presentation.api.middlewares.rate_limit import (
+    RateLimitEntity,
+)
+from tests.schemas.unit.presentation.api.middlewares.rate_limit import (
+    RateLimitExpected,
+)
+from tests.schemas.unit.presentation.api.middlewares.rate_limit import (
+    TokenBucketEntity,
+)
+from tests.schemas.unit.presentation.api.middlewares.rate_limit import (
+    TokenBucketExpected,
+)
+
+
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            TokenBucketEntity(rate=1.0, burst=2, requests_at=[0.0, 0.0, 0.0]),
+            TokenBucketExpected(allowed=[True, True, False]),
+            id="burst_exhausted",
+        ),
+        pytest.param(
+            TokenBucketEntity(rate=1.0, burst=2, requests_at=[0.0, 0.0, 1.0]),
+            TokenBucketExpected(allowed=[True, True, True]),
+            id="lazy_refill",
+        ),
+        pytest.param(
+            TokenBucketEntity(
+                rate=10.0, burst=1, requests_at=[0.0, 0.05, 0.1]
+            ),
+            TokenBucketExpected(allowed=[True, False, True]),
+            id="steady_rate",
+        ),
+    ],
+)
+def test_token_bucket(
+    entity: TokenBucketEntity, expected: TokenBucketExpected
+) -> None:
+    # Arrange
+    limiter = TokenBucketLimiter(
+        RateLimit(rate=entity.rate, burst=entity.burst), max_buckets=16
+    )
+
+    # Act
+    actual = [not limiter.acquire("tenant", now) for now in entity.requests_at]
+
+    # Assert
+    assert actual == expected.allowed, (
+        f"Test failed, actual allowed = {actual}, "
+        f"but expected allowed was = {expected.allowed}"
+    )
+
+
+def test_idle_buckets_evicted() -> None:
+    # Arrange: a bucket is idle after burst / rate = 2 seconds
+    limiter = TokenBucketLimiter(RateLimit(rate=1.0, burst=2), max_buckets=16)
+    limiter.acquire("idle", now=0.0)
+    limiter.acquire("active", now=0.0)
+
+    # Act
+    limiter.acquire("active", now=1.0)
+    limiter.acquire("active", now=2.5)
+
+    # Assert
+    assert len(limiter) == 1, (
+        f"Test failed, actual buckets = {len(limiter)}, "
+        f"but expected buckets was = 1"
+    )
+
+
+def test_unknown_keys_fall_back_when_full() -> None:
+    # Arrange
+    limiter = TokenBucketLimiter(RateLimit(rate=0.01, burst=2), max_buckets=2)
+    limiter.acquire("alice", now=0.0)
+
+    # Act: every request comes with a fresh ID from the same address
+    allowed = [
+        not limiter.acquire(f"rotating-{i}", now=0.0, fallback_key="addr:1")
+        for i in range(5)
+    ]
+
+    # Assert
+    assert allowed == [True, True, True, False, False], (
+        f"Test failed, actual allowed = {allowed}, "
+        f"but expected allowed was = {[True, True, True, False, False]}"
+    )
+    assert len(limiter) == 2
+
+
+@pytest.mark.parametrize(
+    ("rate", "burst"),
+    [
+        pytest.param(0.0, 1, id="zero_rate"),
+        pytest.param(1.0, 0, id="zero_burst"),
+    ],
+)
+def test_non_positive_limit_rejected(rate: float, burst: int) -> None:
+    with pytest.raises(ValidationError):
+        RateLimit(rate=rate, burst=burst)
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/v1/answer/generate")
+    async def generate() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            RateLimitEntity(user_ids=["alice", "alice", "alice"]),
+            RateLimitExpected(status_codes=[200, 200, 429]),
+            id="single_tenant_limited",
+        ),
+        pytest.param(
+            RateLimitEntity(user_ids=["alice", "alice", "bob"]),
+            RateLimitExpected(status_codes=[200, 200, 200]),
+            id="tenants_isolated",
+        ),
+    ],
+)
+async def test_rate_limit_middleware(
+    entity: RateLimitEntity,
+    expected: RateLimitExpected,
+) -> None:
+    # Arrange
+    app = RateLimitMiddleware(
+        _create_app(),
+        config=RateLimitConfig(
+            routes={"/v1/answer": RateLimit(rate=0.01, burst=2)},
+        ),
+    )
+
+    # Act
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        responses = [
+            await client.get("/v1/answer/generate", headers={USER_ID: user})
+            for user in entity.user_ids
+        ]
+
+    # Assert
+    actual = [response.status_code for response in responses]
+    assert actual == expected.status_codes, (
+        f"Test failed, actual statuses = {actual}, "
+        f"but expected statuses were = {expected.status_codes}"
+    )
+    for response in responses:
+        if response.status_code == 429:
+            assert response.headers["Retry-After"] == "100"
+            assert response.json()["reason"] == "RATE_LIMITED"
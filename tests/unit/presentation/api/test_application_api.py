@@ -0,0 +1,52 @@
+import pytest
+from fastapi import APIRouter
+from fastapi import FastAPI
+from pydantic import SecretStr
+
+from app.presentation.api.application_api import add_admin_endpoints
+from app.utils.configs import AdminConfig
+from tests.schemas.unit.presentation.api.application_api import (
+    AdminMountEntity,
+    AdminMountExpected,
+)
+
+
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            AdminMountEntity(enabled=False, token="secret"),  # noqa: S106
+            AdminMountExpected(mounted=False),
+            id="disabled",
+        ),
+        pytest.param(
+            AdminMountEntity(enabled=True, token=""),
+            AdminMountExpected(mounted=False),
+            id="enabled_without_token",
+        ),
+        pytest.param(
+            AdminMountEntity(enabled=True, token="secret"),  # noqa: S106
+            AdminMountExpected(mounted=True),
+            id="enabled_with_token",
+        ),
+    ],
+)
+def test_admin_endpoints_mounted_only_when_enabled(
+    entity: AdminMountEntity,
+    expected: AdminMountExpected,
+) -> None:
+    # Arrange
+    router = APIRouter()
+    config = AdminConfig(enabled=entity.enabled, token=SecretStr(entity.token))
+
+    # Act
+    add_admin_endpoints(router, admin_config=config)
+
+    # Assert
+    app = FastAPI()
+    app.include_router(router)
+    mounted = any(path.startswith("/admin") for path in app.openapi()["paths"])
+    assert mounted == expected.mounted, (
+        f"Test failed, actual mounted = {mounted}, "
+        f"but expected mounted was = {expected.mounted}"
+    )
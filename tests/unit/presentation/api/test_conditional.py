@@ -0,0 +1,50 @@
+import pytest
+
+from app.presentation.api.conditional import etag_matches
+from tests.schemas.unit.presentation.api.conditional import (
+    EtagMatchEntity,
+    EtagMatchExpected,
+)
+
+
+@pytest.mark.parametrize(
+    ("entity", "expected"),
+    [
+        pytest.param(
+            EtagMatchEntity(if_none_match='"1-ab"', etag='"1-ab"'),
+            EtagMatchExpected(matches=True),
+            id="same_tag",
+        ),
+        pytest.param(
+            EtagMatchEntity(if_none_match='W/"1-ab"', etag='"1-ab"'),
+            EtagMatchExpected(matches=True),
+            id="weak_tag_from_compressed_response",
+        ),
+        pytest.param(
+            EtagMatchEntity(if_none_match='"0-ab", "1-ab"', etag='"1-ab"'),
+            EtagMatchExpected(matches=True),
+            id="tag_in_list",
+        ),
+        pytest.param(
+            EtagMatchEntity(if_none_match="*", etag='"1-ab"'),
+            EtagMatchExpected(matches=True),
+            id="wildcard",
+        ),
+        pytest.param(
+            EtagMatchEntity(if_none_match='"0-ab"', etag='"1-ab"'),
+            EtagMatchExpected(matches=False),
+            id="stale_generation",
+        ),
+    ],
+)
+def test_etag_matches(
+    entity: EtagMatchEntity, expected: EtagMatchExpected
+) -> None:
+    # Act
+    actual = etag_matches(entity.if_none_match, entity.etag)
+
+    # Assert
+    assert actual == expected.matches, (
+        f"Test failed, actual matches = {actual}, "
+        f"but expected matches was = {expected.matches}"
+    )
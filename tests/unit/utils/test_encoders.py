@@ -0,0 +1,238 @@
+import datetime as dt
+from dataclasses import dataclass
+
+import orjson
+import pytest
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import SecretStr
+
+from app.core.exceptions import ProblemDetail
+from app.domain.entities.document import Document
+from app.domain.entities.search_result import SearchResult
+from app.presentation.api.schemas import search as schemas
+
+# Registers domain entities of the search response
+from app.presentation.api.v1.endpoints import search  # noqa: F401
+from app.utils.encoders import EncoderRegistry
+from app.utils.encoders import compile_entity_encoder
+from app.utils.serializer import AdvORJSONResponse
+
+
+class Inner(BaseModel):
+    value: int
+
+
+class Outer(BaseModel):
+    name: str = Field(serialization_alias="title")
+    inner: Inner
+    tags: set[str]
+    created: dt.date
+    hidden: str = Field(default="secret", exclude=True)
+
+
+@dataclass
+class Row:
+    id: int
+    payload: Outer
+
+
+class Credentials(BaseModel):
+    token: SecretStr
+    blob: bytes
+    ttl: dt.timedelta
+    issued: dt.datetime
+
+
+class Note(BaseModel):
+    text: str
+    author: str | None = None
+
+
+class Thread(BaseModel):
+    title: str | None = None
+    notes: list[Note]
+
+
+def test_model_encoder_matches_model_dump() -> None:
+    # Arrange
+    model = Outer(
+        name="n",
+        inner=Inner(value=1),
+        tags={"a"},
+        created=dt.date(2024, 1, 2),
+    )
+
+    # Act
+    actual = orjson.loads(EncoderRegistry().dumps({"model": model}))
+
+    # Assert
+    expected = {"model": model.model_dump(mode="json", by_alias=True)}
+    assert actual == expected, (
+        f"Test failed, actual json = {actual}, "
+        f"but expected json was = {expected}"
+    )
+
+
+def test_non_native_fields_match_model_dump() -> None:
+    # Arrange
+    model = Credentials(
+        token=SecretStr("hunter2"),
+        blob=b"blob",
+        ttl=dt.timedelta(minutes=5),
+        issued=dt.datetime(2024, 1, 2, tzinfo=dt.UTC),
+    )
+
+    # Act
+    actual = orjson.loads(EncoderRegistry().dumps(model))
+
+    # Assert
+    expected = orjson.loads(model.model_dump_json(by_alias=True))
+    assert actual == expected, (
+        f"Test failed, actual json = {actual}, "
+        f"but expected json was = {expected}"
+    )
+    assert "hunter2" not in str(actual), (
+        f"Test failed, actual json = {actual} leaks the secret"
+    )
+
+
+def test_exclude_none_applies_to_nested_models() -> None:
+    # Arrange
+    registry = EncoderRegistry()
+    registry.register_model(Thread, exclude_none=True)
+    thread = Thread(notes=[Note(text="a"), Note(text="b", author="x")])
+
+    # Act
+    actual = orjson.loads(registry.dumps(thread))
+
+    # Assert
+    expected = {"notes": [{"text": "a"}, {"text": "b", "author": "x"}]}
+    assert actual == expected, (
+        f"Test failed, actual json = {actual}, "
+        f"but expected json was = {expected}"
+    )
+
+
+def test_encoder_is_compiled_once_per_type() -> None:
+    registry = EncoderRegistry()
+    rows = [
+        Row(
+            id=i,
+            payload=Outer(
+                name="n",
+                inner=Inner(value=i),
+                tags=set(),
+                created=dt.date.min,
+            ),
+        )
+        for i in range(3)
+    ]
+
+    registry.dumps(rows)
+
+    assert set(registry._encoders) >= {Row, Outer, Inner}  # noqa: SLF001
+
+
+def test_problem_detail_excludes_none_by_alias() -> None:
+    problem = ProblemDetail(
+        title="t",
+        status=503,
+        reason="R",
+        detail=None,
+        instance="/v1/answer/generate",
+        trace_id="x",
+        invalid_params=None,
+    )
+
+    actual = orjson.loads(AdvORJSONResponse(problem).body)
+
+    assert actual == problem.model_dump(
+        mode="json", by_alias=True, exclude_none=True
+    )
+    assert "type" in actual
+
+
+def test_fast_path_matches_pydantic_response() -> None:
+    # Arrange
+    result = SearchResult(
+        documents=[
+            Document(text="a", metadata={"source": "mock"}),
+            Document(text="b"),
+        ],
+        partial=True,
+    )
+    reference = schemas.SearchResponse(
+        documents=[
+            schemas.Document(text=doc.text, metadata=doc.metadata)
+            for doc in result.documents
+        ],
+        partial=result.partial,
+    )
+
+    # Act
+    actual = AdvORJSONResponse({"hello": result}).body
+
+    # Assert
+    expected = {"hello": reference.model_dump(mode="json", by_alias=True)}
+    assert orjson.loads(actual) == expected, (
+        f"Test failed, actual body = {actual!r}, "
+        f"but expected body was = {expected}"
+    )
+
+
+def test_entity_missing_schema_field_is_rejected() -> None:
+    @dataclass
+    class Partial:
+        documents: list[Document]
+
+    with pytest.raises(TypeError, match="partial"):
+        compile_entity_encoder(Partial, schemas.SearchResponse)
+
+
+@pytest.mark.parametrize(
+    ("kind", "structured"),
+    [
+        pytest.param(Outer, True, id="model"),
+        pytest.param(Row, True, id="dataclass"),
+        pytest.param(dt.date, False, id="orjson_native"),
+        pytest.param(object, False, id="fallback"),
+    ],
+)
+def test_structured_types(kind: type, *, structured: bool) -> None:
+    registry = EncoderRegistry()
+
+    actual = registry.structured(kind) is not None
+
+    assert actual == structured, (
+        f"Test failed, actual structured = {actual}, "
+        f"but expected structured was = {structured}"
+    )
+
+
+def test_registration_resets_structured_cache() -> None:
+    # Arrange
+    class Money:
+        def __init__(self, cents: int) -> None:
+            self.cents = cents
+
+    registry = EncoderRegistry()
+    before = registry.structured(Money)
+
+    # Act
+    registry.register(Money, lambda money: {"amount": money.cents / 100})
+
+    # Assert
+    encoder = registry.structured(Money)
+    assert before is None, (
+        f"Test failed, actual encoder = {before}, but expected encoder was = None"
+    )
+    assert encoder is not None, (
+        "Test failed, actual encoder = None, "
+        "but expected the registered encoder"
+    )
+    actual = encoder(Money(150))
+    assert actual == {"amount": 1.5}, (
+        f"Test failed, actual json = {actual}, "
+        f"but expected json was = {{'amount': 1.5}}"
+    )
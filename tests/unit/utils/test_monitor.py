@@ -0,0 +1,21 @@
+import pytest
+
+from app.utils.monitor import monitor
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        pytest.param({"log_every": 0}, id="log_every_zero"),
+        pytest.param({"log_every": -1}, id="log_every_negative"),
+        pytest.param({"log_slower_than": 0.0}, id="log_slower_than_zero"),
+        pytest.param({"log_max_bytes": 0}, id="log_max_bytes_zero"),
+    ],
+)
+def test_monitor_rejects_non_positive_overrides(
+    overrides: dict[str, float],
+) -> None:
+    name = next(iter(overrides))
+
+    with pytest.raises(ValueError, match=name):
+        monitor("TEST_EVENT", **overrides)  # type: ignore[arg-type]
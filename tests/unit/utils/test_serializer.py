@@ -1,11 +1,16 @@
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+import orjson
 import pytest
 from pydantic import BaseModel
 
+from app.domain.entities.document import Document
 from app.utils.configs import SerializationConfig
+from app.utils.encoders import EncoderRegistry
 from app.utils.serializer import ItemSerializer
+from app.utils.serializer import RawJSON
 
 
 # --- Test Schemas ---
@@ -216,3 +221,188 @@ def test_reset_stats(serializer: ItemSerializer) -> None:
         f"Stats should be reset. "
         f"stats={stats}"
     )
+
+
+@pytest.mark.parametrize(
+    ("obj", "max_bytes", "expected", "expected_used"),
+    [
+        pytest.param(
+            {"key": "value"}, 64, {"key": "value"}, 15, id="within_budget"
+        ),
+        pytest.param(
+            {"key": "value"},
+            8,
+            {"key": "...<truncated, 5 chars>"},
+            33,
+            id="over_budget",
+        ),
+        pytest.param(
+            SampleModel(name="Ada", age=36),
+            64,
+            {"name": "Ada", "age": 36},
+            23,
+            id="model_within_budget",
+        ),
+    ],
+)
+def test_serialize_bounded(
+    serializer: ItemSerializer,
+    obj: Any,
+    max_bytes: int,
+    expected: Any,
+    expected_used: int,
+) -> None:
+    result, used = serializer.serialize_bounded(obj, max_bytes)
+
+    assert result == expected, (
+        f"Bounded serialization failed. expected={expected}, actual={result}"
+    )
+    assert used == expected_used, (
+        f"Budget usage mismatch. expected={expected_used}, actual={used}"
+    )
+
+
+@pytest.mark.parametrize(
+    ("obj", "max_bytes", "expected"),
+    [
+        pytest.param(
+            {"key": "value"}, 64, b'{"key":"value"}', id="within_budget"
+        ),
+        pytest.param(
+            {"key": "value"},
+            8,
+            b'{"key":"...<truncated, 5 chars>"}',
+            id="over_budget",
+        ),
+        pytest.param(
+            {"nested": RawJSON(b"[1,2]")},
+            64,
+            b'{"nested":[1,2]}',
+            id="raw_json_embedded",
+        ),
+    ],
+)
+def test_encode_bounded(
+    serializer: ItemSerializer,
+    obj: Any,
+    max_bytes: int,
+    expected: bytes,
+) -> None:
+    result = serializer.encode_bounded(obj, max_bytes)
+
+    assert result.data == expected, (
+        f"Bounded encoding failed. expected={expected!r}, "
+        f"actual={result.data!r}"
+    )
+
+
+@pytest.mark.parametrize(
+    ("obj", "max_bytes", "expected"),
+    [
+        pytest.param(
+            "abcdefgh", 64, b'"abcde...<truncated, 8 chars>"', id="long_string"
+        ),
+        pytest.param(
+            [1, 2, 3, 4], 64, b'[1,2,"...<2 more items>"]', id="long_list"
+        ),
+        pytest.param(
+            {"a": 1, "b": 2, "c": 3},
+            64,
+            b'{"a":1,"b":2,"...":"<1 more items>"}',
+            id="long_dict",
+        ),
+        pytest.param(
+            [["abc", "def"], ["ghi"]],
+            12,
+            b'[["abc","de...<truncated, 3 chars>"],"...<truncated>"]',
+            id="budget_spent_in_nested_list",
+        ),
+        pytest.param(
+            SampleModel(name="Ada", age=36),
+            64,
+            b'{"name":"Ada","age":36}',
+            id="model_fields",
+        ),
+        pytest.param(np.arange(2), 64, b"[0,1]", id="small_array"),
+        pytest.param(
+            # A read-only view: 10M items without allocating them
+            np.broadcast_to(np.int64(7), (10_000_000,)),
+            64,
+            b'[7,7,"...<9999998 more items>"]',
+            id="long_array_walked_like_list",
+        ),
+        pytest.param(
+            np.arange(6).reshape(3, 2),
+            64,
+            b'[[0,1],[2,3],"...<1 more items>"]',
+            id="long_matrix",
+        ),
+    ],
+)
+def test_encode_bounded_limits(
+    obj: Any,
+    max_bytes: int,
+    expected: bytes,
+) -> None:
+    serializer = ItemSerializer(SerializationConfig(max_string=5, max_items=2))
+
+    result = serializer.encode_bounded(obj, max_bytes)
+
+    assert result.data == expected, (
+        f"Bounded encoding failed. expected={expected!r}, "
+        f"actual={result.data!r}"
+    )
+
+
+def test_encode_bounded_cycle(serializer: ItemSerializer) -> None:
+    cyclic: list[Any] = [1]
+    cyclic.append(cyclic)
+
+    result = serializer.encode_bounded(cyclic, 64)
+
+    assert result.data == b'[1,"<cycle>"]', (
+        f"Cycle should be replaced by a marker. actual={result.data!r}"
+    )
+
+
+class Secret:
+    def __init__(self, token: str) -> None:
+        self.token = token
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        pytest.param(Secret("t0ken"), id="object"),
+        pytest.param({"nested": [Secret("t0ken")]}, id="nested"),
+    ],
+)
+def test_registered_encoder_is_used(obj: Any) -> None:
+    registry = EncoderRegistry()
+    registry.register(Secret, lambda _: "<secret>")
+    serializer = ItemSerializer(encoders=registry)
+
+    serialized = orjson.dumps(serializer.serialize(obj))
+    encoded = serializer.encode_bounded(obj, 4096).data
+
+    assert b"t0ken" not in serialized, (
+        f"Registered encoder should hide the token. actual={serialized!r}"
+    )
+    assert b"t0ken" not in encoded, (
+        f"Registered encoder should hide the token. actual={encoded!r}"
+    )
+    assert b"<secret>" in encoded, (
+        f"Registered encoder output expected. actual={encoded!r}"
+    )
+
+
+def test_document_metadata_is_an_object(serializer: ItemSerializer) -> None:
+    document = Document(text="a", metadata={"source": "mock"})
+
+    result = serializer.serialize({"document": document})
+
+    expected = {"document": {"text": "a", "metadata": {"source": "mock"}}}
+    assert result == expected, (
+        f"Document should serialize field by field. "
+        f"expected={expected}, actual={result}"
+    )